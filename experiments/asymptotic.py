@@ -1,107 +1,132 @@
-"""Asymptotic timing study for the minimum enclosing ball solver.
+"""Asymptotic scaling study for the minimum enclosing ball solvers.
 
-This script measures average runtime for randomly generated inputs of
-increasing size and plots the observed scaling against an O(n) baseline.
+For every instance family in :mod:`experiments.instances` (easy and hard) and
+every solver entry point, this script measures wall time, iteration count and
+peak traced memory for inputs of increasing size, and plots the three against
+``n`` with an O(n) reference line.  Gaussian clouds alone hide worst-case
+behaviour, because only a handful of points end up on the boundary.
+
+Instances are streamed to ``.npy`` files under ``--cache`` and memory-mapped
+back, so the largest sizes never have to be generated in memory.
+
+Run with::
+
+    uv run python -m experiments.asymptotic --max-exponent 16 --cache _instances
 """
 
-import time
-from collections.abc import Callable
+import argparse
+from pathlib import Path
 
 import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from cvxball.solver import min_circle_cvx
+from experiments.benchmark import SOLVERS, measure
+from experiments.instances import FAMILIES, write_npy
 
+Study = dict[tuple[str, str], dict[str, list[float]]]
 
-def cvx(n: int) -> float:
-    """Solve a random instance with ``n`` points and return the radius.
 
-    Args:
-        n: Number of points to generate in 5 dimensions.
-
-    Returns:
-        The optimal radius produced by the convex solver.
-    """
-    points = np.random.rand(n, 5)
-    return min_circle_cvx(points, solver="CLARABEL")
+def run_analysis(
+    sizes: list[int],
+    d: int = 5,
+    families: tuple[str, ...] = tuple(FAMILIES),
+    solvers: tuple[str, ...] = tuple(SOLVERS),
+    cache: Path = Path("_instances"),
+    num_trials: int = 3,
+) -> Study:
+    """Measure every ``(family, solver)`` pair on a sequence of problem sizes.
 
-
-def measure_execution_time(func: Callable[[int], float], n: int, num_trials: int = 3) -> float:
-    """Run multiple trials and return average execution time."""
-    times = []
-    for _ in range(num_trials):
-        start = time.time()
-        func(n)
-        times.append(time.time() - start)
-    return np.mean(times)
-
-
-def run_analysis() -> tuple[list[int], list[float]]:
-    """Measure average execution time for a sequence of problem sizes.
+    Args:
+        sizes: Numbers of points ``n``.
+        d: Dimension of every instance.
+        families: Instance families to study.
+        solvers: Entry points from :data:`experiments.benchmark.SOLVERS`.
+        cache: Directory the instances are streamed to; existing files are reused.
+        num_trials: Timed runs per case; the median is reported.
 
     Returns:
-        A tuple ``(sizes, times)`` with sizes as integers and times in seconds.
+        A mapping from ``(family, solver)`` to lists of ``time``, ``iterations``
+        and ``peak_mib`` aligned with ``sizes``.
     """
-    # Test for different values of n (powers of 2)
-    sequence = np.array([2**n for n in range(4, 20)])
-    execution_times = []
-
-    for n in sequence:
-        avg_time = measure_execution_time(cvx, int(n))
-        execution_times.append(avg_time)
-        print(f"n={n}: {avg_time:.4f} seconds")
-
-    return sequence, execution_times
-
-
-def plot_results(sizes: list[int], times: list[float]) -> None:
-    """Plot measured execution times and an O(n) reference line.
+    study: Study = {}
+    for family in families:
+        for n in sizes:
+            path = cache / f"{family}-n{n}-d{d}-seed0.npy"
+            if not path.exists():
+                write_npy(path, family, n, d, seed=0)
+            points = np.load(path, mmap_mode="r")
+            for solver in solvers:
+                record = measure(SOLVERS[solver], points, num_trials)
+                series = study.setdefault((family, solver), {"time": [], "iterations": [], "peak_mib": []})
+                series["time"].append(record["median_s"])
+                series["iterations"].append(record["iterations"] or np.nan)
+                series["peak_mib"].append(record["peak_bytes"] / 2**20)
+                print(
+                    f"{family:>18} {solver:>20} n={n:<8} {record['median_s']:.4f} s  "
+                    f"iters={record['iterations']}  peak={record['peak_bytes'] / 2**20:.1f} MiB"
+                )
+    return study
+
+
+def plot_results(sizes: list[int], study: Study) -> None:
+    """Plot time, iterations and peak memory against ``n`` for every family and solver.
 
     Args:
         sizes: Problem sizes used in the experiments.
-        times: Averaged runtimes corresponding to each size.
+        study: Output of :func:`run_analysis`.
     """
-    # Create figure
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
-
-    # Add actual execution times
-    fig.add_trace(
-        go.Scatter(
-            x=sizes, y=times, name="Actual Time", mode="lines+markers", line={"color": "blue"}, marker={"size": 8}
-        )
-    )
-
-    # Add theoretical O(n) complexity line
+    metrics = [("time", "Execution Time (s)"), ("iterations", "Iterations"), ("peak_mib", "Peak traced memory (MiB)")]
+    fig = make_subplots(rows=len(metrics), cols=1, shared_xaxes=True, subplot_titles=[t for _, t in metrics])
+
+    dashes = ["solid", "dash", "dot", "dashdot"]
+    solvers = sorted({solver for _, solver in study})
+    for (family, solver), series in study.items():
+        for row, (metric, _) in enumerate(metrics, start=1):
+            fig.add_trace(
+                go.Scatter(
+                    x=sizes,
+                    y=series[metric],
+                    name=f"{family} / {solver}",
+                    legendgroup=f"{family} / {solver}",
+                    showlegend=row == 1,
+                    mode="lines+markers",
+                    line={"dash": dashes[solvers.index(solver) % len(dashes)]},
+                ),
+                row=row,
+                col=1,
+            )
+
+    # Theoretical O(n) reference anchored at the smallest size of the first series
+    first = next(iter(study.values()))
     normalized_n = np.array(sizes) / sizes[0]
     fig.add_trace(
-        go.Scatter(x=sizes, y=normalized_n * times[0], name="O(n)", line={"color": "red", "dash": "dash"}, mode="lines")
-    )
-
-    # Update layout with log scales
-    fig.update_layout(
-        title="Algorithm Performance Analysis",
-        xaxis={
-            "title": "Input Size (n)",
-            "type": "log",
-            "dtick": "D1",  # Show ticks for each power of 10
-        },
-        yaxis={"title": "Execution Time (seconds)", "type": "log", "dtick": "D1"},
-        hovermode="x unified",
-        showlegend=True,
-        legend={"yanchor": "top", "y": 0.99, "xanchor": "left", "x": 0.99},
-        plot_bgcolor="white",
+        go.Scatter(
+            x=sizes, y=normalized_n * first["time"][0], name="O(n)", line={"color": "red", "dash": "dash"}, mode="lines"
+        ),
+        row=1,
+        col=1,
     )
 
-    # Add grid lines
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor="LightGray")
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor="LightGray")
+    fig.update_xaxes(type="log", dtick="D1", showgrid=True, gridwidth=1, gridcolor="LightGray")
+    fig.update_xaxes(title="Input Size (n)", row=len(metrics), col=1)
+    fig.update_yaxes(type="log", showgrid=True, gridwidth=1, gridcolor="LightGray")
+    fig.update_layout(title="Scaling by instance family", hovermode="x unified", plot_bgcolor="white", height=1200)
 
-    # Show the plot
     fig.show()
 
 
 if __name__ == "__main__":
-    # Run the analysis
-    sizes, times = run_analysis()
-    plot_results(sizes, times)
+    parser = argparse.ArgumentParser(description="Scaling study across instance families.")
+    parser.add_argument("--min-exponent", type=int, default=4)
+    parser.add_argument("--max-exponent", type=int, default=16)
+    parser.add_argument("--d", type=int, default=5)
+    parser.add_argument("--families", nargs="+", choices=list(FAMILIES), default=list(FAMILIES))
+    parser.add_argument("--solvers", nargs="+", choices=list(SOLVERS), default=list(SOLVERS))
+    parser.add_argument("--cache", type=Path, default=Path("_instances"))
+    args = parser.parse_args()
+
+    # Test for different values of n (powers of 2)
+    sizes = [2**k for k in range(args.min_exponent, args.max_exponent + 1)]
+    study = run_analysis(sizes, args.d, tuple(args.families), tuple(args.solvers), args.cache)
+    plot_results(sizes, study)
@@ -0,0 +1,242 @@
+"""Reproducible benchmark suite for the cvxball solvers.
+
+Runs every solver entry point on a grid of ``(n, d)`` sizes and seeded
+instance families (see :mod:`experiments.instances`), records wall time,
+iteration counts and peak traced memory, and writes the results as JSON.  A
+second command compares a run against a stored baseline and exits non-zero
+when any case regressed, so it can gate a release.
+
+Run with::
+
+    uv run python -m experiments.benchmark run --output _benchmarks/current.json
+    uv run python -m experiments.benchmark compare _benchmarks/baseline.json _benchmarks/current.json
+
+Wall time is the median over ``--repeat`` untraced runs.  Peak memory comes
+from a separate run under :mod:`tracemalloc`, so it covers allocations made
+from Python and NumPy but not those made inside the native solver libraries.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from cvxball.solver import _cvx_problem, _solve_soc_program
+from experiments.instances import EASY, FAMILIES, generate
+
+Runner = Callable[[np.ndarray], tuple[float, int | None]]
+
+
+def _run_cvx(points: np.ndarray) -> tuple[float, int | None]:
+    """Solve through CVXPY + Clarabel (as ``min_circle_cvx`` does) and report iterations."""
+    problem, r, _ = _cvx_problem(points)
+    problem.solve(solver="CLARABEL")
+    return float(r.value[0]), problem.solver_stats.num_iters
+
+
+def _run_clarabel(points: np.ndarray) -> tuple[float, int | None]:
+    """Solve through the direct Clarabel path (as ``min_circle_clarabel`` does) and report iterations."""
+    solution = _solve_soc_program(points)
+    return float(solution.x[0]), int(solution.iterations)
+
+
+SOLVERS: dict[str, Runner] = {
+    "min_circle_cvx": _run_cvx,
+    "min_circle_clarabel": _run_clarabel,
+}
+
+DEFAULT_SIZES = (100, 1_000, 10_000)
+DEFAULT_DIMS = (2, 3, 10)
+DEFAULT_FAMILIES = (*EASY, "sphere")
+
+
+def measure(runner: Runner, points: np.ndarray, repeat: int) -> dict[str, Any]:
+    """Time ``runner`` on ``points`` and record its radius, iterations and peak traced memory."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        radius, iterations = runner(points)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        runner(points)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "times_s": times,
+        "median_s": statistics.median(times),
+        "iterations": iterations,
+        "peak_bytes": peak,
+        "radius": radius,
+    }
+
+
+def run(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    dims: tuple[int, ...] = DEFAULT_DIMS,
+    families: tuple[str, ...] = DEFAULT_FAMILIES,
+    solvers: tuple[str, ...] = tuple(SOLVERS),
+    repeat: int = 3,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Benchmark every solver on the full ``families x sizes x dims`` grid.
+
+    Args:
+        sizes: Numbers of points ``n``.
+        dims: Dimensions ``d``.
+        families: Instance families from :data:`experiments.instances.FAMILIES`.
+        solvers: Entry points from :data:`SOLVERS`.
+        repeat: Timed runs per case; the median is reported.
+        seed: Seed passed to every generator.
+
+    Returns:
+        A JSON-serialisable dict with a ``meta`` block describing the
+        environment and a ``results`` list with one record per case.
+    """
+    results = []
+    for family in families:
+        for n in sizes:
+            for d in dims:
+                points = generate(family, n, d, seed)
+                for solver in solvers:
+                    record = {"solver": solver, "family": family, "n": n, "d": d, "seed": seed}
+                    record.update(measure(SOLVERS[solver], points, repeat))
+                    results.append(record)
+                    print(
+                        f"{solver:>22} {family:>10} n={n:<8} d={d:<3} "
+                        f"{record['median_s']:.4f} s  iters={record['iterations']}  "
+                        f"peak={record['peak_bytes'] / 2**20:.1f} MiB",
+                        file=sys.stderr,
+                    )
+
+    import importlib.metadata
+
+    return {
+        "meta": {
+            "created": datetime.now(UTC).isoformat(timespec="seconds"),
+            "cvxball": importlib.metadata.version("cvxball"),
+            "numpy": np.__version__,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def _key(record: dict[str, Any]) -> tuple[str, str, int, int]:
+    """Identify a benchmark case independently of its measurements."""
+    return record["solver"], record["family"], record["n"], record["d"]
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    time_tolerance: float = 0.25,
+    memory_tolerance: float = 0.10,
+    radius_tolerance: float = 1e-5,
+) -> list[str]:
+    """List the cases in ``current`` that regressed against ``baseline``.
+
+    A case regresses when its median time or peak memory grows by more than
+    the given relative tolerance, when it needs more iterations, or when its
+    radius moves by more than ``radius_tolerance`` (relative).  A baseline case
+    missing from ``current``, such as a dropped solver or a family that
+    crashed, is a regression too; new cases in ``current`` are ignored.
+
+    Args:
+        baseline: Output of :func:`run` for the reference release.
+        current: Output of :func:`run` for the candidate.
+        time_tolerance: Allowed relative increase of the median wall time.
+        memory_tolerance: Allowed relative increase of the peak traced memory.
+        radius_tolerance: Allowed relative change of the radius.
+
+    Returns:
+        One human-readable line per regression; empty if there are none.
+    """
+    reference = {_key(record): record for record in baseline["results"]}
+    measured = {_key(record) for record in current["results"]}
+    regressions = [
+        "{} {} n={} d={}: missing from the current run".format(*key) for key in reference if key not in measured
+    ]
+    for record in current["results"]:
+        base = reference.get(_key(record))
+        if base is None:
+            continue
+        case = "{} {} n={} d={}".format(*_key(record))
+        if record["median_s"] > base["median_s"] * (1 + time_tolerance):
+            regressions.append(f"{case}: time {base['median_s']:.4f} s -> {record['median_s']:.4f} s")
+        if record["peak_bytes"] > base["peak_bytes"] * (1 + memory_tolerance):
+            regressions.append(f"{case}: peak memory {base['peak_bytes']} B -> {record['peak_bytes']} B")
+        if None not in (record["iterations"], base["iterations"]) and record["iterations"] > base["iterations"]:
+            regressions.append(f"{case}: iterations {base['iterations']} -> {record['iterations']}")
+        if abs(record["radius"] - base["radius"]) > radius_tolerance * max(1.0, abs(base["radius"])):
+            regressions.append(f"{case}: radius {base['radius']!r} -> {record['radius']!r}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point; see the module docstring for usage."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmark grid and write JSON")
+    run_parser.add_argument("--output", type=Path, required=True)
+    run_parser.add_argument("--n", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    run_parser.add_argument("--d", type=int, nargs="+", default=list(DEFAULT_DIMS))
+    run_parser.add_argument("--families", nargs="+", choices=list(FAMILIES), default=list(DEFAULT_FAMILIES))
+    run_parser.add_argument("--solvers", nargs="+", choices=list(SOLVERS), default=list(SOLVERS))
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--seed", type=int, default=0)
+
+    compare_parser = commands.add_parser("compare", help="flag regressions against a baseline JSON")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--time-tolerance", type=float, default=0.25)
+    compare_parser.add_argument("--memory-tolerance", type=float, default=0.10)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run(
+            sizes=tuple(args.n),
+            dims=tuple(args.d),
+            families=tuple(args.families),
+            solvers=tuple(args.solvers),
+            repeat=args.repeat,
+            seed=args.seed,
+        )
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        return 0
+
+    regressions = compare(
+        json.loads(args.baseline.read_text()),
+        json.loads(args.current.read_text()),
+        time_tolerance=args.time_tolerance,
+        memory_tolerance=args.memory_tolerance,
+    )
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if not regressions:
+        print("No regressions.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
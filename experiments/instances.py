@@ -0,0 +1,160 @@
+"""Seeded instance generators for minimum enclosing ball benchmarks.
+
+Each family is described by a factory ``family(d, rng) -> sampler``: the
+factory draws any shared structure (cluster centres, simplex vertices, a pool
+of distinct points) from ``rng`` once, and ``sampler(rows)`` then draws the
+next ``rows`` points, drawing each kind of variate from its own stream so
+that chunked and one-shot sampling agree.  :func:`generate` draws an
+in-memory ``(n, d)`` instance and :func:`write_npy` streams one chunk at a
+time into a memory-mapped ``.npy`` file, so instances far larger than RAM can
+be produced.  The same ``(family, n, d, seed)`` always yields the same points,
+whether generated in memory or streamed.
+
+Easy families:
+
+- ``uniform``: points uniform in the unit cube.
+- ``gaussian``: standard normal cloud; only a handful of points end up on the
+  boundary of the optimal ball.
+- ``clustered``: a few tight Gaussian clusters with random centres.
+
+Hard families:
+
+- ``sphere``: every point on the unit sphere — all *n* constraints are
+  (nearly) active at the optimum.
+- ``degenerate_simplex``: points on the edges of a simplex that is flattened
+  to a thickness of ``1e-6``, so the support set is ill-conditioned.
+- ``heavy_tailed``: Student-t (``df = 1.5``) cloud whose few extreme outliers
+  dominate the ball and span many orders of magnitude.
+- ``offset``: a unit Gaussian cloud translated by ``1e8`` in every coordinate,
+  which stresses cancellation in ``p_i - x``.
+- ``duplicated``: every point is one of 64 distinct points on the unit
+  sphere, each repeated many times.
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+Sampler = Callable[[int], np.ndarray]
+Family = Callable[[int, np.random.Generator], Sampler]
+
+#: Rows drawn per chunk when streaming an instance to disk.
+CHUNK_ROWS = 1 << 18
+
+
+def _uniform(d: int, rng: np.random.Generator) -> Sampler:
+    """Points uniform in ``[0, 1]^d``."""
+    return lambda rows: rng.random((rows, d))
+
+
+def _gaussian(d: int, rng: np.random.Generator) -> Sampler:
+    """Standard normal points."""
+    return lambda rows: rng.standard_normal((rows, d))
+
+
+def _sphere(d: int, rng: np.random.Generator) -> Sampler:
+    """Points uniform on the unit sphere."""
+
+    def sample(rows: int) -> np.ndarray:
+        points = rng.standard_normal((rows, d))
+        points /= np.linalg.norm(points, axis=1, keepdims=True)
+        return points
+
+    return sample
+
+
+def _clustered(d: int, rng: np.random.Generator, clusters: int = 8, spread: float = 0.05) -> Sampler:
+    """Isotropic Gaussian blobs with centres uniform in ``[-1, 1]^d``."""
+    centres = rng.uniform(-1.0, 1.0, size=(clusters, d))
+    labels, noise = rng.spawn(2)
+    return lambda rows: centres[labels.integers(clusters, size=rows)] + spread * noise.standard_normal((rows, d))
+
+
+def _degenerate_simplex(d: int, rng: np.random.Generator, thickness: float = 1e-6) -> Sampler:
+    """Points on the edges of a nearly flat simplex."""
+    vertices = rng.standard_normal((d + 1, d))
+    vertices[:, -1] *= thickness
+    edges, weights = rng.spawn(2)
+
+    def sample(rows: int) -> np.ndarray:
+        ends = edges.integers(d + 1, size=(rows, 2))
+        t = weights.random((rows, 1))
+        return (1.0 - t) * vertices[ends[:, 0]] + t * vertices[ends[:, 1]]
+
+    return sample
+
+
+def _heavy_tailed(d: int, rng: np.random.Generator, df: float = 1.5) -> Sampler:
+    """Student-t points with ``df`` degrees of freedom."""
+    return lambda rows: rng.standard_t(df, size=(rows, d))
+
+
+def _offset(d: int, rng: np.random.Generator, shift: float = 1e8) -> Sampler:
+    """Standard normal points translated by ``shift`` in every coordinate."""
+    return lambda rows: rng.standard_normal((rows, d)) + shift
+
+
+def _duplicated(d: int, rng: np.random.Generator, distinct: int = 64) -> Sampler:
+    """Rows drawn with replacement from a small pool of points on the unit sphere."""
+    pool = _sphere(d, rng)(distinct)
+    return lambda rows: pool[rng.integers(distinct, size=rows)]
+
+
+FAMILIES: dict[str, Family] = {
+    "uniform": _uniform,
+    "gaussian": _gaussian,
+    "clustered": _clustered,
+    "sphere": _sphere,
+    "degenerate_simplex": _degenerate_simplex,
+    "heavy_tailed": _heavy_tailed,
+    "offset": _offset,
+    "duplicated": _duplicated,
+}
+
+EASY = ("uniform", "gaussian", "clustered")
+HARD = ("sphere", "degenerate_simplex", "heavy_tailed", "offset", "duplicated")
+
+
+def generate(family: str, n: int, d: int, seed: int = 0) -> np.ndarray:
+    """Draw an ``(n, d)`` float64 instance of ``family`` in memory.
+
+    Args:
+        family: Key of :data:`FAMILIES`.
+        n: Number of points.
+        d: Dimension.
+        seed: Seed for :func:`numpy.random.default_rng`.
+
+    Returns:
+        The ``(n, d)`` array of points.
+    """
+    return FAMILIES[family](d, np.random.default_rng(seed))(n)
+
+
+def write_npy(path: str | Path, family: str, n: int, d: int, seed: int = 0, chunk_rows: int = CHUNK_ROWS) -> Path:
+    """Stream an ``(n, d)`` instance of ``family`` into a ``.npy`` file.
+
+    Only ``chunk_rows`` rows are held in memory at any time.  The file can be
+    read back lazily with ``np.load(path, mmap_mode="r")``.
+
+    Args:
+        path: Destination file; parent directories are created.
+        family: Key of :data:`FAMILIES`.
+        n: Number of points.
+        d: Dimension.
+        seed: Seed for :func:`numpy.random.default_rng`.
+        chunk_rows: Rows generated and written per step.
+
+    Returns:
+        The path written.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sample = FAMILIES[family](d, np.random.default_rng(seed))
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(n, d))
+    for start in range(0, n, chunk_rows):
+        stop = min(start + chunk_rows, n)
+        out[start:stop] = sample(stop - start)
+    out.flush()
+    del out
+    return path
@@ -0,0 +1,128 @@
+"""Load test of :class:`cvxball.aio.AsyncSolver` behind a local stand-in service.
+
+Starts a line-based TCP service on localhost whose handler solves one
+enclosing-ball problem per request, either inline (``--mode blocking``, what a
+service calling :func:`~cvxball.solver.min_circle_clarabel` directly does) or
+through :class:`~cvxball.aio.AsyncSolver` (``--mode async``).  Concurrent
+clients then send solve requests of mixed sizes while a probe client pings a
+trivial endpoint every few milliseconds.  The script reports latency
+percentiles for both: the solve latencies show queueing under the concurrency
+limit and the effect of deadlines, the ping latencies show whether the event
+loop stays responsive.
+
+Run with::
+
+    uv run python -m experiments.load_async --mode blocking
+    uv run python -m experiments.load_async --mode async --concurrency 4 --timeout 2.0
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import numpy as np
+
+from cvxball.aio import AsyncSolver
+from cvxball.solver import min_circle_clarabel
+
+# Every request solves a random instance with one of these sizes.
+SIZES = (1_000, 5_000, 20_000)
+
+
+def _percentiles(samples: list[float]) -> str:
+    """Format p50/p90/p99/max of ``samples`` (seconds) in milliseconds."""
+    if not samples:
+        return "no samples"
+    q = statistics.quantiles(samples, n=100, method="inclusive")
+    return f"p50 {1e3 * q[49]:8.1f}  p90 {1e3 * q[89]:8.1f}  p99 {1e3 * q[98]:8.1f}  max {1e3 * max(samples):8.1f} ms"
+
+
+async def serve(mode: str, solver: AsyncSolver, timeout: float | None) -> asyncio.Server:
+    """Start the stand-in service: ``solve <n> <d> <seed>`` or ``ping``, one per line."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while line := await reader.readline():
+            command, *args = line.decode().split()
+            if command == "ping":
+                writer.write(b"pong\n")
+            else:
+                n, d, seed = map(int, args)
+                points = np.random.default_rng(seed).standard_normal((n, d))
+                try:
+                    if mode == "blocking":
+                        radius = min_circle_clarabel(points).radius
+                    else:
+                        radius = (await solver.min_circle(points, timeout=timeout)).radius
+                    writer.write(f"ok {radius!r}\n".encode())
+                except TimeoutError:
+                    writer.write(b"timeout\n")
+            await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def client(port: int, requests: int, seed: int, latencies: list[float], timeouts: list[int]) -> None:
+    """Send ``requests`` solve requests of random sizes one after another."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    rng = np.random.default_rng(seed)
+    for i in range(requests):
+        start = time.perf_counter()
+        writer.write(f"solve {rng.choice(SIZES)} 3 {seed * requests + i}\n".encode())
+        reply = await reader.readline()
+        latencies.append(time.perf_counter() - start)
+        timeouts[0] += reply.startswith(b"timeout")
+    writer.close()
+    await writer.wait_closed()
+
+
+async def probe(port: int, interval: float, latencies: list[float], stop: asyncio.Event) -> None:
+    """Ping the service every ``interval`` seconds until ``stop`` is set."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    while not stop.is_set():
+        start = time.perf_counter()
+        writer.write(b"ping\n")
+        await reader.readline()
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(interval)
+    writer.close()
+    await writer.wait_closed()
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the load test and print the latency report."""
+    solver = AsyncSolver(max_concurrency=args.concurrency)
+    server = await serve(args.mode, solver, args.timeout)
+    port = server.sockets[0].getsockname()[1]
+    solves: list[float] = []
+    pings: list[float] = []
+    timeouts = [0]
+    stop = asyncio.Event()
+
+    start = time.perf_counter()
+    pinger = asyncio.create_task(probe(port, args.ping_interval, pings, stop))
+    await asyncio.gather(*(client(port, args.requests, seed, solves, timeouts) for seed in range(args.clients)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await pinger
+    server.close()
+    await server.wait_closed()
+    solver.close()
+
+    print(f"mode={args.mode} clients={args.clients} concurrency={args.concurrency} timeout={args.timeout}")
+    print(f"{len(solves)} solves in {elapsed:.1f} s, {timeouts[0]} timed out")
+    print(f"solve latency: {_percentiles(solves)}")
+    print(f"ping latency:  {_percentiles(pings)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tail latency of a solving service under concurrent load.")
+    parser.add_argument("--mode", choices=["blocking", "async"], default="async")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=None)
+    parser.add_argument("--ping-interval", type=float, default=0.01)
+    asyncio.run(main(parser.parse_args()))
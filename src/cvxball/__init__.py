@@ -1,8 +1,19 @@
-"""Core package for minimum enclosing ball utilities and solvers.
-
-Exposes version information and provides submodules with solver routines.
-"""
-
-import importlib.metadata
-
-__version__ = importlib.metadata.version("cvxball")
+"""Core package for minimum enclosing ball utilities and solvers.
+
+Exposes version information and provides submodules with solver routines.
+``__version__`` is resolved on first access so that importing the package does
+not pay for an :mod:`importlib.metadata` lookup.
+"""
+
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``__version__`` lazily from the installed distribution metadata."""
+    if name == "__version__":
+        import importlib.metadata
+
+        version = importlib.metadata.version("cvxball")
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")  # noqa: TRY003
@@ -0,0 +1,173 @@
+"""Asyncio entry points that keep the event loop responsive.
+
+A Clarabel solve on a large point set takes seconds, and calling
+:func:`~cvxball.solver.min_circle_clarabel` from a coroutine blocks the event
+loop for all of that time.  :class:`AsyncSolver` instead runs every solve in a
+thread pool (Clarabel releases the GIL while it iterates, so threads do run in
+parallel) and adds what a service needs on top:
+
+* a semaphore bounds the number of solves in flight, so a burst of requests
+  queues on the event loop instead of oversubscribing the pool.  A slot is
+  freed only once its worker has finished, including after cancellation;
+* a per-call ``timeout`` is a deadline that covers queueing as well as
+  solving: whatever is left of it when the solve starts becomes Clarabel's
+  ``time_limit``, and a call that runs out raises :class:`TimeoutError`;
+* cancelling the awaiting task also stops the solve: Clarabel polls a
+  termination callback once per interior-point iteration, so the worker is
+  released after at most one more iteration instead of finishing a result
+  nobody will read.
+"""
+
+import asyncio
+import contextlib
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from cvxball.ball import Ball
+
+if TYPE_CHECKING:
+    import clarabel
+
+
+def _solve(
+    points: np.ndarray, radii: np.ndarray | None, deadline: float | None, stop: threading.Event
+) -> "clarabel.DefaultSolution | None":  # ty: ignore[unresolved-attribute]
+    """Worker: solve with the remaining time as Clarabel's limit; ``None`` if none is left."""
+    from cvxball.solver import _solve_soc_program
+
+    time_limit = None if deadline is None else deadline - time.monotonic()
+    if stop.is_set() or (time_limit is not None and time_limit <= 0.0):
+        return None
+    return _solve_soc_program(points, radii=radii, time_limit=time_limit, stop=stop.is_set)
+
+
+def _release(loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore, _future: object) -> None:
+    """Done callback of a solve: free its slot on the event loop's thread, unless the loop is gone."""
+    with contextlib.suppress(RuntimeError):
+        loop.call_soon_threadsafe(semaphore.release)
+
+
+class AsyncSolver:
+    """Run enclosing-ball solves from asyncio code with bounded concurrency.
+
+    Args:
+        executor: Thread pool the solves run in.  Defaults to a private
+            :class:`~concurrent.futures.ThreadPoolExecutor` with
+            ``max_concurrency`` workers, shut down by :meth:`close`.  A
+            caller-supplied pool is left running.  Process pools are rejected:
+            cancellation and deadlines reach the worker through a
+            :class:`threading.Event`, which cannot cross a process boundary.
+        max_concurrency: Maximum number of solves in flight at once; further
+            calls wait for a slot.
+
+    Example:
+        >>> import asyncio
+        >>> import numpy as np
+        >>> from cvxball.aio import AsyncSolver
+        >>> async def main():
+        ...     with AsyncSolver(max_concurrency=2) as solver:
+        ...         return await solver.min_circle(np.array([[0.0, 0.0], [2.0, 0.0]]), timeout=10.0)
+        >>> round(asyncio.run(main()).radius, 6)
+        1.0
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor | None = None, max_concurrency: int = 4) -> None:
+        """Create the solver; see the class docstring for the arguments."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")  # noqa: TRY003
+        if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+            raise TypeError("executor must be a ThreadPoolExecutor; solves are stopped through shared memory")  # noqa: TRY003
+        self._owned = executor is None
+        self._executor = ThreadPoolExecutor(max_concurrency, "cvxball") if executor is None else executor
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def __enter__(self) -> "AsyncSolver":
+        """Return the solver itself."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Close the solver."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the executor if the solver created it."""
+        if self._owned:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, points: np.ndarray, radii: np.ndarray | None, timeout: float | None) -> Ball:
+        """Queue for a slot, solve in the executor and translate the status."""
+        import clarabel
+
+        loop = asyncio.get_running_loop()
+        # The event loop's clock is time.monotonic, which is what the worker reads.
+        deadline = None if timeout is None else loop.time() + timeout
+        try:
+            async with asyncio.timeout_at(deadline):
+                await self._semaphore.acquire()
+        except TimeoutError:
+            raise TimeoutError("timed out waiting for a free solver slot") from None  # noqa: TRY003
+
+        stop = threading.Event()
+        try:
+            future = self._executor.submit(_solve, points, radii, deadline, stop)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        # The slot is freed when the worker is done, not when this task is, so a
+        # cancelled solve still counts against the limit until it has stopped.
+        future.add_done_callback(functools.partial(_release, loop, self._semaphore))
+        try:
+            solution = await asyncio.wrap_future(future)
+        finally:
+            # Ends a running solve after its current iteration if this task was cancelled.
+            stop.set()
+
+        if solution is not None and solution.status == clarabel.SolverStatus.Solved:  # ty: ignore[unresolved-attribute]
+            return Ball(float(solution.x[0]), np.asarray(solution.x[1:]))
+        # Clarabel reports a solve cut short by its time limit as MaxTime, or
+        # as AlmostSolved when the iterate happens to meet the looser tolerances.
+        expired = deadline is not None and loop.time() >= deadline
+        if solution is None or expired or solution.status == clarabel.SolverStatus.MaxTime:  # ty: ignore[unresolved-attribute]
+            raise TimeoutError(f"solve did not finish within {timeout} s")  # noqa: TRY003
+        raise ValueError(f"Clarabel did not converge: status = {solution.status}")  # noqa: TRY003
+
+    async def min_circle(self, points: np.ndarray, timeout: float | None = None) -> Ball:
+        """Asynchronous :func:`~cvxball.solver.min_circle_clarabel`.
+
+        Args:
+            points: A numpy array of shape ``(n, d)``.
+            timeout: Optional deadline in seconds, counted from the call and
+                covering both the wait for a slot and the solve.
+
+        Returns:
+            The enclosing :class:`~cvxball.ball.Ball`.
+
+        Raises:
+            TimeoutError: If the deadline passes first.
+            ValueError: If Clarabel stops with any other non-``Solved`` status.
+        """
+        return await self._run(points, None, timeout)
+
+    async def min_ball_of_balls(self, centers: np.ndarray, radii: np.ndarray, timeout: float | None = None) -> Ball:
+        """Asynchronous :func:`~cvxball.solver.min_ball_of_balls_clarabel`.
+
+        Args:
+            centers: A numpy array of shape ``(k, d)`` with the ball centres.
+            radii: A numpy array of shape ``(k,)`` with the (non-negative) radii.
+            timeout: Optional deadline in seconds, as for :meth:`min_circle`.
+
+        Returns:
+            The enclosing :class:`~cvxball.ball.Ball`.
+
+        Raises:
+            TimeoutError: If the deadline passes first.
+            ValueError: If ``radii`` is invalid or Clarabel does not converge.
+        """
+        from cvxball.solver import _check_balls
+
+        return await self._run(centers, _check_balls(centers, radii), timeout)
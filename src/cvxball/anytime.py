@@ -0,0 +1,143 @@
+"""Anytime enclosing balls under a time limit, with certified bounds.
+
+An interior-point solve gives nothing until it finishes.  When a good answer
+now is worth more than a perfect one later, :func:`min_circle_anytime` runs
+the dual Frank-Wolfe method with away steps (see :mod:`cvxball.batch`)
+instead, which keeps a feasible answer and a certificate at every iteration:
+
+* the *upper bound* is the distance from the current centre to the farthest
+  point, so the ball with that radius encloses every point;
+* the *lower bound* is ``sqrt(gamma)``, the square root of the dual objective
+  ``gamma = sum(u_i |p_i - c|^2)`` for the current weights ``u`` (any weights
+  on the simplex give a lower bound on the optimal radius).
+
+The iteration stops when the bounds are within a factor ``1 + tol`` of each
+other or the time limit is reached, and returns the best ball seen together
+with the best lower bound, so the caller knows how far from optimal it may be.
+Only the points carrying weight are stored, and each iteration is one chunked
+scan for the farthest point (optionally split over threads, see
+:func:`cvxball.scan.parallel_farthest`), so memory stays bounded for any ``n``.  Every few
+iterations the weights move towards the circumcentre of the weighted points
+(the corrective step of :mod:`cvxball.batch`), which ends the iteration as soon
+as those are the true support points.
+"""
+
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from cvxball.ball import _CANCELLATION, Ball
+from cvxball.batch import _CORRECT_EVERY, _corrective_step
+from cvxball.scan import parallel_farthest
+
+
+class Bracket(NamedTuple):
+    """Result of :func:`min_circle_anytime`: a ball and a bound on how far it is from optimal.
+
+    Attributes:
+        ball: A ball enclosing every point; its radius is the upper bound.
+        lower: A lower bound on the radius of the minimum enclosing ball.
+        iterations: Number of Frank-Wolfe iterations performed.
+    """
+
+    ball: Ball
+    lower: float
+    iterations: int
+
+    @property
+    def upper(self) -> float:
+        """The upper bound on the optimal radius, i.e. ``ball.radius``."""
+        return self.ball.radius
+
+    @property
+    def gap(self) -> float:
+        """Relative gap ``upper / lower - 1``; ``inf`` while the lower bound is zero."""
+        if self.lower > 0.0:
+            return self.upper / self.lower - 1.0
+        return 0.0 if self.upper == 0.0 else float("inf")
+
+
+def min_circle_anytime(points: np.ndarray, time_limit: float, tol: float = 1e-6, threads: int | None = 1) -> Bracket:
+    """Approximate the smallest enclosing ball within a time limit.
+
+    Args:
+        points: A numpy array of shape ``(n, d)`` with ``n >= 1``.
+        time_limit: Wall-clock budget in seconds.  At least one iteration is
+            always performed, so the bounds are available even for a zero
+            budget; an iteration costs one pass over ``points``.
+        tol: Stop early once ``upper <= (1 + tol) * lower``.
+        threads: Number of threads sharing each scan, see
+            :func:`~cvxball.scan.parallel_farthest`; ``None`` uses every CPU.
+
+    Returns:
+        A :class:`Bracket` with the best enclosing ball found, a lower bound
+        on the optimal radius and the iteration count.
+
+    Raises:
+        ValueError: If ``points`` is empty or ``time_limit`` is negative.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.anytime import min_circle_anytime
+        >>> points = np.random.default_rng(0).standard_normal((100_000, 3))
+        >>> result = min_circle_anytime(points, time_limit=1.0, tol=1e-3)
+        >>> bool(result.ball.contains(points).all()), result.gap <= 1e-3
+        (True, True)
+    """
+    deadline = time.monotonic() + time_limit
+    points = np.asarray(points)
+    if points.ndim != 2 or points.shape[0] == 0:
+        raise ValueError("points must be a non-empty (n, d) array")  # noqa: TRY003
+    if time_limit < 0.0:
+        raise ValueError("time_limit must be non-negative")  # noqa: TRY003
+
+    # Start from the two ends of an approximate diameter.
+    a, _ = parallel_farthest(points, points[0], threads=threads)
+    b, _ = parallel_farthest(points, points[a], threads=threads)
+    index = np.unique([a, b])
+    weight = np.full(index.size, 1.0 / index.size)
+
+    best, lower = None, 0.0
+    iteration = 0
+    while True:
+        support = np.asarray(points[index], dtype=np.float64)
+        center = weight @ support
+        diff = support - center
+        d2 = np.einsum("ij,ij->i", diff, diff)
+        gamma = float(weight @ d2)
+        far, distance = parallel_farthest(points, center, threads=threads)
+        d2_far = distance * distance
+
+        # The scan's distances are accurate to about _CANCELLATION; round the radius up by that.
+        upper = distance * (1.0 + _CANCELLATION)
+        if best is None or upper < best.radius:
+            best = Ball(float(upper), center)
+        lower = max(lower, float(np.sqrt(gamma)))
+        iteration += 1
+        if best.radius <= (1.0 + tol) * lower or time.monotonic() >= deadline:
+            return Bracket(best, lower, iteration)
+
+        if iteration % _CORRECT_EVERY == 0:
+            weight, _ = _corrective_step(support[None], weight[None], d2[None], center[None])
+            weight = weight[0]
+        else:
+            near = int(np.argmin(d2))
+            # gamma is zero only while all weight sits on one point; then the best step is halfway.
+            toward_gap = d2_far / gamma - 1.0 if gamma > 0.0 else np.inf
+            away_gap = 1.0 - d2[near] / gamma if gamma > 0.0 else 0.0
+            if toward_gap >= away_gap:
+                step = 0.5 if gamma == 0.0 else toward_gap / (2.0 * (1.0 + toward_gap))
+                weight *= 1.0 - step
+                position = np.searchsorted(index, far)
+                if position < index.size and index[position] == far:
+                    weight[position] += step
+                else:
+                    index, weight = np.insert(index, position, far), np.insert(weight, position, step)
+            else:
+                u_near = weight[near]
+                step = min(away_gap / (2.0 * (1.0 - away_gap)), u_near / (1.0 - u_near))
+                weight *= 1.0 + step
+                weight[near] = 0.0 if step >= u_near / (1.0 - u_near) else weight[near] - step
+        keep = weight > 0.0
+        index, weight = index[keep], weight[keep] / weight[keep].sum()
@@ -0,0 +1,189 @@
+"""The :class:`Ball` result type and fast queries against it.
+
+A :class:`Ball` is what the solvers return.  It is a named tuple, so existing
+code that unpacks ``radius, center = min_circle_clarabel(points)`` keeps
+working, and it adds vectorised queries for testing many new points against
+the ball.  Solvers that compute many balls at once return :class:`Balls`,
+which holds them as arrays.
+
+The queries process the input in row chunks and evaluate squared distances
+through the expansion ``‖p‖² - 2 p·c + ‖c‖²``, where ``p·c`` is a BLAS
+matrix-vector product.  No ``(m, d)`` temporary is ever allocated; the extra
+memory is bounded by the chunk size.  Rows where the expansion loses too many
+digits to cancellation (points far from the origin relative to their distance
+from the centre) are recomputed exactly from ``p - c``.
+"""
+
+from collections.abc import Iterator
+from typing import NamedTuple
+
+import numpy as np
+
+# Rows per chunk are chosen so that one chunk of float64 input is about this large.
+_CHUNK_BYTES = 1 << 20
+
+# Recompute a squared distance exactly when the expansion's rounding error
+# could exceed this fraction of it (about half of float64's digits).
+_CANCELLATION = 1e-8
+
+
+def _chunk_rows(d: int) -> int:
+    """Rows per chunk for ``d``-dimensional input."""
+    return max(1, _CHUNK_BYTES // (8 * max(d, 1)))
+
+
+def _sq_distances(points: np.ndarray, center: np.ndarray) -> Iterator[tuple[int, np.ndarray]]:
+    """Yield ``(start, d2)`` with squared distances to ``center`` for consecutive row chunks."""
+    center = np.asarray(center, dtype=np.float64)
+    c_sq = float(center @ center)
+    step = _chunk_rows(center.shape[0])
+    for start in range(0, points.shape[0], step):
+        chunk = points[start : start + step]
+        p_sq = np.einsum("ij,ij->i", chunk, chunk, dtype=np.float64)
+        d2 = p_sq + c_sq
+        d2 -= 2.0 * (chunk @ center)
+        scale = p_sq
+        scale += c_sq
+        inexact = np.flatnonzero(d2 <= (np.finfo(np.float64).eps / _CANCELLATION) * scale)
+        if inexact.size:
+            diff = chunk[inexact] - center
+            d2[inexact] = np.einsum("ij,ij->i", diff, diff)
+        np.maximum(d2, 0.0, out=d2)
+        yield start, d2
+
+
+def _merge(
+    c1: np.ndarray, r1: np.ndarray | float, c2: np.ndarray, r2: np.ndarray | float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Smallest balls enclosing pairs of balls, vectorised over leading dimensions.
+
+    Args:
+        c1: Centres of the first balls, shape ``(..., d)``.
+        r1: Radii of the first balls, shape ``(...)``, or one radius for all.
+        c2: Centres of the second balls, shape ``(..., d)``.
+        r2: Radii of the second balls, shape ``(...)``, or one radius for all.
+
+    Returns:
+        A tuple ``(centers, radii)`` of the merged balls.
+    """
+    c1, c2 = np.asarray(c1, dtype=np.float64), np.asarray(c2, dtype=np.float64)
+    r1, r2 = np.asarray(r1, dtype=np.float64), np.asarray(r2, dtype=np.float64)
+    offset = c2 - c1
+    dist = np.sqrt(np.einsum("...i,...i->...", offset, offset))
+    radius = np.maximum((dist + r1 + r2) / 2.0, np.maximum(r1, r2))
+    # Move from c1 towards c2 by (radius - r1); the weight is 0 when ball 1
+    # already contains ball 2 and 1 when ball 2 contains ball 1.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = np.where(dist > 0.0, np.clip((radius - r1) / dist, 0.0, 1.0), 0.0)
+    weight = np.where(r2 > r1 + dist, 1.0, weight)
+    center = c1 + weight[..., None] * offset
+    return center, radius
+
+
+class Ball(NamedTuple):
+    """A closed Euclidean ball, as returned by the enclosing-ball solvers.
+
+    Attributes:
+        radius: The radius (float).
+        center: The centre, a numpy array of shape ``(d,)``.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.ball import Ball
+        >>> ball = Ball(1.0, np.zeros(2))
+        >>> ball.contains(np.array([[0.5, 0.5], [1.0, 1.0]])).tolist()
+        [True, False]
+        >>> radius, center = ball
+    """
+
+    radius: float
+    center: np.ndarray
+
+    def contains(self, points: np.ndarray, tol: float = 0.0) -> np.ndarray:
+        """Test which points lie inside the ball enlarged by ``tol``.
+
+        Args:
+            points: A numpy array of shape ``(m, d)``.
+            tol: Absolute slack added to the radius.
+
+        Returns:
+            A boolean array of shape ``(m,)``.
+        """
+        bound = (self.radius + tol) ** 2
+        inside = np.empty(points.shape[0], dtype=bool)
+        for start, d2 in _sq_distances(points, self.center):
+            np.less_equal(d2, bound, out=inside[start : start + d2.shape[0]])
+        return inside
+
+    def signed_distance(self, points: np.ndarray) -> np.ndarray:
+        """Distance of each point to the sphere, negative inside the ball.
+
+        Args:
+            points: A numpy array of shape ``(m, d)``.
+
+        Returns:
+            A float array of shape ``(m,)`` with ``‖p - c‖ - r``.
+        """
+        out = np.empty(points.shape[0])
+        for start, d2 in _sq_distances(points, self.center):
+            section = out[start : start + d2.shape[0]]
+            np.sqrt(d2, out=section)
+            section -= self.radius
+        return out
+
+    def farthest(self, points: np.ndarray) -> tuple[int, float]:
+        """Find the point farthest from the centre.
+
+        Args:
+            points: A non-empty numpy array of shape ``(m, d)``.
+
+        Returns:
+            A tuple ``(index, distance)`` of the farthest point's row and its
+            distance to the centre.
+
+        Raises:
+            ValueError: If ``points`` is empty.
+        """
+        best_index, best_d2 = -1, -1.0
+        for start, d2 in _sq_distances(points, self.center):
+            i = int(np.argmax(d2))
+            if d2[i] > best_d2:
+                best_index, best_d2 = start + i, float(d2[i])
+        if best_index < 0:
+            raise ValueError("farthest() needs at least one point")  # noqa: TRY003
+        return best_index, float(np.sqrt(best_d2))
+
+    def merge(self, other: "Ball") -> "Ball":
+        """Return the smallest ball enclosing both ``self`` and ``other`` (closed form).
+
+        Example:
+            >>> import numpy as np
+            >>> from cvxball.ball import Ball
+            >>> Ball(1.0, np.array([0.0, 0.0])).merge(Ball(1.0, np.array([4.0, 0.0])))
+            Ball(radius=3.0, center=array([2., 0.]))
+        """
+        center, radius = _merge(self.center, self.radius, other.center, other.radius)
+        return Ball(float(radius), center)
+
+
+class Balls(NamedTuple):
+    """Many balls stored as arrays, as returned by the batched solvers.
+
+    Attributes:
+        radii: The radii, shape ``(m,)``.
+        centers: The centres, shape ``(m, d)``.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.ball import Balls
+        >>> balls = Balls(np.array([1.0, 2.0]), np.zeros((2, 3)))
+        >>> balls.ball(1)
+        Ball(radius=2.0, center=array([0., 0., 0.]))
+    """
+
+    radii: np.ndarray
+    centers: np.ndarray
+
+    def ball(self, index: int) -> Ball:
+        """Return ball ``index`` as a :class:`Ball`."""
+        return Ball(float(self.radii[index]), self.centers[index].copy())
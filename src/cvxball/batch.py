@@ -0,0 +1,523 @@
+"""Vectorised enclosing balls for many small point sets at once.
+
+Calling a conic solver once per group costs a Python round trip and a solver
+setup per group, which dominates when there are thousands of small groups.
+The routines here instead solve all groups in lockstep with NumPy, using the
+Frank-Wolfe method with away steps on the dual of the enclosing-ball problem
+(Yildirim, "Two algorithms for the minimum enclosing ball problem", 2008):
+
+* the dual keeps a weight ``u_i >= 0`` per point with ``sum(u) = 1`` per
+  group; the centre is ``c = sum(u_i p_i)`` and ``gamma = sum(u_i |p_i - c|^2)``
+  is the dual objective, so ``sqrt(gamma)`` is a lower bound on the optimal
+  radius while the distance to the farthest point is an upper bound;
+* a *toward* step moves weight onto the farthest point, an *away* step moves
+  it off the nearest point that carries weight, whichever promises more;
+* a group stops once the upper bound is within a factor ``1 + tol`` of the
+  lower bound.
+
+One iteration costs ``O(N d)`` over the live points.  Finished groups leave
+the working set, and so do points that provably lie strictly inside their
+group's optimal ball: if ``R`` is the current upper bound and ``r`` the lower
+bound, the optimal centre is within ``sqrt(R^2 - r^2)`` of the current one,
+so a weightless point closer to the current centre than ``r`` minus that
+distance can never become a support point.  After the loop one pass over all
+points recomputes the radii exactly.  Frank-Wolfe converges quickly on most
+groups but has a long tail on a few, so groups still running after
+``max_iter`` iterations (or, rarely, failing the final check) are finished one
+by one with the exact core-set solver of :mod:`cvxball.coreset`.
+
+The segmented solver above stores groups as a single ``(N, d)`` array in
+which every group is a contiguous block of rows, described by the sorted start
+offsets of the blocks.  For many tiny groups the per-block bookkeeping
+dominates, so :func:`_lockstep_balls` instead takes groups padded to a common
+size as a ``(B, m, d)`` array (padding repeats a member, which does not change
+the ball) and adds a fully corrective step every few iterations: it moves the
+weights by exact line search towards the maximiser of the dual over the
+affine hull of the points carrying weight, which is the circumcentre of those
+points and lands on the optimum as soon as they are the true support.
+
+:func:`min_circle_grouped` segments its input by label with one stable
+argsort, gathering a bounded batch of rows at a time (or slicing the input
+directly when it is already sorted by label), and sends every group to the
+cheapest suitable method: closed forms for one or two points, the padded
+lockstep solver for small groups, the segmented solver for medium ones, and
+the core-set solver for groups large enough to amortise a conic solve.
+:func:`min_circle_neighborhoods` feeds fixed-size neighbourhoods, given as an
+index matrix, to the padded solver a bounded chunk at a time, and
+:func:`min_circle_batch` exposes it directly for a ``(B, n, d)`` batch with
+per-problem tolerances.
+"""
+
+import numpy as np
+
+from cvxball.ball import Balls, _merge
+from cvxball.coreset import _coreset_ball
+
+# The centres are recomputed exactly from the weights this often, so that the
+# incremental updates cannot drift.
+_RECENTER_EVERY = 64
+
+# Interior points are eliminated from the working set this often.
+_PRUNE_EVERY = 4
+
+# The padded solver takes a fully corrective step every this many iterations,
+# over at most this many points (times d + 1) that carry weight.
+_CORRECT_EVERY = 4
+_CORRECT_POINTS = 3
+
+# Relative ridge added to the circumcentre systems of the corrective step.
+_RIDGE = 1e-12
+
+# Groups with at most this many points go to the padded lockstep solver.
+_LOCKSTEP_MAX = 64
+
+# Groups with at least this many points go to the core-set solver.
+_CORESET_MIN = 1 << 14
+
+# Medium groups are gathered and solved in batches of about this many rows.
+_BATCH_ROWS = 1 << 20
+
+# Radii are inflated by this relative amount so that rounding in the distance
+# computations can never leave a point outside its ball.
+_ROUNDING = 16 * np.finfo(np.float64).eps
+
+
+def _segment_argmax(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Index of the first maximum of every block ``values[starts[i]:starts[i + 1]]``."""
+    peak = np.maximum.reduceat(values, starts)
+    sizes = np.diff(np.append(starts, values.shape[0]))
+    hits = np.flatnonzero(values == np.repeat(peak, sizes))
+    return hits[np.searchsorted(hits, starts)]
+
+
+def _segment_sq_distances(points: np.ndarray, centers: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """Squared distance of every row to the centre of its block."""
+    diff = points - np.repeat(centers, sizes, axis=0)
+    d2: np.ndarray = np.einsum("ij,ij->i", diff, diff)
+    return d2
+
+
+def _segment_balls(
+    points: np.ndarray, starts: np.ndarray, tol: float = 1e-6, max_iter: int = 256
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Enclosing balls of consecutive row blocks by segmented Frank-Wolfe.
+
+    Args:
+        points: A float64 array of shape ``(N, d)``.
+        starts: Sorted block offsets of shape ``(g,)`` with ``starts[0] == 0``;
+            every block must be non-empty.
+        tol: Relative gap between the upper and lower radius bounds at which a
+            block is finished.
+        max_iter: Number of lockstep iterations after which the blocks still
+            running are handed to the core-set solver.
+
+    Returns:
+        A tuple ``(centers, radii, lower)`` of shapes ``(g, d)``, ``(g,)`` and
+        ``(g,)``.  Every ball encloses its block, and ``lower`` bounds the
+        optimal radii from below.
+    """
+    n, d = points.shape
+    g = starts.shape[0]
+    starts = np.asarray(starts, dtype=np.intp)
+    block_sizes = np.diff(np.append(starts, n))
+    centers, lower = np.empty((g, d)), np.empty(g)
+    finished = np.zeros(g, dtype=bool)
+
+    # Working set: the live blocks, their candidate rows (and where those came
+    # from), and the dual weights of the rows.
+    live, rows, origin = np.arange(g), points, np.arange(n)
+    sizes, offsets = block_sizes, starts
+
+    # Start from the two ends of an approximate diameter of every block.
+    a = _segment_argmax(_segment_sq_distances(rows, rows[offsets], sizes), offsets)
+    b = _segment_argmax(_segment_sq_distances(rows, rows[a], sizes), offsets)
+    weight = np.zeros(n)
+    np.add.at(weight, a, 0.5)
+    np.add.at(weight, b, 0.5)
+    center = (rows[a] + rows[b]) / 2.0
+
+    bound = (1.0 + tol) ** 2
+    for iteration in range(max_iter):
+        if iteration % _RECENTER_EVERY == 0:
+            center = np.add.reduceat(weight[:, None] * rows, offsets, axis=0)
+        d2 = _segment_sq_distances(rows, center, sizes)
+        far = _segment_argmax(d2, offsets)
+        gamma = np.add.reduceat(weight * d2, offsets)
+
+        done = d2[far] <= bound * gamma
+        centers[live[done]] = center[done]
+        lower[live[done]] = np.sqrt(gamma[done])
+        finished[live[done]] = True
+        keep = np.repeat(~done, sizes)
+        if iteration % _PRUNE_EVERY == 0:
+            shift = np.sqrt(np.maximum(d2[far] - gamma, 0.0))
+            inner = np.repeat(np.sqrt(gamma) - shift, sizes)
+            keep &= (weight > 0.0) | (np.sqrt(d2) >= inner)
+        if not keep.all():
+            counts = np.add.reduceat(keep.astype(np.intp), offsets)[~done]
+            live, center, gamma = live[~done], center[~done], gamma[~done]
+            rows, origin, weight, d2 = rows[keep], origin[keep], weight[keep], d2[keep]
+            sizes = counts
+            if live.size == 0:
+                break
+            offsets = np.concatenate([[0], np.cumsum(sizes[:-1])])
+            far = _segment_argmax(d2, offsets)
+        near = _segment_argmax(np.where(weight > 0.0, -d2, -np.inf), offsets)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            toward_gap = d2[far] / gamma - 1.0
+            away_gap = 1.0 - d2[near] / gamma
+            toward = toward_gap >= away_gap
+            u_near = weight[near]
+            step = np.where(
+                toward,
+                toward_gap / (2.0 * (1.0 + toward_gap)),
+                np.minimum(away_gap / (2.0 * (1.0 - away_gap)), u_near / (1.0 - u_near)),
+            )
+            drop = ~toward & (step >= u_near / (1.0 - u_near))
+        scale = np.where(toward, 1.0 - step, 1.0 + step)
+
+        weight *= np.repeat(scale, sizes)
+        weight[far[toward]] += step[toward]
+        weight[near[~toward]] -= step[~toward]
+        weight[near[drop]] = 0.0
+        target = np.where(toward[:, None], rows[far], rows[near])
+        center = scale[:, None] * center + np.where(toward, step, -step)[:, None] * target
+
+    # Exact radii over every point, including the ones pruned along the way.
+    centers[live] = center
+    radii = np.sqrt(np.maximum.reduceat(_segment_sq_distances(points, centers, block_sizes), starts))
+    finished &= radii <= (1.0 + tol) * lower
+    radii *= 1.0 + _ROUNDING
+
+    # Warm-start the stragglers from the rows that still carry dual weight.
+    support = origin[weight > 0.0]
+    for block in np.flatnonzero(~finished):
+        start, stop = starts[block], starts[block] + block_sizes[block]
+        core = support[(support >= start) & (support < stop)] - start
+        ball, _ = _coreset_ball(points[start:stop], np.ones(stop - start, dtype=bool), core, tol)
+        centers[block], radii[block] = ball.center, ball.radius
+        # The core-set ball is accepted within a factor 1 + tol of the core-set optimum.
+        lower[block] = ball.radius / (1.0 + tol)
+    return centers, radii, lower
+
+
+def _corrective_step(
+    points: np.ndarray, weight: np.ndarray, d2: np.ndarray, center: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Line search from ``weight`` towards the dual maximiser on the affine hull of its support.
+
+    Args:
+        points: Padded groups, shape ``(B, m, d)``.
+        weight: Dual weights, shape ``(B, m)``.
+        d2: Squared distances of the points to ``center``, shape ``(B, m)``.
+        center: Current centres, shape ``(B, d)``.
+
+    Returns:
+        The updated ``(weight, center)``; the dual objective never decreases.
+    """
+    b, m, d = points.shape
+    r = np.arange(b)
+    k = min(m, int(np.max(np.count_nonzero(weight > 0.0, axis=1))), _CORRECT_POINTS * (d + 1))
+    index = np.argsort(-weight, axis=1, kind="stable")[:, :k]
+    support = points[r[:, None], index]
+    active = weight[r[:, None], index] > 0.0
+
+    # Circumcentre c = s_0 + alpha @ V with |c - s_i| equal for all active s_i,
+    # i.e. (V V^T) alpha = diag(V V^T) / 2.  A tiny ridge keeps the system
+    # solvable for dependent or padded points; the line search below makes
+    # any resulting inexactness harmless.
+    edges = (support[:, 1:] - support[:, :1]) * active[:, 1:, None]
+    gram = edges @ edges.transpose(0, 2, 1)
+    diagonal = np.arange(gram.shape[1])
+    rhs = 0.5 * gram[:, diagonal, diagonal]
+    gram[:, diagonal, diagonal] += _RIDGE * rhs.sum(axis=1, keepdims=True) + np.finfo(np.float64).tiny
+    alpha = np.linalg.solve(gram, rhs[..., None])[..., 0]
+    target = np.zeros_like(weight)
+    target[r[:, None], index] = np.concatenate([1.0 - alpha.sum(axis=1, keepdims=True), alpha], axis=1)
+    circumcenter = support[:, 0] + np.einsum("bk,bkd->bd", alpha, edges)
+
+    # The dual objective along weight + t (target - weight) is a concave
+    # parabola with slope sum(delta d2) and curvature |circumcenter - center|^2.
+    delta = target - weight
+    slope = np.einsum("bm,bm->b", delta, d2)
+    offset = circumcenter - center
+    curvature = np.einsum("bd,bd->b", offset, offset)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(delta < 0.0, weight / -delta, np.inf)
+        peak = np.where(curvature > 0.0, slope / (2.0 * curvature), np.inf)
+    limit, binding = ratio.min(axis=1), ratio.argmin(axis=1)
+    step = np.minimum(peak, limit)
+    step = np.where((slope > 0.0) & np.isfinite(step), step, 0.0)
+
+    weight = np.maximum(weight + step[:, None] * delta, 0.0)
+    hit = step >= limit
+    weight[r[hit], binding[hit]] = 0.0
+    return weight, center + step[:, None] * offset
+
+
+def _lockstep_balls(
+    points: np.ndarray, tol: float | np.ndarray = 1e-6, max_iter: int = 256
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Enclosing balls of equally sized groups by lockstep Frank-Wolfe.
+
+    Args:
+        points: A float64 array of shape ``(B, m, d)``, one group per entry of
+            the first axis.
+        tol: Relative gap between the upper and lower radius bounds at which a
+            group is finished, a scalar or one value per group.
+        max_iter: Number of lockstep iterations after which the groups still
+            running are handed to the core-set solver.
+
+    Returns:
+        A tuple ``(centers, radii, lower)`` of shapes ``(B, d)``, ``(B,)`` and
+        ``(B,)``.  Every ball encloses its group, and ``lower`` bounds the
+        optimal radii from below.
+    """
+    size, m, d = points.shape
+    centers, radii, lower = np.empty((size, d)), np.empty(size), np.empty(size)
+    live, group = np.arange(size), points
+    r = np.arange(size)
+    tol = np.broadcast_to(np.asarray(tol, dtype=np.float64), (size,))
+    bound = (1.0 + tol) ** 2
+
+    # Start from the two ends of an approximate diameter of every group.
+    diff = group - group[:, :1]
+    a = np.einsum("bmd,bmd->bm", diff, diff).argmax(axis=1)
+    diff = group - group[r, a][:, None]
+    b = np.einsum("bmd,bmd->bm", diff, diff).argmax(axis=1)
+    weight = np.zeros((size, m))
+    np.add.at(weight, (r, a), 0.5)
+    np.add.at(weight, (r, b), 0.5)
+    center = (group[r, a] + group[r, b]) / 2.0
+
+    for iteration in range(max_iter):
+        diff = group - center[:, None]
+        d2 = np.einsum("bmd,bmd->bm", diff, diff)
+        far = d2.argmax(axis=1)
+        d2_far = d2[r, far]
+        gamma = np.einsum("bm,bm->b", weight, d2)
+
+        done = d2_far <= bound * gamma
+        if done.any():
+            centers[live[done]] = center[done]
+            radii[live[done]] = np.sqrt(d2_far[done]) * (1.0 + _ROUNDING)
+            lower[live[done]] = np.sqrt(gamma[done])
+            keep = ~done
+            live, group, weight, center = live[keep], group[keep], weight[keep], center[keep]
+            bound = bound[keep]
+            d2, far, d2_far, gamma = d2[keep], far[keep], d2_far[keep], gamma[keep]
+            r = r[: live.size]
+            if live.size == 0:
+                return centers, radii, lower
+
+        if iteration % _CORRECT_EVERY == _CORRECT_EVERY - 1:
+            weight, center = _corrective_step(group, weight, d2, center)
+            continue
+
+        near = np.where(weight > 0.0, d2, np.inf).argmin(axis=1)
+        u_near = weight[r, near]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            toward_gap = d2_far / gamma - 1.0
+            away_gap = 1.0 - d2[r, near] / gamma
+            toward = toward_gap >= away_gap
+            step = np.where(
+                toward,
+                toward_gap / (2.0 * (1.0 + toward_gap)),
+                np.minimum(away_gap / (2.0 * (1.0 - away_gap)), u_near / (1.0 - u_near)),
+            )
+            drop = ~toward & (step >= u_near / (1.0 - u_near))
+        scale = np.where(toward, 1.0 - step, 1.0 + step)
+
+        weight *= scale[:, None]
+        weight[r[toward], far[toward]] += step[toward]
+        weight[r[~toward], near[~toward]] -= step[~toward]
+        weight[r[drop], near[drop]] = 0.0
+        target = np.where(toward[:, None], group[r, far], group[r, near])
+        center = scale[:, None] * center + np.where(toward, step, -step)[:, None] * target
+
+    # Warm-start the stragglers from the points that still carry dual weight.
+    for i, block in enumerate(live):
+        ball, _ = _coreset_ball(group[i], np.ones(m, dtype=bool), np.flatnonzero(weight[i]), tol[block])
+        centers[block], radii[block] = ball.center, ball.radius
+        # The core-set ball is accepted within a factor 1 + tol of the core-set optimum.
+        lower[block] = ball.radius / (1.0 + tol[block])
+    return centers, radii, lower
+
+
+def min_circle_batch(points: np.ndarray, tol: float | np.ndarray = 1e-6, max_iter: int = 256) -> Balls:
+    """Compute the enclosing balls of a batch of equally sized point sets.
+
+    All problems run in lockstep through :func:`_lockstep_balls`; a problem
+    leaves the working set as soon as its own tolerance is met, so easy
+    problems stop costing anything while hard ones keep iterating.  The batch
+    is processed a bounded chunk of problems at a time.
+
+    Args:
+        points: A numpy array of shape ``(B, n, d)`` with ``n >= 1``, one
+            point set per entry of the first axis.
+        tol: Relative radius tolerance, a scalar or an array of shape ``(B,)``
+            with one tolerance per problem.
+        max_iter: Number of lockstep iterations after which the problems still
+            running are finished by the core-set solver.
+
+    Returns:
+        :class:`~cvxball.ball.Balls` with ``(B,)`` radii and ``(B, d)``
+        centres.  Every ball encloses its point set and is within a factor
+        ``1 + tol`` of optimal.
+
+    Raises:
+        ValueError: If ``points`` is not a ``(B, n, d)`` array with ``n >= 1``
+            or ``tol`` does not match the batch or is negative.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.batch import min_circle_batch
+        >>> points = np.array([[[0.0, 0.0], [2.0, 0.0]], [[0.0, 0.0], [0.0, 4.0]]])
+        >>> radii, centers = min_circle_batch(points)
+        >>> np.round(radii, 6).tolist()
+        [1.0, 2.0]
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 3 or points.shape[1] == 0:
+        raise ValueError("points must be a (B, n, d) array with n >= 1")  # noqa: TRY003
+    size, n, d = points.shape
+    tol = np.asarray(tol, dtype=np.float64)
+    if tol.shape not in ((), (size,)):
+        raise ValueError(f"tol must be a scalar or have shape ({size},)")  # noqa: TRY003
+    if (tol < 0.0).any():
+        raise ValueError("tol must be non-negative")  # noqa: TRY003
+    tol = np.broadcast_to(tol, (size,))
+
+    radii, centers = np.empty(size), np.empty((size, d))
+    step = max(1, _BATCH_ROWS // n)
+    for start in range(0, size, step):
+        chunk = slice(start, start + step)
+        centers[chunk], radii[chunk], _ = _lockstep_balls(points[chunk], tol=tol[chunk], max_iter=max_iter)
+    return Balls(radii, centers)
+
+
+def min_circle_grouped(points: np.ndarray, labels: np.ndarray, tol: float = 1e-6) -> Balls:
+    """Compute the enclosing ball of every group of rows sharing a label.
+
+    Args:
+        points: A numpy array of shape ``(N, d)``.
+        labels: Non-negative integer label of every row, shape ``(N,)``.
+        tol: Relative radius tolerance of the iterative solvers.
+
+    Returns:
+        :class:`~cvxball.ball.Balls` indexed by label, with
+        ``max(labels) + 1`` entries; labels without rows get ``nan``.  Every
+        ball encloses its group and is within a factor ``1 + tol`` of optimal.
+
+    Raises:
+        ValueError: If ``labels`` does not match ``points`` or is negative.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.batch import min_circle_grouped
+        >>> points = np.array([[0.0, 0.0], [2.0, 0.0], [5.0, 5.0], [1.0, 1.0]])
+        >>> radii, centers = min_circle_grouped(points, np.array([0, 0, 2, 0]))
+        >>> np.round(radii, 6).tolist()
+        [1.0, nan, 0.0]
+    """
+    labels = np.asarray(labels)
+    if labels.shape != points.shape[:1] or not np.issubdtype(labels.dtype, np.integer):
+        raise ValueError("labels must be an integer array with one entry per row")  # noqa: TRY003
+    if labels.size and labels.min() < 0:
+        raise ValueError("labels must be non-negative")  # noqa: TRY003
+
+    counts = np.bincount(labels)
+    radii, centers = np.full(counts.size, np.nan), np.full((counts.size, points.shape[1]), np.nan)
+    offsets = np.zeros(counts.size + 1, dtype=np.intp)
+    np.cumsum(counts, out=offsets[1:])
+    # Rows already sorted by label are sliced in place; otherwise gather through one stable argsort.
+    order = None if np.all(labels[1:] >= labels[:-1]) else np.argsort(labels, kind="stable")
+
+    def rows(index: np.ndarray | slice) -> np.ndarray:
+        """Rows at positions ``index`` of the label-sorted order, as float64 (a view for sorted slices)."""
+        return np.asarray(points[index if order is None else order[index]], dtype=np.float64)
+
+    one, two = np.flatnonzero(counts == 1), np.flatnonzero(counts == 2)
+    centers[one], radii[one] = rows(offsets[one]), 0.0
+    centers[two], radii[two] = _merge(rows(offsets[two]), 0.0, rows(offsets[two] + 1), 0.0)
+    radii[two] *= 1.0 + _ROUNDING
+
+    for label in map(int, np.flatnonzero(counts >= _CORESET_MIN)):
+        members = rows(slice(offsets[label], offsets[label + 1]))
+        ball, _ = _coreset_ball(members, np.ones(members.shape[0], dtype=bool), tol=tol)
+        centers[label], radii[label] = ball.center, ball.radius
+
+    # Small groups: padded to the next power of two by repeating their last row.
+    small = np.flatnonzero((counts > 2) & (counts <= _LOCKSTEP_MAX))
+    width = 1 << np.ceil(np.log2(counts[small])).astype(np.intp)
+    for m in np.unique(width):
+        bucket = small[width == m]
+        for chunk in np.array_split(bucket, -(-bucket.size * m // _BATCH_ROWS)):
+            index = offsets[chunk, None] + np.minimum(np.arange(m), counts[chunk, None] - 1)
+            group = rows(index.ravel()).reshape(chunk.size, m, -1)
+            centers[chunk], radii[chunk], _ = _lockstep_balls(group, tol=tol)
+
+    medium = np.flatnonzero((counts > _LOCKSTEP_MAX) & (counts < _CORESET_MIN))
+    batches = np.cumsum(counts[medium]) // _BATCH_ROWS
+    for batch in np.unique(batches):
+        group = medium[batches == batch]
+        starts = np.concatenate([[0], np.cumsum(counts[group])[:-1]])
+        index = np.arange(starts[-1] + counts[group[-1]]) + np.repeat(offsets[group] - starts, counts[group])
+        centers[group], radii[group], _ = _segment_balls(rows(index), starts, tol=tol)
+    return Balls(radii, centers)
+
+
+def min_circle_neighborhoods(points: np.ndarray, neighbors: np.ndarray, tol: float = 1e-6) -> Balls:
+    """Compute the enclosing ball of every row's neighbourhood.
+
+    Neighbourhoods are gathered from ``points`` a chunk of rows at a time, so
+    the ``(m, k, d)`` array of all of them is never materialised.
+
+    Args:
+        points: A numpy array of shape ``(n, d)``.
+        neighbors: Integer index matrix of shape ``(m, k)``; row ``i`` lists
+            the points of neighbourhood ``i``, for example as returned by
+            ``scipy.spatial.cKDTree(points).query(queries, k)[1]``.  Entries
+            equal to ``n``, which ``cKDTree`` uses for missing neighbours, are
+            ignored.
+        tol: Relative radius tolerance.
+
+    Returns:
+        :class:`~cvxball.ball.Balls` with ``(m,)`` radii and ``(m, d)`` centres.
+
+    Raises:
+        ValueError: If ``neighbors`` is not a 2-D integer array of valid indices
+            or a row has no valid entry.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.batch import min_circle_neighborhoods
+        >>> points = np.array([[0.0, 0.0], [2.0, 0.0], [0.0, 4.0]])
+        >>> radii, centers = min_circle_neighborhoods(points, np.array([[0, 1], [0, 2]]))
+        >>> np.round(radii, 6).tolist()
+        [1.0, 2.0]
+    """
+    neighbors = np.asarray(neighbors)
+    n = points.shape[0]
+    if neighbors.ndim != 2 or not np.issubdtype(neighbors.dtype, np.integer):
+        raise ValueError("neighbors must be a 2-D integer array")  # noqa: TRY003
+    if neighbors.size and (neighbors.min() < 0 or neighbors.max() > n):
+        raise ValueError(f"neighbor indices must lie in [0, {n}]")  # noqa: TRY003
+    missing = neighbors == n
+    if missing.all(axis=1).any():
+        raise ValueError("every neighbourhood needs at least one valid index")  # noqa: TRY003
+
+    m, k = neighbors.shape
+    radii, centers = np.empty(m), np.empty((m, points.shape[1]))
+    step = max(1, _BATCH_ROWS // max(k, 1))
+    for start in range(0, m, step):
+        index = neighbors[start : start + step]
+        if missing[start : start + step].any():
+            # Repeat the first valid neighbour in place of missing ones; duplicates do not change the ball.
+            chunk_missing = missing[start : start + step]
+            first = np.take_along_axis(index, chunk_missing.argmin(axis=1)[:, None], axis=1)
+            index = np.where(chunk_missing, first, index)
+        group = np.asarray(points[index], dtype=np.float64)
+        centers[start : start + step], radii[start : start + step], _ = _lockstep_balls(group, tol=tol)
+    return Balls(radii, centers)
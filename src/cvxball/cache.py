@@ -0,0 +1,301 @@
+"""Memoised enclosing-ball results keyed by point-set content.
+
+:class:`BallCache` wraps any solver with the ``solver(points, **options)``
+signature of :func:`cvxball.solver.min_circle_clarabel` and reuses earlier
+results for point sets with identical content.  The key is a BLAKE2b digest of
+the array bytes together with its shape, dtype, the solver and its options, so
+two separately loaded copies of the same data hit the same entry.
+
+Results live in an in-memory LRU tier and, optionally, in an on-disk tier: a
+directory of small ``.npz`` files whose total size is capped, evicting the
+least recently used files first.  Hashing streams over the array in blocks and
+runs at memory bandwidth, which is orders of magnitude cheaper than a solve.
+"""
+
+import functools
+import hashlib
+import os
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from cvxball import metrics
+from cvxball.ball import Ball
+from cvxball.solver import min_circle_clarabel
+
+Solver = Callable[..., tuple[float, np.ndarray]]
+
+# Rows are hashed in blocks of about this many bytes, so non-contiguous input
+# is copied one block at a time rather than all at once.
+_HASH_BLOCK_BYTES = 1 << 24
+
+# The disk tier's size is tracked as a running total of this process's writes
+# and re-measured by listing the directory only when the total exceeds the cap
+# or after this many writes, to pick up files written by other processes.
+_RESCAN_WRITES = 256
+
+
+def content_hash(points: np.ndarray, *extra: object) -> str:
+    """Return a hex digest identifying the content, shape and dtype of ``points``.
+
+    Args:
+        points: Array to hash; any layout is accepted.
+        *extra: Additional objects whose ``repr`` is mixed into the digest
+            (for example the solver and its options).
+
+    Returns:
+        A 32-character hexadecimal BLAKE2b digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((points.shape, points.dtype.str, *extra)).encode())
+    if points.flags.c_contiguous:
+        digest.update(memoryview(points.reshape(-1)).cast("B"))
+    else:
+        row_bytes = max(1, points.itemsize * int(np.prod(points.shape[1:])))
+        step = max(1, _HASH_BLOCK_BYTES // row_bytes)
+        for start in range(0, points.shape[0], step):
+            block = np.ascontiguousarray(points[start : start + step])
+            digest.update(memoryview(block.reshape(-1)).cast("B"))
+    return digest.hexdigest()
+
+
+def _solver_name(solver: Callable[..., Any]) -> str:
+    """Stable identifier of ``solver`` for the cache key.
+
+    Raises:
+        ValueError: If ``solver`` is a lambda or nested function, whose
+            qualified name is shared by unrelated solvers.
+    """
+    if isinstance(solver, functools.partial):
+        bound = [content_hash(a) if isinstance(a, np.ndarray) else repr(a) for a in solver.args]
+        keywords = [
+            (k, content_hash(v) if isinstance(v, np.ndarray) else repr(v)) for k, v in sorted(solver.keywords.items())
+        ]
+        return f"partial({_solver_name(solver.func)}, {bound}, {keywords})"
+    qualname = getattr(solver, "__qualname__", None)
+    if qualname is None or "<lambda>" in qualname or "<locals>" in qualname:
+        raise ValueError(f"solver {solver!r} has no unique name; pass name= to identify it in the cache key")  # noqa: TRY003
+    return f"{solver.__module__}.{qualname}"
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters of a :class:`BallCache`."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Total number of lookups."""
+        return self.hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from either tier (0.0 before the first lookup)."""
+        return (self.hits + self.disk_hits) / self.lookups if self.lookups else 0.0
+
+
+class BallCache:
+    """Two-tier (memory LRU + optional disk) cache of enclosing-ball results.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.cache import BallCache
+        >>> cache = BallCache(maxsize=128)
+        >>> points = np.array([[0.0, 0.0], [2.0, 0.0]])
+        >>> radius, center = cache.solve(points)
+        >>> radius, center = cache.solve(points.copy())
+        >>> cache.stats.hit_rate
+        0.5
+    """
+
+    def __init__(self, maxsize: int = 1024, directory: str | Path | None = None, max_bytes: int = 1 << 30) -> None:
+        """Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of results held in memory.
+            directory: Optional directory for the on-disk tier; created if
+                missing.  Entries written by earlier processes are reused.
+            max_bytes: Size cap of the on-disk tier in bytes.
+        """
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory is not None else None
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._memory: OrderedDict[str, tuple[float, np.ndarray]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Running estimate of the disk tier's size (None until first measured) and writes since.
+        self._disk_bytes: int | None = None
+        self._writes_since_scan = 0
+        self._evicting = threading.Lock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        """Number of results held in the memory tier."""
+        return len(self._memory)
+
+    def key(
+        self, points: np.ndarray, solver: Solver = min_circle_clarabel, name: str | None = None, **options: Any
+    ) -> str:
+        """Return the cache key for solving ``points`` with ``solver(points, **options)``.
+
+        Raises:
+            ValueError: If ``solver`` has no stable name and ``name`` is not given.
+        """
+        return content_hash(points, _solver_name(solver) if name is None else name, sorted(options.items()))
+
+    def solve(
+        self, points: np.ndarray, solver: Solver = min_circle_clarabel, name: str | None = None, **options: Any
+    ) -> Ball:
+        """Return ``solver(points, **options)``, reusing a cached result when possible.
+
+        Args:
+            points: A numpy array of shape ``(n, d)``.
+            solver: Enclosing-ball solver; defaults to
+                :func:`~cvxball.solver.min_circle_clarabel`.
+            name: Name identifying ``solver`` in the key.  Defaults to its
+                module and qualified name (for a :func:`functools.partial`,
+                those of the wrapped function plus its bound arguments);
+                required for lambdas and nested functions, whose names are not
+                unique.
+            **options: Keyword arguments forwarded to ``solver``; they are part
+                of the key.
+
+        Returns:
+            A :class:`~cvxball.ball.Ball`.  Its ``center`` is a fresh copy,
+            so callers may modify it without corrupting the cache.
+
+        Raises:
+            ValueError: If ``solver`` has no stable name and ``name`` is not given.
+        """
+        key = self.key(points, solver, name, **options)
+        result = self._lookup(key)
+        if result is None:
+            result = solver(points, **options)
+            self._store(key, result)
+        radius, center = result
+        return Ball(radius, center.copy())
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers and reset the statistics."""
+        with self._lock:
+            self._memory.clear()
+            self.stats = CacheStats()
+        if self.directory is not None:
+            for path in self.directory.glob("*.npz"):
+                path.unlink(missing_ok=True)
+            with self._lock:
+                self._disk_bytes = 0
+
+    def _lookup(self, key: str) -> tuple[float, np.ndarray] | None:
+        """Find ``key`` in memory, then on disk, updating recency and statistics."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats.hits += 1
+                metrics.record_cache("hit")
+                return self._memory[key]
+
+        result = self._read_disk(key)
+        with self._lock:
+            if result is None:
+                self.stats.misses += 1
+                metrics.record_cache("miss")
+                return None
+            self.stats.disk_hits += 1
+            metrics.record_cache("disk_hit")
+        self._remember(key, result)
+        return result
+
+    def _store(self, key: str, result: tuple[float, np.ndarray]) -> None:
+        """Insert a freshly computed result into both tiers."""
+        radius, center = result
+        result = (float(radius), np.array(center, dtype=np.float64))
+        self._remember(key, result)
+        if self.directory is not None:
+            self._write_disk(key, result)
+
+    def _remember(self, key: str, result: tuple[float, np.ndarray]) -> None:
+        """Insert into the memory tier, evicting least recently used entries."""
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+                self.stats.evictions += 1
+
+    def _read_disk(self, key: str) -> tuple[float, np.ndarray] | None:
+        """Load ``key`` from the disk tier and mark it as recently used."""
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.npz"
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                result = float(data["radius"]), data["center"]
+            os.utime(path)
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return None
+        return result
+
+    def _write_disk(self, key: str, result: tuple[float, np.ndarray]) -> None:
+        """Atomically write ``key`` to the disk tier and enforce the size cap."""
+        assert self.directory is not None  # noqa: S101  # only called with a disk tier
+        radius, center = result
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as handle:
+            np.savez(handle, radius=radius, center=center)
+        path = self.directory / f"{key}.npz"
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(tmp, path)
+        written = path.stat().st_size
+        with self._lock:
+            self._writes_since_scan += 1
+            stale = self._disk_bytes is None or self._writes_since_scan >= _RESCAN_WRITES
+            if self._disk_bytes is not None:
+                self._disk_bytes += written - replaced
+            over = self._disk_bytes is not None and self._disk_bytes > self.max_bytes
+        if stale or over:
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Re-measure the disk tier and delete least recently used files until it fits in ``max_bytes``."""
+        assert self.directory is not None  # noqa: S101  # only called with a disk tier
+        # One writer scans at a time; the others carry on with the running total.
+        if not self._evicting.acquire(blocking=False):
+            return
+        try:
+            entries = []
+            for path in self.directory.glob("*.npz"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            evicted = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                evicted += 1
+            with self._lock:
+                self.stats.disk_evictions += evicted
+                self._disk_bytes, self._writes_since_scan = total, 0
+        finally:
+            self._evicting.release()
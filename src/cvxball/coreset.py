@@ -0,0 +1,129 @@
+"""Core-set (active-set) solver for the minimum enclosing ball.
+
+The optimal ball is determined by at most ``d + 1`` support points, so most of
+a large input is irrelevant to the solve.  :func:`min_circle_coreset` keeps a
+small *core set* of candidate support points, solves the enclosing-ball
+program on the core set only with :func:`~cvxball.solver.min_circle_clarabel`,
+scans all points for violators of the resulting ball and adds the worst of them
+to the core set, until no point lies outside the ball by more than ``tol``.
+
+Each round costs one small conic solve plus one ``O(n d)`` scan, and typically
+only a handful of rounds are needed, so the cost is dominated by the scans
+instead of an ``n``-cone program.  The scans can be split over threads (see
+:func:`cvxball.scan.parallel_violators`).  A previous core set can be passed back in to
+warm-start a related solve, which :mod:`cvxball.outliers` relies on.
+"""
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from cvxball import metrics
+from cvxball.ball import _CANCELLATION, Ball
+from cvxball.scan import _parallel_scan
+from cvxball.solver import min_circle_clarabel
+
+if TYPE_CHECKING:
+    from cvxball.scan import PointScanner
+
+
+def _initial_core(points: np.ndarray, active: np.ndarray) -> np.ndarray:
+    """Pick a cheap initial core set: the extreme active points along each axis."""
+    rows = np.flatnonzero(active)
+    members = points[rows]
+    extremes = np.concatenate([members.argmin(axis=0), members.argmax(axis=0)])
+    return np.unique(rows[extremes])
+
+
+def _coreset_ball(
+    points: np.ndarray,
+    active: np.ndarray,
+    core: np.ndarray | None = None,
+    tol: float = 1e-6,
+    max_rounds: int = 100,
+    scanner: "PointScanner | None" = None,
+    threads: int | None = 1,
+) -> tuple[Ball, np.ndarray]:
+    """Enclosing ball of the rows of ``points`` selected by ``active``.
+
+    Args:
+        points: A numpy array of shape ``(n, d)``.
+        active: Boolean mask of shape ``(n,)`` of the rows to enclose.
+        core: Optional warm-start core set (row indices); inactive rows are
+            dropped from it.
+        tol: Relative tolerance on the radius for accepting a point as inside.
+        max_rounds: Maximum number of solve/scan rounds.
+        scanner: Optional :class:`~cvxball.scan.PointScanner` over ``points``;
+            the violator scans then skip the blocks well inside the ball,
+            which pays off when many solves share the same points.
+        threads: Threads for the violator scans without a scanner, see
+            :func:`~cvxball.scan.parallel_violators`; ``None`` uses every CPU.
+
+    Returns:
+        A tuple ``(ball, core)``.  The radius of ``ball`` is the largest
+        distance from its centre to an active point (rounded up), so the ball
+        encloses all of them.
+
+    Raises:
+        ValueError: If no row is active or the rounds are exhausted.
+    """
+    if not active.any():
+        raise ValueError("need at least one point to enclose")  # noqa: TRY003
+    d = points.shape[1]
+    core = _initial_core(points, active) if core is None else np.unique(core[active[core]])
+    if core.size == 0:
+        core = _initial_core(points, active)
+    batch = 2 * (d + 1)
+
+    for _ in range(max_rounds):
+        ball = min_circle_clarabel(points[core])
+        if scanner is None:
+            _, farthest, violators, distance = _parallel_scan(
+                points, ball.center, ball.radius * (1.0 + tol), active, threads
+            )
+            farthest, distance = float(np.sqrt(max(farthest, 0.0))), np.sqrt(distance)
+        else:
+            violators, distance = scanner.violators(ball.center, ball.radius * (1.0 + tol), mask=active)
+        # Core points poking out only reflect the accuracy of the conic solve.
+        outside = ~np.isin(violators, core)
+        violators, distance = violators[outside], distance[outside]
+        if violators.size == 0:
+            if scanner is not None:
+                # The indexed scan only reports violators; the farthest distance needs its own query.
+                farthest = scanner.farthest(ball.center, mask=active)[1]
+            # The scan's distances are accurate to about _CANCELLATION; round up by that.
+            return Ball(float(max(farthest, 0.0) * (1.0 + _CANCELLATION)), ball.center), core
+        if violators.size > batch:
+            violators = violators[np.argpartition(distance, -batch)[-batch:]]
+        core = np.union1d(core, violators)
+
+    raise ValueError(f"core-set solver did not converge in {max_rounds} rounds")  # noqa: TRY003
+
+
+@metrics.instrument
+def min_circle_coreset(points: np.ndarray, tol: float = 1e-6, threads: int | None = 1) -> tuple[Ball, np.ndarray]:
+    """Compute the smallest enclosing ball by solving on a growing core set.
+
+    Args:
+        points: A numpy array of shape ``(n, d)`` with ``n >= 1``.
+        tol: Relative radius tolerance; a point farther than
+            ``radius * (1 + tol)`` from the core-set centre is a violator.
+        threads: Number of threads sharing each violator scan; ``None`` uses
+            every CPU.
+
+    Returns:
+        A tuple ``(ball, core)`` of the enclosing :class:`~cvxball.ball.Ball`
+        and the row indices of the final core set.  The ball's radius is the
+        largest distance from its centre, so it encloses every point and
+        exceeds the optimum by at most a factor ``1 + tol`` (up to the
+        accuracy of the conic solves).
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.coreset import min_circle_coreset
+        >>> points = np.random.default_rng(0).standard_normal((10_000, 3))
+        >>> ball, core = min_circle_coreset(points)
+        >>> bool(ball.contains(points).all()), core.size < 100
+        (True, True)
+    """
+    return _coreset_ball(points, np.ones(points.shape[0], dtype=bool), tol=tol, threads=threads)
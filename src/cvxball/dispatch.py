@@ -0,0 +1,355 @@
+"""Automatic choice of the enclosing-ball algorithm from a calibrated cost model.
+
+cvxball offers several algorithms for the same problem, and which one is
+fastest depends on the input: the conic solvers are hard to beat on a few
+hundred points, the core-set solver wins by orders of magnitude on large
+inputs, and the grid solver streams 2-D and 3-D clouds too large to hold
+twice in memory.  :func:`min_circle` with ``method="auto"`` picks one by:
+
+* predicting every method's run time with a linear model in the work
+  ``w = n (d + 1)``: ``t = c0 + c1 w + c2 w log10(1 / tol)``, so methods whose
+  work grows with the requested accuracy pay for it;
+* estimating every method's peak memory from its bytes per entry of the
+  input, plus a float64 copy of the input for the methods that make one, and
+  discarding the methods that would not fit in the memory available;
+* running the method with the smallest predicted time.
+
+The coefficients come from :func:`calibrate`, a small benchmark that times
+every method on random inputs and fits them by non-negative least squares.
+The shipped :data:`DEFAULT_MODEL` was fitted on a single-core x86-64 Linux
+machine; re-run :func:`calibrate` on your own hardware, :meth:`CostModel.save`
+the result and pass it as ``model``.  Every decision is logged at ``INFO``
+level on the ``cvxball.dispatch`` logger, with the predictions that led to it,
+and passing an explicit ``method`` overrides it.
+"""
+
+import json
+import logging
+import math
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from cvxball.ball import Ball
+
+logger = logging.getLogger(__name__)
+
+
+class _Method(NamedTuple):
+    """How to run one method and what it costs in memory."""
+
+    solve: Callable[[np.ndarray, float], Ball]
+    bytes_per_entry: float  # peak bytes per entry of the (n, d + 1) problem
+    copies_input: bool  # whether a float64 copy of non-float64 input is made
+    max_dim: int | None  # largest supported dimension, if limited
+    uses_tol: bool  # whether the run time depends on the tolerance
+
+
+def _cvx(points: np.ndarray, _tol: float) -> Ball:
+    from cvxball.solver import min_circle_cvx
+
+    return min_circle_cvx(points, solver="CLARABEL")
+
+
+def _clarabel(points: np.ndarray, _tol: float) -> Ball:
+    from cvxball.solver import min_circle_clarabel
+
+    return min_circle_clarabel(points)
+
+
+def _coreset(points: np.ndarray, tol: float) -> Ball:
+    from cvxball.coreset import min_circle_coreset
+
+    return min_circle_coreset(points, tol=tol)[0]
+
+
+def _grid(points: np.ndarray, tol: float) -> Ball:
+    from cvxball.grid import min_circle_grid
+
+    return min_circle_grid(points, tol=tol)[0]
+
+
+def _frank_wolfe(points: np.ndarray, tol: float) -> Ball:
+    from cvxball.batch import min_circle_batch
+
+    return min_circle_batch(points[None], tol=tol).ball(0)
+
+
+# Peak memory per entry was measured as the growth of the resident set size on
+# 4e5 x 3 inputs; the core-set, grid and Frank-Wolfe figures are dominated by
+# fixed-size scan buffers and are rounded up.
+_METHODS = {
+    "cvx": _Method(_cvx, 900.0, True, None, False),
+    "clarabel": _Method(_clarabel, 700.0, False, None, False),
+    "coreset": _Method(_coreset, 16.0, False, None, True),
+    "grid": _Method(_grid, 24.0, False, 3, True),
+    "frank_wolfe": _Method(_frank_wolfe, 40.0, True, None, True),
+}
+
+
+class CostModel(NamedTuple):
+    """Run-time coefficients ``(c0, c1, c2)`` per method, see the module docstring.
+
+    Example:
+        >>> from cvxball.dispatch import CostModel
+        >>> model = CostModel({"clarabel": (1e-3, 1e-5, 0.0)})
+        >>> round(model.predict("clarabel", n=1_000, d=3, tol=1e-6), 6)
+        0.041
+    """
+
+    coefficients: dict[str, tuple[float, float, float]]
+
+    def predict(self, method: str, n: int, d: int, tol: float) -> float:
+        """Predicted run time of ``method`` in seconds."""
+        c0, c1, c2 = self.coefficients[method]
+        work = n * (d + 1)
+        return c0 + work * (c1 + c2 * math.log10(1.0 / max(tol, 1e-16)))
+
+    def save(self, path: str | Path) -> None:
+        """Write the coefficients to a JSON file."""
+        Path(path).write_text(json.dumps(self.coefficients, indent=2))
+
+    @classmethod
+    def load(cls, path: str | Path) -> "CostModel":
+        """Read coefficients written by :meth:`save`."""
+        return cls({name: tuple(value) for name, value in json.loads(Path(path).read_text()).items()})
+
+
+# Fitted by calibrate() with its default arguments (see the module docstring).
+DEFAULT_MODEL = CostModel(
+    {
+        "cvx": (8.00e-4, 1.11e-5, 0.0),
+        "clarabel": (0.0, 8.48e-6, 0.0),
+        "coreset": (4.96e-4, 1.98e-8, 2.41e-10),
+        "grid": (5.47e-3, 3.74e-8, 6.42e-10),
+        "frank_wolfe": (8.12e-4, 2.99e-8, 0.0),
+    }
+)
+
+
+# Memory limit and usage files of the process's cgroup, for cgroup v2 and v1.  An
+# unlimited v2 group reads "max"; an unlimited v1 group reads a huge number.
+_CGROUP_FILES = (
+    ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory.current"),
+    ("/sys/fs/cgroup/memory/memory.limit_in_bytes", "/sys/fs/cgroup/memory/memory.usage_in_bytes"),
+)
+
+
+def _host_memory() -> int | None:
+    """Bytes of memory the host has available, or ``None`` if unknown."""
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _cgroup_memory() -> int | None:
+    """Bytes left under the cgroup memory limit, or ``None`` if there is no limit."""
+    for limit_file, usage_file in _CGROUP_FILES:
+        try:
+            limit = Path(limit_file).read_text().strip()
+        except OSError:
+            continue
+        if limit == "max":
+            return None
+        try:
+            usage = int(Path(usage_file).read_text())
+        except (OSError, ValueError):
+            usage = 0
+        try:
+            return max(0, int(limit) - usage)
+        except ValueError:
+            continue
+    return None
+
+
+def _available_memory() -> int | None:
+    """Bytes of memory available to a new allocation, or ``None`` if unknown.
+
+    This is the smaller of the host's available memory and what is left under
+    the cgroup limit, so containers are not sized by the host.
+    """
+    known = [memory for memory in (_host_memory(), _cgroup_memory()) if memory is not None]
+    return min(known, default=None)
+
+
+def _memory(method: str, n: int, d: int, dtype: np.dtype) -> float:
+    """Estimated peak memory of ``method`` in bytes."""
+    spec = _METHODS[method]
+    copy = 8.0 * n * d if spec.copies_input and dtype != np.float64 else 0.0
+    return spec.bytes_per_entry * n * (d + 1) + copy
+
+
+def choose_method(
+    n: int,
+    d: int,
+    dtype: np.dtype | type = np.float64,
+    tol: float = 1e-6,
+    memory: int | None = None,
+    model: CostModel | None = None,
+) -> str:
+    """Pick the method with the smallest predicted run time that fits in memory.
+
+    Args:
+        n: Number of points.
+        d: Dimension.
+        dtype: Data type of the points.
+        tol: Requested relative radius tolerance.
+        memory: Bytes available; defaults to the memory currently available
+            to the process, within its cgroup limit if it has one, and no
+            limit is applied if that is unknown.
+        model: Cost model; defaults to :data:`DEFAULT_MODEL`.
+
+    Returns:
+        The name of the chosen method, a valid ``method`` for :func:`min_circle`.
+
+    Example:
+        >>> from cvxball.dispatch import choose_method
+        >>> choose_method(n=10, d=2), choose_method(n=1_000_000, d=3)
+        ('clarabel', 'coreset')
+    """
+    model = DEFAULT_MODEL if model is None else model
+    memory = _available_memory() if memory is None else memory
+    dtype = np.dtype(dtype)
+    predictions, excluded = {}, {}
+    for name, spec in _METHODS.items():
+        if name not in model.coefficients or (spec.max_dim is not None and d > spec.max_dim):
+            continue
+        needed = _memory(name, n, d, dtype)
+        if memory is not None and needed > memory:
+            excluded[name] = needed
+            continue
+        predictions[name] = model.predict(name, n, d, tol)
+    if not predictions:
+        raise ValueError(f"no method fits in {memory} bytes for n={n}, d={d}")  # noqa: TRY003
+    choice = min(predictions, key=predictions.__getitem__)
+    logger.info(
+        "chose %s for n=%d d=%d dtype=%s tol=%g; predicted seconds %s; excluded for memory %s (available %s)",
+        choice,
+        n,
+        d,
+        dtype,
+        tol,
+        {name: float(f"{value:.3g}") for name, value in predictions.items()},
+        sorted(excluded),
+        memory,
+    )
+    return choice
+
+
+def min_circle(points: np.ndarray, method: str = "auto", tol: float = 1e-6, model: CostModel | None = None) -> Ball:
+    """Compute the smallest enclosing ball with an automatically chosen method.
+
+    Args:
+        points: A numpy array of shape ``(n, d)`` with ``n >= 1``.
+        method: ``"auto"`` to let :func:`choose_method` decide, or one of
+            ``"cvx"``, ``"clarabel"``, ``"coreset"``, ``"grid"`` and
+            ``"frank_wolfe"`` to override it.
+        tol: Relative radius tolerance for the methods that take one; the
+            conic solvers always solve to their default accuracy.
+        model: Cost model for ``"auto"``; defaults to :data:`DEFAULT_MODEL`.
+
+    Returns:
+        The enclosing :class:`~cvxball.ball.Ball`.
+
+    Raises:
+        ValueError: If ``points`` is not a non-empty ``(n, d)`` array or the
+            method is unknown.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.dispatch import min_circle
+        >>> points = np.random.default_rng(0).standard_normal((100_000, 3))
+        >>> ball = min_circle(points)
+        >>> bool(ball.contains(points).all())
+        True
+    """
+    points = np.asarray(points)
+    if points.ndim != 2 or points.shape[0] == 0:
+        raise ValueError("points must be a non-empty (n, d) array")  # noqa: TRY003
+    n, d = points.shape
+    if method == "auto":
+        method = choose_method(n, d, points.dtype, tol, model=model)
+    elif method not in _METHODS:
+        raise ValueError(f"unknown method {method!r}; choose 'auto' or one of {sorted(_METHODS)}")  # noqa: TRY003
+    else:
+        logger.info("using %s for n=%d d=%d as requested", method, n, d)
+    return _METHODS[method].solve(points, tol)
+
+
+def calibrate(
+    sizes: tuple[int, ...] = (500, 2_000, 8_000, 32_000, 128_000, 512_000),
+    dims: tuple[int, ...] = (2, 3, 8),
+    tols: tuple[float, ...] = (1e-3, 1e-8),
+    repeats: int = 3,
+    max_conic_points: int = 32_000,
+    seed: int = 0,
+) -> CostModel:
+    """Time every method on random Gaussian inputs and fit the cost model.
+
+    The run time is the fastest of ``repeats`` runs.  Each method is fitted by
+    non-negative least squares on the relative error, so small and large
+    inputs count alike.  With the defaults this takes a minute or two.
+
+    Args:
+        sizes: Numbers of points to time.
+        dims: Dimensions to time; the grid solver skips those above 3.
+        tols: Tolerances to time.
+        repeats: Runs per configuration.
+        max_conic_points: The conic solvers, which are slow on large inputs,
+            are only timed up to this many points.
+        seed: Seed of the random inputs.
+
+    Returns:
+        The fitted :class:`CostModel`.  Methods that no configuration
+        suits, such as the grid solver when every dimension is above 3, keep
+        their :data:`DEFAULT_MODEL` coefficients.
+    """
+    from scipy.optimize import nnls
+
+    rng = np.random.default_rng(seed)
+    samples: dict[str, list[tuple[list[float], float]]] = {name: [] for name in _METHODS}
+    # Warm up imports and caches so the first configuration is not penalised.
+    for spec in _METHODS.values():
+        spec.solve(rng.standard_normal((50, 2)), 1e-3)
+    for n in sizes:
+        for d in dims:
+            points = rng.standard_normal((n, d))
+            work = n * (d + 1)
+            for i, tol in enumerate(tols):
+                for name, spec in _METHODS.items():
+                    if (
+                        (spec.max_dim is not None and d > spec.max_dim)
+                        or (i > 0 and not spec.uses_tol)
+                        or (name in ("cvx", "clarabel") and n > max_conic_points)
+                    ):
+                        continue
+                    best = math.inf
+                    for _ in range(repeats):
+                        start = time.perf_counter()
+                        spec.solve(points, tol)
+                        best = min(best, time.perf_counter() - start)
+                    accuracy = math.log10(1.0 / tol) if spec.uses_tol else 0.0
+                    samples[name].append(([1.0, work, work * accuracy], best))
+
+    coefficients = dict(DEFAULT_MODEL.coefficients)
+    for name, rows in samples.items():
+        if not rows:
+            # No configuration suits this method, e.g. the grid solver with dims above 3.
+            continue
+        features = np.array([row for row, _ in rows])
+        seconds = np.array([t for _, t in rows])
+        c0, c1, c2 = nnls(features / seconds[:, None], np.ones(len(rows)))[0]
+        coefficients[name] = (float(c0), float(c1), float(c2))
+    return CostModel(coefficients)
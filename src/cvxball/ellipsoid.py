@@ -0,0 +1,215 @@
+"""Minimum-volume enclosing ellipsoids by Khachiyan's algorithm with away steps.
+
+A ball is a loose fit for an elongated cloud.  The minimum-volume enclosing
+ellipsoid (MVEE) adapts to the shape, but modelling it as a log-determinant
+program for a generic conic solver does not scale to many points.
+:func:`min_ellipsoid` instead solves the dual, a D-optimal design problem, by
+Khachiyan's first-order algorithm with the away steps of Todd and Yildirim
+("On Khachiyan's algorithm for the computation of minimum-volume enclosing
+ellipsoids", 2007):
+
+* the points are lifted to ``q_i = (p_i, 1)`` and every point gets a weight
+  ``u_i``; with ``X = sum(u_i q_i q_i^T)`` the quantity
+  ``kappa_i = q_i^T X^-1 q_i`` is at most ``d + 1`` for every point exactly
+  at the optimum, and equals ``d + 1`` on the support;
+* a *toward* step moves weight onto the point with the largest ``kappa``, an
+  *away* step moves it off the weighted point with the smallest, each by
+  exact line search, until both are within a factor ``1 + tol`` of ``d + 1``.
+
+Each step changes ``X`` by a rank-one term, so ``X^-1`` and all ``kappa`` are
+updated with the Sherman-Morrison formula at the cost of one ``O(n d)``
+matrix-vector product, and recomputed from scratch now and then to stop
+rounding from accumulating.  Points that provably cannot support the optimal
+ellipsoid (by the elimination bound of Harman and Pronzato, 2007) are dropped
+from the working set as the iteration proceeds, so later iterations only touch
+the points near the boundary.  The weights start on the ``2 d`` extreme points
+along ``d`` mutually orthogonal directions (Kumar and Yildirim, 2005).
+"""
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+from cvxball.ball import _chunk_rows
+
+# X^-1 and kappa are recomputed from the weights this often.
+_REFRESH_EVERY = 256
+
+# Points that cannot be support points are eliminated this often.
+_DROP_EVERY = 16
+
+# The final shape matrix is shrunk by this relative amount so that rounding in
+# the containment test can never leave a point outside.
+_ROUNDING = 16 * np.finfo(np.float64).eps
+
+
+class Ellipsoid(NamedTuple):
+    """The ellipsoid ``{x : (x - c)^T A (x - c) <= 1}``.
+
+    Attributes:
+        shape: The symmetric positive definite matrix ``A``, shape ``(d, d)``.
+        center: The centre ``c``, shape ``(d,)``.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.ellipsoid import Ellipsoid
+        >>> ellipsoid = Ellipsoid(np.diag([1.0, 0.25]), np.zeros(2))
+        >>> ellipsoid.contains(np.array([[0.0, 1.9], [1.1, 0.0]])).tolist()
+        [True, False]
+        >>> round(ellipsoid.volume, 6) == round(2 * np.pi, 6)
+        True
+    """
+
+    shape: np.ndarray
+    center: np.ndarray
+
+    def mahalanobis(self, points: np.ndarray) -> np.ndarray:
+        """Squared scaled distances ``(p - c)^T A (p - c)`` of the rows of ``points``, ``<= 1`` inside."""
+        out = np.empty(points.shape[0])
+        step = _chunk_rows(self.center.shape[0])
+        for start in range(0, points.shape[0], step):
+            diff = points[start : start + step] - self.center
+            out[start : start + diff.shape[0]] = np.einsum("ij,ij->i", diff @ self.shape, diff)
+        return out
+
+    def contains(self, points: np.ndarray) -> np.ndarray:
+        """Test which points lie inside the ellipsoid.
+
+        Args:
+            points: A numpy array of shape ``(m, d)``.
+
+        Returns:
+            A boolean array of shape ``(m,)``.
+        """
+        return self.mahalanobis(points) <= 1.0
+
+    @property
+    def volume(self) -> float:
+        """Volume of the ellipsoid, ``V_d / sqrt(det A)`` with ``V_d`` the unit-ball volume."""
+        d = self.center.shape[0]
+        _, logdet = np.linalg.slogdet(self.shape)
+        return float(math.exp(d / 2 * math.log(math.pi) - math.lgamma(d / 2 + 1) - logdet / 2))
+
+
+def _initial_support(points: np.ndarray) -> np.ndarray:
+    """Extreme points along ``d`` mutually orthogonal directions (Kumar-Yildirim initialisation).
+
+    Raises:
+        ValueError: If the points lie in a proper affine subspace, so that no
+            ellipsoid of positive volume encloses them.
+    """
+    d = points.shape[1]
+    basis = np.zeros((0, d))
+    chosen = []
+    scale = np.abs(points).max()
+    for _ in range(d):
+        # The coordinate axis least covered by the directions found so far.
+        residual = np.eye(d) - basis.T @ basis
+        direction = residual[:, np.argmax(np.einsum("ij,ij->j", residual, residual))]
+        projection = points @ direction
+        a, b = int(np.argmax(projection)), int(np.argmin(projection))
+        edge = points[a] - points[b]
+        edge -= basis.T @ (basis @ edge)
+        norm = float(np.linalg.norm(edge))
+        if norm <= 1e-12 * scale:
+            raise ValueError("points lie in a proper affine subspace; no ellipsoid of positive volume encloses them")  # noqa: TRY003
+        basis = np.vstack([basis, edge / norm])
+        chosen += [a, b]
+    return np.unique(chosen)
+
+
+def min_ellipsoid(points: np.ndarray, tol: float = 1e-4, max_iter: int = 100_000) -> tuple[Ellipsoid, np.ndarray]:
+    """Compute the minimum-volume enclosing ellipsoid of a point set.
+
+    Args:
+        points: A numpy array of shape ``(n, d)`` whose points are not all in
+            a hyperplane (so ``n >= d + 1``).
+        tol: Relative tolerance on ``kappa``: the iteration stops once every
+            point has ``kappa <= (1 + tol) (d + 1)`` and every weighted point
+            ``kappa >= (1 - tol) (d + 1)``.  The volume is then within a
+            factor about ``(1 + tol)^(d / 2)`` of the minimum.
+        max_iter: Maximum number of Frank-Wolfe steps.
+
+    Returns:
+        A tuple ``(ellipsoid, support)`` of the enclosing :class:`Ellipsoid`
+        and the row indices of the points carrying weight, which lie on or
+        near its boundary.  The ellipsoid is scaled so that it encloses every
+        point exactly.
+
+    Raises:
+        ValueError: If the points lie in a hyperplane or the iterations are
+            exhausted.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.ellipsoid import min_ellipsoid
+        >>> points = np.random.default_rng(0).standard_normal((10_000, 2)) * [10.0, 1.0]
+        >>> ellipsoid, support = min_ellipsoid(points)
+        >>> bool(ellipsoid.contains(points).all()), support.size < 50
+        (True, True)
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2 or points.shape[0] == 0:
+        raise ValueError("points must be a non-empty (n, d) array")  # noqa: TRY003
+    n, d = points.shape
+    m = d + 1
+
+    # Centring keeps the lifted system well conditioned for offset data.
+    shift = points.mean(axis=0)
+    lifted = np.ones((n, m))
+    np.subtract(points, shift, out=lifted[:, :d])
+    rows = np.arange(n)
+    weight = np.zeros(n)
+    initial = _initial_support(lifted[:, :d])
+    weight[initial] = 1.0 / initial.size
+
+    for iteration in range(max_iter):
+        if iteration % _REFRESH_EVERY == 0:
+            support = np.flatnonzero(weight)
+            inverse = np.linalg.inv(lifted[support].T @ (weight[support, None] * lifted[support]))
+            kappa = np.einsum("ij,ij->i", lifted @ inverse, lifted)
+
+        far = int(np.argmax(kappa))
+        near = int(np.argmin(np.where(weight > 0.0, kappa, np.inf)))
+        toward_gap, away_gap = kappa[far] / m - 1.0, 1.0 - kappa[near] / m
+        if toward_gap <= tol and away_gap <= tol:
+            break
+
+        if iteration % _DROP_EVERY == 0 and toward_gap > 0.0:
+            # Harman-Pronzato: no optimal support point has kappa below this bound.
+            bound = m * (1.0 + toward_gap / 2.0 - math.sqrt(toward_gap * (4.0 + toward_gap - 4.0 / m)) / 2.0)
+            keep = (weight > 0.0) | (kappa >= bound)
+            if not keep.all():
+                lifted, rows, weight, kappa = lifted[keep], rows[keep], weight[keep], kappa[keep]
+                far = int(np.argmax(kappa))
+                near = int(np.argmin(np.where(weight > 0.0, kappa, np.inf)))
+
+        # X' = (1 - step) X + step q q^T; an away step has a negative step.
+        if toward_gap >= away_gap:
+            index, step = far, (kappa[far] - m) / (m * (kappa[far] - 1.0))
+        else:
+            u = weight[near]
+            index = near
+            step = -min((m - kappa[near]) / (m * (kappa[near] - 1.0)), u / (1.0 - u))
+        column = inverse @ lifted[index]
+        scale = step / (1.0 - step + step * kappa[index])
+        inverse = (inverse - scale * np.outer(column, column)) / (1.0 - step)
+        kappa = (kappa - scale * (lifted @ column) ** 2) / (1.0 - step)
+        weight *= 1.0 - step
+        weight[index] += step
+        if step < 0.0 and weight[index] <= 0.0:
+            weight[index] = 0.0
+    else:
+        raise ValueError(f"ellipsoid solver did not converge in {max_iter} iterations")  # noqa: TRY003
+
+    support = np.flatnonzero(weight)
+    members = lifted[support, :d]
+    center = weight[support] @ members
+    diff = members - center
+    shape = np.linalg.inv(diff.T @ (weight[support, None] * diff)) / d
+    ellipsoid = Ellipsoid(shape, center + shift)
+    # Scale so the ellipsoid touches the farthest point, over all points including dropped ones.
+    reach = float(ellipsoid.mahalanobis(points).max())
+    ellipsoid = Ellipsoid(shape / (reach * (1.0 + _ROUNDING)), center + shift)
+    return ellipsoid, rows[support]
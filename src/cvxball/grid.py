@@ -0,0 +1,215 @@
+"""Coarse-to-fine enclosing balls of huge low-dimensional point clouds.
+
+For dense 2-D and 3-D clouds with very many points, almost every point lies
+deep inside the ball, and a uniform grid finds the few that matter without
+holding more than a thin slice of the data in memory.  :func:`min_circle_grid`
+streams over the points a few times, one block of rows at a time, so the
+input can be an ``np.memmap`` larger than memory:
+
+1. one pass finds the bounding box and a second bins the points into a grid of
+   about ``cells`` cells, recording only which cells are occupied;
+2. only the occupied cells on the boundary of the occupied region (those with
+   an empty neighbour) are kept, and the ball of the corners of these whole
+   cells gives a coarse centre ``c0``.  Every point lies in an occupied cell,
+   so the largest distance ``R0`` from ``c0`` to a corner of an occupied cell
+   bounds every point's distance;
+3. a third pass gathers the points in the thin shell at distance at least
+   ``R0 - shell_width * h`` from ``c0``, where ``h`` is the cell diagonal, and the
+   ball of the gathered points is solved with
+   :func:`~cvxball.coreset.min_circle_coreset`;
+4. a verification pass over all points measures the largest distance from
+   the refined centre.  Points outside the ball, which the thin shell can in
+   principle miss, are added and the refinement repeats, so the result
+   encloses every point and is within ``tol`` of the optimum however the
+   grid falls.
+
+The work is linear in ``n`` and the memory is bounded by the grid, one block
+of rows and the shell.
+"""
+
+import itertools
+from collections.abc import Iterator
+
+import numpy as np
+
+from cvxball import metrics
+from cvxball.ball import _CANCELLATION, Ball, _sq_distances
+from cvxball.coreset import min_circle_coreset
+
+# Rows per streamed block.
+_STREAM_ROWS = 1 << 20
+
+# Default number of grid cells; the grid arrays take about 40 bytes per cell.
+_GRID_CELLS = 1 << 18
+
+# At most this many of the worst violators are added per refinement round.
+_MAX_ADDED = 256
+
+
+def _blocks(points: np.ndarray) -> Iterator[tuple[int, np.ndarray]]:
+    """Yield ``(start, block)`` with consecutive float64 row blocks of ``points``."""
+    for start in range(0, points.shape[0], _STREAM_ROWS):
+        yield start, np.asarray(points[start : start + _STREAM_ROWS], dtype=np.float64)
+
+
+def _cell_ids(block: np.ndarray, origin: np.ndarray, size: np.ndarray, shape: tuple[int, ...]) -> np.ndarray:
+    """Flat grid cell of every row of ``block``; rows beyond the grid fall into its edge cells."""
+    coords = block - origin
+    coords /= size
+    np.floor(coords, out=coords)
+    np.clip(coords, 0, np.array(shape) - 1, out=coords)
+    # Flat indices are far below 2**53, so the float product is exact.
+    strides = np.array([np.prod(shape[axis + 1 :]) for axis in range(len(shape))], dtype=np.float64)
+    cells: np.ndarray = (coords @ strides).astype(np.intp)
+    return cells
+
+
+def _boundary(occupied: np.ndarray) -> np.ndarray:
+    """Occupied cells with at least one empty neighbour, counting cells beyond the grid as empty."""
+    padded = np.pad(occupied, 1)
+    exposed = np.zeros_like(occupied)
+    for offset in itertools.product((0, 1, 2), repeat=occupied.ndim):
+        window = tuple(slice(o, o + n) for o, n in zip(offset, occupied.shape, strict=True))
+        exposed |= ~padded[window]
+    boundary: np.ndarray = occupied & exposed
+    return boundary
+
+
+def _isin_sorted(values: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """Which ``values`` occur in the sorted array ``keys``."""
+    if keys.size == 0:
+        return np.zeros(values.shape, dtype=bool)
+    position = np.minimum(np.searchsorted(keys, values), keys.size - 1)
+    found: np.ndarray = keys[position] == values
+    return found
+
+
+def _corners(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """All ``2^d`` corners of the boxes ``[lo, hi]``, shape ``(m 2^d, d)``."""
+    d = lo.shape[1]
+    pick = np.array(list(itertools.product((False, True), repeat=d)))
+    return np.where(pick[None, :, :], hi[:, None, :], lo[:, None, :]).reshape(-1, d)
+
+
+@metrics.instrument
+def min_circle_grid(
+    points: np.ndarray,
+    cells: int = _GRID_CELLS,
+    shell_width: float = 2.0,
+    tol: float = 1e-6,
+    max_rounds: int = 100,
+) -> tuple[Ball, np.ndarray]:
+    """Compute the smallest enclosing ball of a dense low-dimensional cloud by grid coarsening.
+
+    Args:
+        points: An array of shape ``(n, d)`` with ``n >= 1`` and
+            ``1 <= d <= 3``; anything that supports slicing rows, such as an
+            ``np.memmap``, is streamed block by block.
+        cells: Approximate number of grid cells.
+        shell_width: Width of the refinement shell in cell diagonals, at least 1.
+            A wider shell gathers more points but rarely needs a second
+            verification pass.
+        tol: Relative radius tolerance of the refinement solves.
+        max_rounds: Maximum number of refine/verify rounds.
+
+    Returns:
+        A tuple ``(ball, core)`` of the enclosing :class:`~cvxball.ball.Ball`
+        and the row indices of the final core set.  The radius is the largest
+        distance from the centre to any point (rounded up), so the ball
+        encloses every point and is within a factor ``1 + tol`` of the
+        optimum.
+
+    Raises:
+        ValueError: If the input is empty or not 1- to 3-dimensional, the
+            options are out of range, or the rounds are exhausted.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.grid import min_circle_grid
+        >>> points = np.random.default_rng(0).uniform(-1, 1, (200_000, 2))
+        >>> ball, core = min_circle_grid(points)
+        >>> bool(ball.contains(points).all()), round(ball.radius, 2)
+        (True, 1.41)
+    """
+    points = np.asarray(points)
+    if points.ndim != 2 or points.shape[0] == 0 or not 1 <= points.shape[1] <= 3:
+        raise ValueError("points must be a non-empty (n, d) array with 1 <= d <= 3")  # noqa: TRY003
+    if cells < 1:
+        raise ValueError("cells must be at least 1")  # noqa: TRY003
+    if shell_width < 1.0:
+        raise ValueError("shell_width must be at least 1 cell diagonal")  # noqa: TRY003
+    d = points.shape[1]
+
+    # Pass 1: bounding box.
+    lower, upper = np.full(d, np.inf), np.full(d, -np.inf)
+    for _, block in _blocks(points):
+        # Column-wise reductions are much faster than block.min(axis=0) on narrow rows.
+        for axis in range(d):
+            lower[axis] = np.minimum(lower[axis], block[:, axis].min())
+            upper[axis] = np.maximum(upper[axis], block[:, axis].max())
+    if not (np.isfinite(lower).all() and np.isfinite(upper).all()):
+        raise ValueError("points must be finite")  # noqa: TRY003
+
+    # Square-ish cells: the number per axis follows the extent of the box.
+    extent = upper - lower
+    per_axis = np.ones(d, dtype=int)
+    if extent.any():
+        spread = np.maximum(extent, extent.max() * 1e-6)
+        per_axis = np.maximum(1, np.floor(spread * (cells / np.prod(spread)) ** (1.0 / d))).astype(int)
+    shape = tuple(int(n) for n in per_axis)
+    size = np.where(extent > 0, extent / per_axis, 1.0)
+
+    # Pass 2: occupied cells.
+    occupied = np.zeros(shape, dtype=bool)
+    for _, block in _blocks(points):
+        occupied.reshape(-1)[_cell_ids(block, lower, size, shape)] = True
+
+    # Coarse centre from the corners of the boundary cells; every point lies in an occupied cell.
+    box_lo = lower + np.argwhere(occupied) * size
+    box_hi = box_lo + size
+    edge = _boundary(occupied)[occupied]
+    coarse, _ = min_circle_coreset(_corners(box_lo[edge], box_hi[edge]), tol=1e-3)
+    far_sq = np.maximum((box_lo - coarse.center) ** 2, (box_hi - coarse.center) ** 2).sum(axis=1)
+    far = np.sqrt(far_sq)
+    threshold = far.max() - shell_width * float(np.linalg.norm(size))
+
+    # Pass 3: gather the points in the shell (all of them if the shell reaches past c0).
+    gathered = []
+    for start, block in _blocks(points):
+        for offset, d2 in _sq_distances(block, coarse.center):
+            gathered.append(start + offset + np.flatnonzero(d2 >= threshold * abs(threshold)))
+    rows = np.concatenate(gathered)
+    members = np.asarray(points[rows], dtype=np.float64)
+
+    # Refine on the shell, verify on everything, and add what the shell missed.
+    for _ in range(max_rounds):
+        ball, core = min_circle_coreset(members, tol=tol)
+        limit_sq = ball.radius * ball.radius
+        best_sq = 0.0
+        known = np.sort(rows)
+        found, found_d2 = [np.empty(0, dtype=np.intp)], [np.empty(0)]
+        for start, block in _blocks(points):
+            for offset, d2 in _sq_distances(block, ball.center):
+                best_sq = max(best_sq, float(d2.max()))
+                hits = np.flatnonzero(d2 > limit_sq)
+                # Gathered points poking out only reflect the accuracy of the conic solves;
+                # dropping them before the trim below keeps them from crowding out real misses.
+                hits = hits[~_isin_sorted(start + offset + hits, known)]
+                found.append(start + offset + hits)
+                found_d2.append(d2[hits])
+            if sum(part.size for part in found) > 2 * _MAX_ADDED:
+                # Keep only the worst violators so far, so memory stays bounded.
+                violators, distance = np.concatenate(found), np.concatenate(found_d2)
+                worst = np.argpartition(distance, -_MAX_ADDED)[-_MAX_ADDED:]
+                found, found_d2 = [violators[worst]], [distance[worst]]
+        violators, distance = np.concatenate(found), np.concatenate(found_d2)
+        if violators.size == 0:
+            # The scan's distances are accurate to about _CANCELLATION; round up by that.
+            radius = float(np.sqrt(best_sq) * (1.0 + _CANCELLATION))
+            return Ball(max(radius, ball.radius), ball.center), rows[core]
+        if violators.size > _MAX_ADDED:
+            violators = violators[np.argpartition(distance, -_MAX_ADDED)[-_MAX_ADDED:]]
+        rows = np.concatenate([rows, violators])
+        members = np.concatenate([members, np.asarray(points[violators], dtype=np.float64)])
+
+    raise ValueError(f"grid solver did not converge in {max_rounds} rounds")  # noqa: TRY003
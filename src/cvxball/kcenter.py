@@ -0,0 +1,168 @@
+"""Minimax k-center clustering refined with enclosing balls.
+
+:func:`k_center` seeds ``k`` centres with Gonzalez' farthest-first traversal,
+which is a 2-approximation of the optimal k-center radius, and then alternates
+
+1. assigning every point to its nearest centre, cluster by cluster: if a
+   point is at distance ``u`` from its current centre, its nearest centre is
+   within ``2 u`` of that centre, so each cluster's points are compared, with
+   one ``|p|^2 - 2 P C^T + |c|^2`` matrix product per block of rows, only
+   against the centres near it rather than all ``k`` of them, and
+2. moving every centre to the centre of the minimum enclosing ball of its
+   cluster, all clusters at once through the segmented solver of
+   :mod:`cvxball.batch`,
+
+until the largest cluster radius stops decreasing.  Neither step can increase
+the largest radius, so the iteration is monotone.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from cvxball.batch import _segment_balls
+
+# Rows per assignment block are chosen so that one block of squared distances
+# to all centres is about this large.
+_ASSIGN_BYTES = 1 << 24
+
+
+class Clustering(NamedTuple):
+    """Result of :func:`k_center`.
+
+    Attributes:
+        centers: Cluster centres, shape ``(k, d)``.
+        radii: Radius of every cluster's enclosing ball, shape ``(k,)``;
+            ``0.0`` for empty clusters.
+        labels: Cluster of every point, shape ``(n,)``.
+    """
+
+    centers: np.ndarray
+    radii: np.ndarray
+    labels: np.ndarray
+
+    @property
+    def radius(self) -> float:
+        """The k-center objective: the largest cluster radius."""
+        return float(self.radii.max())
+
+
+def _gonzalez(points: np.ndarray, k: int, first: int) -> tuple[np.ndarray, np.ndarray]:
+    """Farthest-first traversal.
+
+    Squared distances use ``|p|^2 - 2 p.c + |c|^2`` with the norms computed
+    once, so each of the ``k`` passes is a single matrix-vector product.
+    Seeding only needs the farthest point approximately, so the cancellation
+    this expansion can suffer is harmless here.
+
+    Returns:
+        A tuple ``(seeds, labels)`` of the row indices of the ``k`` seeds and
+        the nearest seed of every point.
+    """
+    seeds = np.empty(k, dtype=np.intp)
+    seeds[0] = first
+    p_sq = np.einsum("ij,ij->i", points, points)
+    labels = np.zeros(points.shape[0], dtype=np.intp)
+    nearest = np.full(points.shape[0], np.inf)
+    d2 = np.empty(points.shape[0])
+    for i in range(k):
+        seed = seeds[i]
+        np.matmul(points, -2.0 * points[seed], out=d2)
+        d2 += p_sq
+        d2 += p_sq[seed]
+        closer = d2 < nearest
+        labels[closer] = i
+        np.minimum(nearest, d2, out=nearest)
+        if i + 1 < k:
+            seeds[i + 1] = int(np.argmax(nearest))
+    return seeds, labels
+
+
+def _assign(points: np.ndarray, labels: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """Nearest centre of every point, searching only centres near the current one.
+
+    Args:
+        points: The points, shape ``(n, d)``.
+        labels: Current centre of every point, shape ``(n,)``.
+        centers: Centres, shape ``(k, d)``.
+
+    Returns:
+        The new labels, shape ``(n,)``.
+    """
+    k = centers.shape[0]
+    c_sq = np.einsum("ij,ij->i", centers, centers)
+    order = np.argsort(labels, kind="stable")
+    bounds = np.zeros(k + 1, dtype=np.intp)
+    np.cumsum(np.bincount(labels, minlength=k), out=bounds[1:])
+    result = labels.copy()
+    for own in np.flatnonzero(np.diff(bounds)):
+        members = order[bounds[own] : bounds[own + 1]]
+        block = points[members]
+        diff = block - centers[own]
+        reach = 4.0 * np.einsum("ij,ij->i", diff, diff).max()
+        offset = centers - centers[own]
+        candidates = np.flatnonzero(np.einsum("ij,ij->i", offset, offset) <= reach)
+        step = max(1, _ASSIGN_BYTES // (8 * candidates.size))
+        for start in range(0, members.size, step):
+            rows = members[start : start + step]
+            d2 = c_sq[candidates] - 2.0 * (block[start : start + step] @ centers[candidates].T)
+            result[rows] = candidates[np.argmin(d2, axis=1)]
+    return result
+
+
+def _refine(points: np.ndarray, labels: np.ndarray, centers: np.ndarray, tol: float) -> tuple[np.ndarray, np.ndarray]:
+    """Enclosing ball of every non-empty cluster; empty clusters keep their centre."""
+    order = np.argsort(labels, kind="stable")
+    counts = np.bincount(labels, minlength=centers.shape[0])
+    present = np.flatnonzero(counts)
+    starts = np.concatenate([[0], np.cumsum(counts[present])[:-1]])
+    balls, radii_present, _ = _segment_balls(points[order], starts, tol=tol)
+    centers, radii = centers.copy(), np.zeros(centers.shape[0])
+    centers[present], radii[present] = balls, radii_present
+    return centers, radii
+
+
+def k_center(points: np.ndarray, k: int, tol: float = 1e-4, max_iter: int = 100, first: int = 0) -> Clustering:
+    """Cluster ``points`` into ``k`` groups minimising the largest enclosing radius.
+
+    Args:
+        points: A numpy array of shape ``(n, d)``.
+        k: Number of clusters, ``1 <= k <= n``.
+        tol: Stop once an iteration shrinks the largest radius by less than
+            this relative amount; also the accuracy of the per-cluster balls.
+        max_iter: Maximum number of assign/refine iterations.
+        first: Row of the first Gonzalez seed.
+
+    Returns:
+        A :class:`Clustering` with centres, per-cluster radii and labels.  Every
+        point lies in the ball of its cluster.
+
+    Raises:
+        ValueError: If ``k`` is out of range.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.kcenter import k_center
+        >>> rng = np.random.default_rng(0)
+        >>> points = np.vstack([rng.normal(loc, 0.1, (500, 2)) for loc in (-5, 0, 5)])
+        >>> result = k_center(points, k=3)
+        >>> np.unique(result.labels).size, result.radius < 0.5
+        (3, True)
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n = points.shape[0]
+    if not 1 <= k <= n:
+        raise ValueError(f"k must satisfy 1 <= k <= n = {n}, got {k}")  # noqa: TRY003
+
+    seeds, labels = _gonzalez(points, k, first)
+    centers = points[seeds]
+    centers, radii = _refine(points, labels, centers, tol)
+    best = Clustering(centers, radii, labels)
+    for _ in range(max_iter):
+        labels = _assign(points, labels, centers)
+        centers, radii = _refine(points, labels, centers, tol)
+        candidate = Clustering(centers, radii, labels)
+        if candidate.radius >= (1.0 - tol) * best.radius:
+            return candidate if candidate.radius < best.radius else best
+        best = candidate
+    return best
@@ -0,0 +1,330 @@
+"""Opt-in, process-wide metrics for the solvers.
+
+Collection is off by default.  While it is off, every instrumented call pays
+one attribute check and nothing is recorded.  After :func:`enable` the
+registry collects:
+
+* ``cvxball_solves_total{method}``: calls of each instrumented solver, named
+  after the function (``min_circle_clarabel``, ``min_circle_coreset``, ...).
+  Solvers that call other solvers, such as the core-set solver's Clarabel
+  solves, are counted under both;
+* ``cvxball_failures_total{method, error}``: calls that raised, by exception
+  type;
+* ``cvxball_solve_seconds{method, n, d}``: a latency histogram per size
+  bucket.  ``n`` is the next power of ten at or above the number of points,
+  and ``d`` is the dimension up to 3, then the next power of two;
+* ``cvxball_clarabel_status_total{status}`` and
+  ``cvxball_clarabel_iterations``: the status and iteration count of every
+  Clarabel solve;
+* ``cvxball_cache_lookups_total{result}``: :class:`~cvxball.cache.BallCache`
+  lookups by outcome (``hit``, ``disk_hit`` or ``miss``).
+
+Updates go to one of a fixed number of shards, assigned to each thread in
+turn on its first update, and each shard has its own lock.  Concurrent solver
+threads therefore rarely contend, and memory does not grow with the number of
+threads.  :func:`snapshot`
+merges the shards into a :class:`Snapshot`, :func:`reset` returns one and
+clears the shards, and :func:`to_prometheus` renders a snapshot in the
+Prometheus text exposition format.
+"""
+
+import bisect
+import functools
+import itertools
+import math
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple, ParamSpec, TypeVar
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+Labels = tuple[tuple[str, str], ...]
+
+# Number of independently locked shards; threads take them in turn as they first record.
+_SHARDS = 16
+
+# Upper bucket bounds of the histograms, by metric name; a +Inf bucket follows.
+_BUCKETS = {
+    "cvxball_solve_seconds": (1e-4, 3e-4, 1e-3, 3e-3, 1e-2, 3e-2, 0.1, 0.3, 1.0, 3.0, 10.0, 30.0, 100.0),
+    "cvxball_clarabel_iterations": (5.0, 10.0, 15.0, 20.0, 30.0, 50.0, 100.0, 200.0),
+}
+
+_HELP = {
+    "cvxball_solves_total": ("counter", "Solver calls by method."),
+    "cvxball_failures_total": ("counter", "Solver calls that raised, by method and exception type."),
+    "cvxball_solve_seconds": ("histogram", "Solver wall time in seconds by method and (n, d) bucket."),
+    "cvxball_clarabel_status_total": ("counter", "Clarabel solves by final status."),
+    "cvxball_clarabel_iterations": ("histogram", "Interior-point iterations per Clarabel solve."),
+    "cvxball_cache_lookups_total": ("counter", "BallCache lookups by outcome."),
+}
+
+
+class Histogram(NamedTuple):
+    """Observations of one histogram series.
+
+    Attributes:
+        bounds: Upper bounds of the finite buckets.
+        counts: Observations per bucket, not cumulative; the last entry is the
+            ``+Inf`` bucket.
+        total: Sum of the observations.
+        observations: Number of observations.
+    """
+
+    bounds: tuple[float, ...]
+    counts: tuple[int, ...]
+    total: float
+    observations: int
+
+    @property
+    def mean(self) -> float:
+        """Average observation (0.0 before the first one)."""
+        return self.total / self.observations if self.observations else 0.0
+
+
+class Snapshot(NamedTuple):
+    """Merged metric values at one point in time.
+
+    Attributes:
+        counters: Counter values keyed by ``(name, labels)``.
+        histograms: Histograms keyed by ``(name, labels)``.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball import metrics
+        >>> from cvxball.solver import min_circle_clarabel
+        >>> metrics.enable()
+        >>> _ = metrics.reset()
+        >>> radius, center = min_circle_clarabel(np.array([[0.0, 0.0], [2.0, 0.0]]))
+        >>> snapshot = metrics.snapshot()
+        >>> snapshot.counter("cvxball_solves_total", method="min_circle_clarabel")
+        1.0
+        >>> snapshot.counter("cvxball_clarabel_status_total", status="Solved")
+        1.0
+        >>> metrics.disable()
+    """
+
+    counters: dict[tuple[str, Labels], float]
+    histograms: dict[tuple[str, Labels], Histogram]
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Sum of the counter ``name`` over the series matching ``labels``."""
+        wanted = set(labels.items())
+        return sum(value for (key, series), value in self.counters.items() if key == name and wanted <= set(series))
+
+    def histogram(self, name: str, **labels: str) -> Histogram | None:
+        """The histogram ``name`` merged over the series matching ``labels``, or ``None`` if there is none."""
+        wanted = set(labels.items())
+        matches = [h for (key, series), h in self.histograms.items() if key == name and wanted <= set(series)]
+        if not matches:
+            return None
+        counts = tuple(sum(column) for column in zip(*(h.counts for h in matches), strict=True))
+        return Histogram(matches[0].bounds, counts, sum(h.total for h in matches), sum(h.observations for h in matches))
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of cache lookups answered from either tier (0.0 before the first lookup)."""
+        lookups = self.counter("cvxball_cache_lookups_total")
+        misses = self.counter("cvxball_cache_lookups_total", result="miss")
+        return (lookups - misses) / lookups if lookups else 0.0
+
+
+class _Series:
+    """Running bucket counts, sum and number of observations of one histogram series."""
+
+    def __init__(self, buckets: int) -> None:
+        self.counts = [0] * buckets
+        self.total = 0.0
+        self.observations = 0
+
+    def add(self, other: "_Series") -> None:
+        """Add the observations of ``other`` to this series."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        self.total += other.total
+        self.observations += other.observations
+
+
+class _Shard:
+    """One lock and the metric values recorded under it."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.counters: dict[tuple[str, Labels], float] = {}
+        self.histograms: dict[tuple[str, Labels], _Series] = {}
+
+
+class Registry:
+    """Sharded store of counters and histograms, see the module docstring."""
+
+    def __init__(self) -> None:
+        """Create an empty, disabled registry."""
+        self.enabled = False
+        self._shards = [_Shard() for _ in range(_SHARDS)]
+        # Thread identifiers are aligned addresses, so they cannot pick a shard by themselves.
+        self._local = threading.local()
+        self._next = itertools.count()
+
+    def _shard(self) -> _Shard:
+        try:
+            shard: _Shard = self._local.shard
+        except AttributeError:
+            self._local.shard = shard = self._shards[next(self._next) % _SHARDS]
+        return shard
+
+    def inc(self, name: str, labels: Labels = (), value: float = 1.0) -> None:
+        """Add ``value`` to the counter ``name`` with ``labels``."""
+        shard = self._shard()
+        key = (name, labels)
+        with shard.lock:
+            shard.counters[key] = shard.counters.get(key, 0.0) + value
+
+    def observe(self, name: str, labels: Labels, value: float) -> None:
+        """Record ``value`` in the histogram ``name`` with ``labels``."""
+        bounds = _BUCKETS[name]
+        bucket = bisect.bisect_left(bounds, value)
+        shard = self._shard()
+        key = (name, labels)
+        with shard.lock:
+            series = shard.histograms.get(key)
+            if series is None:
+                series = shard.histograms[key] = _Series(len(bounds) + 1)
+            series.counts[bucket] += 1
+            series.total += value
+            series.observations += 1
+
+    def snapshot(self, reset: bool = False) -> Snapshot:
+        """Merge the shards into a :class:`Snapshot`, clearing them if ``reset``."""
+        counters: dict[tuple[str, Labels], float] = {}
+        merged: dict[tuple[str, Labels], _Series] = {}
+        for shard in self._shards:
+            with shard.lock:
+                shard_counters, shard_histograms = shard.counters, shard.histograms
+                if reset:
+                    shard.counters, shard.histograms = {}, {}
+                else:
+                    shard_counters = dict(shard_counters)
+                    # Merging into a fresh series below copies the live ones while the lock is held.
+                    for key, series in shard_histograms.items():
+                        merged.setdefault(key, _Series(len(series.counts))).add(series)
+                    shard_histograms = {}
+            for key, value in shard_counters.items():
+                counters[key] = counters.get(key, 0.0) + value
+            for key, series in shard_histograms.items():
+                merged.setdefault(key, _Series(len(series.counts))).add(series)
+        histograms = {
+            key: Histogram(_BUCKETS[key[0]], tuple(series.counts), series.total, series.observations)
+            for key, series in merged.items()
+        }
+        return Snapshot(counters, histograms)
+
+
+REGISTRY = Registry()
+
+
+def enable() -> None:
+    """Start collecting metrics in :data:`REGISTRY`."""
+    REGISTRY.enabled = True
+
+
+def disable() -> None:
+    """Stop collecting metrics; the values collected so far are kept."""
+    REGISTRY.enabled = False
+
+
+def snapshot() -> Snapshot:
+    """Current values of all metrics."""
+    return REGISTRY.snapshot()
+
+
+def reset() -> Snapshot:
+    """Clear all metrics, returning their values just before."""
+    return REGISTRY.snapshot(reset=True)
+
+
+def _size_labels(points: Any) -> Labels:
+    """The ``(n, d)`` bucket labels of an ``(..., n, d)`` input, or none if it has no such shape."""
+    shape: tuple[int, ...] = getattr(points, "shape", ())
+    if len(shape) < 2:
+        return ()
+    n, d = int(shape[-2]), int(shape[-1])
+    n_bucket = 10 ** max(0, math.ceil(math.log10(max(n, 1))))
+    d_bucket = d if d <= 3 else 1 << (d - 1).bit_length()
+    return (("n", str(n_bucket)), ("d", str(d_bucket)))
+
+
+def instrument(func: Callable[_P, _R]) -> Callable[_P, _R]:
+    """Decorate a solver taking the points first so its calls, failures and latency are recorded."""
+    method = (("method", getattr(func, "__name__", repr(func))),)
+
+    @functools.wraps(func)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        if not REGISTRY.enabled:
+            return func(*args, **kwargs)
+        REGISTRY.inc("cvxball_solves_total", method)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as error:
+            REGISTRY.inc("cvxball_failures_total", (*method, ("error", type(error).__name__)))
+            raise
+        finally:
+            labels = method + (_size_labels(args[0]) if args else ())
+            REGISTRY.observe("cvxball_solve_seconds", labels, time.perf_counter() - start)
+
+    return wrapper
+
+
+def record_clarabel(solution: Any) -> None:
+    """Record the status and iteration count of a ``clarabel.DefaultSolution``."""
+    if REGISTRY.enabled:
+        REGISTRY.inc("cvxball_clarabel_status_total", (("status", str(solution.status)),))
+        REGISTRY.observe("cvxball_clarabel_iterations", (), float(solution.iterations))
+
+
+def record_cache(result: str) -> None:
+    """Record a cache lookup with outcome ``hit``, ``disk_hit`` or ``miss``."""
+    if REGISTRY.enabled:
+        REGISTRY.inc("cvxball_cache_lookups_total", (("result", result),))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for _, value in labels)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped, strict=True)) + "}"
+
+
+def _format_value(value: float) -> str:
+    return "+Inf" if value == math.inf else repr(float(value))
+
+
+def to_prometheus(values: Snapshot | None = None) -> str:
+    """Render metrics in the Prometheus text exposition format (version 0.0.4).
+
+    Args:
+        values: The snapshot to render; defaults to the current values.
+
+    Returns:
+        The exposition text, ending with a newline.
+    """
+    values = snapshot() if values is None else values
+    names = sorted({name for name, _ in values.counters} | {name for name, _ in values.histograms})
+    lines = []
+    for name in names:
+        kind, description = _HELP.get(name, ("untyped", name))
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+        for (key, labels), value in sorted(values.counters.items()):
+            if key == name:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        for (key, labels), histogram in sorted(values.histograms.items()):
+            if key != name:
+                continue
+            cumulative = 0
+            for bound, count in zip((*histogram.bounds, math.inf), histogram.counts, strict=True):
+                cumulative += count
+                bucket = (*labels, ("le", _format_value(bound)))
+                lines.append(f"{name}_bucket{_format_labels(bucket)} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.total)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.observations}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,90 @@
+"""Enclosing balls that ignore the ``k`` worst points.
+
+A single spurious point can blow up the minimum enclosing ball.  Finding the
+smallest ball that encloses all but ``k`` points exactly is combinatorial, so
+:func:`min_circle_outliers` uses greedy peeling instead: at every step one of
+the current support points is removed, namely the one whose removal shrinks
+the ball the most.  Only support points can shrink the ball, and there are at
+most a few ``d + 1`` of them, so each candidate is scored by re-solving on the
+current core set alone (see :mod:`cvxball.coreset`), which is tiny.  The full
+point set is touched only to verify the new ball, warm-started from the
+previous core set, so a step costs a few small conic solves plus a scan, and
+the method scales to millions of points.  The scans go through a
+:class:`~cvxball.scan.PointScanner` built once, so they skip the interior of
+the cloud.
+"""
+
+import numpy as np
+
+from cvxball.ball import Ball
+from cvxball.coreset import _coreset_ball
+from cvxball.scan import PointScanner
+from cvxball.solver import min_circle_clarabel
+
+# Core points within this relative distance of the sphere count as support.
+_SUPPORT = 1e-6
+
+
+def _peel_candidates(points: np.ndarray, ball: Ball, core: np.ndarray) -> np.ndarray:
+    """Core points on the boundary of their own ball about ``ball.center``, farthest first (at most ``2 (d + 1)``).
+
+    The boundary is measured against the farthest core point rather than
+    ``ball.radius``, which may come from a non-core point up to ``1 + tol``
+    farther out; the farthest core point is therefore always a candidate.
+    """
+    distance = Ball(0.0, ball.center).signed_distance(points[core])
+    order = np.argsort(-distance, kind="stable")
+    on_sphere = distance[order] >= distance[order[0]] * (1.0 - _SUPPORT)
+    candidates: np.ndarray = core[order[on_sphere][: 2 * (points.shape[1] + 1)]]
+    return candidates
+
+
+def min_circle_outliers(points: np.ndarray, k: int, tol: float = 1e-6) -> tuple[Ball, np.ndarray]:
+    """Compute a small ball enclosing all but ``k`` points by greedy peeling.
+
+    Args:
+        points: A numpy array of shape ``(n, d)``.
+        k: Number of points to exclude, ``0 <= k < n``.
+        tol: Relative radius tolerance of the core-set solves.
+
+    Returns:
+        A tuple ``(ball, excluded)``.  ``ball`` encloses every point not in
+        ``excluded`` (its radius is the largest remaining distance), and
+        ``excluded`` holds the row indices of the ``k`` ignored points in the
+        order they were peeled.
+
+    Raises:
+        ValueError: If ``k`` is out of range.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.outliers import min_circle_outliers
+        >>> points = np.random.default_rng(0).uniform(-1, 1, (10_000, 2))
+        >>> points[:2] = [[50.0, 0.0], [0.0, -80.0]]
+        >>> ball, excluded = min_circle_outliers(points, k=2)
+        >>> sorted(excluded.tolist()), ball.radius < 1.5
+        ([0, 1], True)
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n = points.shape[0]
+    if not 0 <= k < n:
+        raise ValueError(f"k must satisfy 0 <= k < n = {n}, got {k}")  # noqa: TRY003
+
+    active = np.ones(n, dtype=bool)
+    # Every peeling step scans the same points again, so index them once.
+    scanner = PointScanner(points) if k > 0 else None
+    ball, core = _coreset_ball(points, active, tol=tol, scanner=scanner)
+    excluded = np.empty(k, dtype=np.intp)
+    for step in range(k):
+        best, best_radius = -1, np.inf
+        for candidate in _peel_candidates(points, ball, core):
+            rest = core[core != candidate]
+            radius = min_circle_clarabel(points[rest]).radius if rest.size > 1 else 0.0
+            if radius < best_radius:
+                best, best_radius = int(candidate), radius
+        if best < 0:
+            raise ValueError(f"no support point to peel at step {step}")  # noqa: TRY003
+        excluded[step] = best
+        active[best] = False
+        ball, core = _coreset_ball(points, active, core, tol=tol, scanner=scanner)
+    return ball, excluded
@@ -0,0 +1,146 @@
+"""Concurrent Clarabel solves for batches of independent problems.
+
+:func:`solve_many` runs :func:`~cvxball.solver.min_circle_clarabel` on many
+independent point sets at once.  Each solve assembles its program in NumPy
+and then spends almost all of its time inside ``DefaultSolver.solve``.  If the
+Clarabel binding releases the GIL there, solves run in parallel in a thread
+pool, which avoids a process pool's start-up cost and the pickling of every
+input and result.
+
+Whether the GIL is released depends on the installed binding, so
+:func:`clarabel_releases_gil` checks it once per process.  A probe solve runs
+in a background thread while the calling thread wakes up every millisecond.
+If the wake-ups stall for most of the solve, the binding holds the GIL, and
+``backend="auto"`` falls back to a process pool.
+
+The scaling is measured by ``tests/benchmarks/test_thread_scaling.py``, which
+solves 8 problems of 2,000 points in 3-D with one worker and with several,
+and records the speedup.  With Clarabel 0.11 the probe finds that the GIL is
+released.  The only measurements so far come from a single-core machine,
+where every thread count takes 1.15 to 1.25 s because there is no second core
+to run on; no multi-core speedup has been recorded yet.
+"""
+
+import functools
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from cvxball.ball import Ball
+from cvxball.solver import _build_soc_program, min_circle_clarabel
+
+# Size of the GIL probe problem; its solve takes a few hundred milliseconds,
+# far longer than the interpreter's switch interval and the OS time slice.
+_PROBE_POINTS = 2_000
+
+# The GIL counts as held if the calling thread stalls for this share of the probe solve.
+_PROBE_STALL = 0.5
+
+# The calling thread wakes up this often (in seconds) during the probe solve.
+_PROBE_TICK = 1e-3
+
+# A probe solve still running after this many seconds is abandoned and the GIL counts as held.
+_PROBE_TIMEOUT = 60.0
+
+_BACKENDS = ("auto", "thread", "process")
+
+
+@functools.cache
+def _pool(threads: int) -> ThreadPoolExecutor:
+    """Shared thread pool with ``threads`` workers, created on first use."""
+    return ThreadPoolExecutor(threads, thread_name_prefix="cvxball-solve")
+
+
+@functools.cache
+def clarabel_releases_gil() -> bool:
+    """Whether ``clarabel.DefaultSolver.solve`` lets other Python threads run.
+
+    The check runs once per process.  A probe solve runs in a background
+    thread while the calling thread waits for it in short steps and records
+    the longest stall beyond a step.  If the binding holds the GIL, that stall
+    lasts about as long as the solve.
+
+    Returns:
+        ``True`` if the calling thread kept running during the solve.  A probe
+        that fails or does not finish within a minute gives ``False``, so
+        callers fall back to processes.
+    """
+    import clarabel
+
+    program = _build_soc_program(np.random.default_rng(0).standard_normal((_PROBE_POINTS, 3)))
+    settings = clarabel.DefaultSettings.default()  # ty: ignore[unresolved-attribute]
+    settings.verbose = False
+    solver = clarabel.DefaultSolver(*program, settings)  # ty: ignore[unresolved-attribute]
+
+    elapsed: list[float] = []
+    failed: list[Exception] = []
+
+    def probe() -> None:
+        start = time.perf_counter()
+        try:
+            solver.solve()
+        except Exception as error:  # noqa: BLE001
+            failed.append(error)
+        finally:
+            elapsed.append(time.perf_counter() - start)
+
+    # A daemon thread, so a probe that never returns does not keep the interpreter alive.
+    worker = threading.Thread(target=probe, name="cvxball-gil-probe", daemon=True)
+    longest = 0.0
+    start = last = time.perf_counter()
+    worker.start()
+    while worker.is_alive() and last - start < _PROBE_TIMEOUT:
+        worker.join(_PROBE_TICK)
+        now = time.perf_counter()
+        longest, last = max(longest, now - last - _PROBE_TICK), now
+    if worker.is_alive() or failed:
+        return False
+    return longest < _PROBE_STALL * elapsed[0]
+
+
+def solve_many(problems: Iterable[np.ndarray], threads: int | None = None, backend: str = "auto") -> list[Ball]:
+    """Solve independent enclosing-ball problems concurrently with Clarabel.
+
+    Args:
+        problems: Point sets, each a numpy array of shape ``(n_i, d_i)``.
+        threads: Number of concurrent solves; defaults to the number of CPUs.
+            With one, the problems are solved in turn in the calling thread.
+        backend: ``"thread"`` for a thread pool, ``"process"`` for a process
+            pool, or ``"auto"`` for threads if :func:`clarabel_releases_gil`
+            and processes otherwise.
+
+    Returns:
+        The :class:`~cvxball.ball.Ball` of every problem, in order.
+
+    Raises:
+        ValueError: If ``threads`` or ``backend`` is invalid, or a solve does
+            not converge, as in :func:`~cvxball.solver.min_circle_clarabel`.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.pool import solve_many
+        >>> rng = np.random.default_rng(0)
+        >>> balls = solve_many([rng.standard_normal((1_000, 3)) for _ in range(8)], threads=2, backend="thread")
+        >>> len(balls), bool(balls[0].radius > 0)
+        (8, True)
+    """
+    problems = list(problems)
+    threads = (os.cpu_count() or 1) if threads is None else threads
+    if threads < 1:
+        raise ValueError("threads must be at least 1")  # noqa: TRY003
+    if backend not in _BACKENDS:
+        raise ValueError(f"unknown backend {backend!r}; choose one of {_BACKENDS}")  # noqa: TRY003
+    if threads == 1 or len(problems) <= 1:
+        return [min_circle_clarabel(points) for points in problems]
+    if backend == "auto":
+        backend = "thread" if clarabel_releases_gil() else "process"
+    if backend == "thread":
+        return list(_pool(threads).map(min_circle_clarabel, problems))
+    # Forking a process that runs other threads can deadlock the children, so they are spawned.
+    with ProcessPoolExecutor(min(threads, len(problems)), mp_context=multiprocessing.get_context("spawn")) as pool:
+        return list(pool.map(min_circle_clarabel, problems))
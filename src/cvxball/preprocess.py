@@ -0,0 +1,192 @@
+"""Deduplication and grid quantisation of the input before a solve.
+
+Scanned point clouds often repeat points exactly, or carry coordinates already
+quantised to a fixed grid, and every repeated row costs the conic solvers a
+second-order cone block of its own while changing nothing about the ball.
+:func:`reduce_points` removes the repeats:
+
+* rows are hashed to one 64-bit key each by a vectorised multiply-xor over
+  their bit patterns, and the keys are deduplicated with one 1-D sort, which
+  is much cheaper than a lexicographic sort of the rows.  Hash collisions are
+  detected by comparing every row with its representative, and fall back to
+  an exact row-wise deduplication;
+* with a ``resolution``, every point is first snapped to the nearest node of
+  the grid ``resolution * Z^d``, so points within one cell merge as well.
+  The largest distance from a point to its node is recorded as the
+  :class:`Reduction`'s ``error``; it never exceeds ``resolution * sqrt(d) / 2``.
+
+Since every point is within ``error`` of its reduced point, the smallest
+enclosing radii of the original and the reduced sets differ by at most
+``error``.  :func:`min_circle_reduced` solves on the reduced set, re-measures
+the radius on the original points so the ball encloses all of them, and maps
+the core set back to original row indices.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from cvxball.ball import _CANCELLATION, Ball, _chunk_rows
+from cvxball.coreset import min_circle_coreset
+from cvxball.scan import parallel_farthest
+
+# Odd 64-bit multiplier of the row hash (the golden-ratio constant of Fibonacci hashing).
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+# Grid coordinates must stay well inside int64 after rounding.
+_MAX_CELL = float(1 << 62)
+
+
+class Reduction(NamedTuple):
+    """Reduced point set and its map back to the original rows.
+
+    Attributes:
+        points: The distinct (snapped) points, shape ``(m, d)``, in order of
+            their first occurrence in the input.
+        rows: For each reduced point, the first original row it stands for,
+            shape ``(m,)``.
+        inverse: For each original row, the index of its reduced point, shape
+            ``(n,)``, so ``points[inverse]`` approximates the input.
+        error: The largest distance from an original point to its reduced
+            point; ``0.0`` without snapping.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.preprocess import reduce_points
+        >>> reduction = reduce_points(np.array([[0.0, 1.0], [2.0, 3.0], [0.0, 1.0]]))
+        >>> reduction.points.tolist(), reduction.inverse.tolist()
+        ([[0.0, 1.0], [2.0, 3.0]], [0, 1, 0])
+        >>> reduction.members([0]).tolist()
+        [0, 2]
+    """
+
+    points: np.ndarray
+    rows: np.ndarray
+    inverse: np.ndarray
+    error: float
+
+    def members(self, index: np.ndarray) -> np.ndarray:
+        """Every original row, sorted, whose reduced point is among ``index``."""
+        selected = np.zeros(self.points.shape[0], dtype=bool)
+        selected[index] = True
+        return np.flatnonzero(selected[self.inverse])
+
+
+def _row_hash(keys: np.ndarray) -> np.ndarray:
+    """One 64-bit hash per row of an ``(n, d)`` array of 64-bit keys."""
+    bits = keys.view(np.uint64)
+    digest = np.zeros(keys.shape[0], dtype=np.uint64)
+    for column in bits.T:
+        digest ^= column
+        digest *= _HASH_MULTIPLIER
+        digest ^= digest >> np.uint64(29)
+    return digest
+
+
+def _unique_rows(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """First occurrence of every distinct row of ``keys`` and the inverse map, in input order."""
+    _, first, inverse = np.unique(_row_hash(keys), return_index=True, return_inverse=True)
+    if not np.array_equal(keys, keys[first[inverse]]):
+        # A hash collision merged distinct rows; deduplicate the rows themselves.
+        _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    return first[order], rank[inverse]
+
+
+def reduce_points(points: np.ndarray, resolution: float | None = None) -> Reduction:
+    """Merge duplicate points, optionally after snapping them to a grid.
+
+    Args:
+        points: A numpy array of shape ``(n, d)`` with ``n >= 1``.
+        resolution: Optional grid spacing.  Every point is replaced by the
+            nearest node of ``resolution * Z^d`` before deduplication, which
+            moves it by at most ``resolution * sqrt(d) / 2``.  Without it
+            only exactly equal rows are merged (``-0.0`` equals ``0.0``).
+
+    Returns:
+        The :class:`Reduction`.
+
+    Raises:
+        ValueError: If ``points`` is empty, malformed or not finite, or the
+            resolution is not positive or too fine for the coordinates.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.preprocess import reduce_points
+        >>> points = np.array([[0.01, 0.0], [0.0, 0.02], [1.0, 1.0]])
+        >>> reduction = reduce_points(points, resolution=0.1)
+        >>> reduction.points.tolist(), reduction.rows.tolist()
+        ([[0.0, 0.0], [1.0, 1.0]], [0, 2])
+        >>> bool(reduction.error <= 0.1 * np.sqrt(2) / 2)
+        True
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2 or points.shape[0] == 0:
+        raise ValueError("points must be a non-empty (n, d) array")  # noqa: TRY003
+    if not np.isfinite(points).all():
+        raise ValueError("points must be finite")  # noqa: TRY003
+
+    if resolution is None:
+        # Adding zero turns -0.0 into 0.0, so both hash alike.
+        keys = points + 0.0
+        first, inverse = _unique_rows(keys)
+        return Reduction(points[first], first, inverse, 0.0)
+
+    if not resolution > 0.0:
+        raise ValueError("resolution must be positive")  # noqa: TRY003
+    if np.abs(points).max() / resolution >= _MAX_CELL:
+        raise ValueError("resolution is too fine for the range of the points")  # noqa: TRY003
+    cells = np.rint(points / resolution).astype(np.int64)
+    first, inverse = _unique_rows(cells)
+    reduced = cells[first] * resolution
+
+    # Measure the snapping error exactly rather than quoting the worst case.
+    error_sq = 0.0
+    step = _chunk_rows(points.shape[1])
+    for start in range(0, points.shape[0], step):
+        diff = points[start : start + step] - cells[start : start + step] * resolution
+        error_sq = max(error_sq, float(np.einsum("ij,ij->i", diff, diff).max()))
+    return Reduction(reduced, first, inverse, float(np.sqrt(error_sq)))
+
+
+def min_circle_reduced(
+    points: np.ndarray, resolution: float | None = None, tol: float = 1e-6
+) -> tuple[Ball, np.ndarray]:
+    """Compute an enclosing ball by solving on the deduplicated (and snapped) points.
+
+    The ball is computed by :func:`~cvxball.coreset.min_circle_coreset` on
+    :func:`reduce_points`' output, then its radius is re-measured over the
+    original points.  It therefore encloses every input point, and its radius
+    is at most ``(1 + tol) (R + error) + error`` for the optimal radius ``R``
+    and the reduction's ``error``; without a resolution the error is zero.
+
+    Args:
+        points: A numpy array of shape ``(n, d)`` with ``n >= 1``.
+        resolution: Optional grid spacing, see :func:`reduce_points`.
+        tol: Relative tolerance of the core-set solve.
+
+    Returns:
+        A tuple ``(ball, core)`` of the enclosing :class:`~cvxball.ball.Ball`
+        and the original row indices of the core set, one row per reduced
+        point (its first occurrence).
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.preprocess import min_circle_reduced
+        >>> rng = np.random.default_rng(0)
+        >>> points = np.round(rng.standard_normal((20_000, 3)), 1)
+        >>> ball, core = min_circle_reduced(points)
+        >>> bool(ball.contains(points).all()), core.size < 100
+        (True, True)
+    """
+    points = np.asarray(points, dtype=np.float64)
+    reduction = reduce_points(points, resolution)
+    ball, core = min_circle_coreset(reduction.points, tol=tol)
+    if reduction.error > 0.0:
+        _, radius = parallel_farthest(points, ball.center, threads=1)
+        # The scan's distances are accurate to about _CANCELLATION; round up by that.
+        ball = Ball(radius * (1.0 + _CANCELLATION), ball.center)
+    return ball, reduction.rows[core]
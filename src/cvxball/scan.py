@@ -0,0 +1,366 @@
+"""Repeated farthest-point and violator scans over a fixed point set.
+
+Iterative solvers (core sets, outlier peeling, verification) scan the same
+points again and again for the one farthest from a candidate centre, or for
+all points outside a candidate ball.  :class:`PointScanner` pays a one-off
+preprocessing cost so that each later scan touches only the part of the data
+near the candidate sphere:
+
+* the points are cut into blocks of a few thousand rows, each small enough to
+  stay in cache, optionally after sorting them along a Morton (Z-order) curve
+  so that every block is spatially compact;
+* every block gets a bounding ball and every row its squared norm, both
+  computed once (relative to the mean, which keeps the expansion below
+  accurate for data far from the origin);
+* a query bounds the distance from the centre to every point of a block by
+  ``|c - b| + r_b`` (triangle inequality), skips blocks that cannot contain
+  the answer, and evaluates the rest as ``|p|^2 - 2 P c + |c|^2`` with one
+  BLAS matrix-vector product per block.  Rows whose expanded distance is too
+  close to the decision to be trusted are recomputed exactly from ``p - c``.
+
+For a centre near the middle of the cloud and a radius near its extent, all
+interior blocks are skipped, so a query costs a fraction of a full pass.
+
+One-off scans, where indexing would not pay, go through
+:func:`parallel_farthest` and :func:`parallel_violators` instead.  They split
+the rows into one contiguous range per thread, scan every range in
+cache-sized chunks on a shared thread pool and reduce the per-thread maxima
+and violator lists.  NumPy releases the GIL inside the matrix-vector products
+and reductions that do the work, so the threads run in parallel while sharing
+the input array without a copy, which a process pool could not.
+"""
+
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from cvxball.ball import _sq_distances
+
+# Rows per block are chosen so that one block of float64 points is about this large.
+_BLOCK_BYTES = 1 << 16
+
+# Bits per coordinate of the Morton code; blocks are far coarser than the grid.
+_MORTON_BITS = 10
+
+# At most this many leading directions enter the Morton code.
+_MORTON_DIMS = 3
+
+# Block radii are inflated by this relative amount so that rounding can never
+# make a block look farther inside than it is.
+_ROUNDING = 16 * np.finfo(np.float64).eps
+
+# Expanded squared distances within this multiple of eps * (|p|^2 + |c|^2) of
+# the decision threshold are recomputed exactly.
+_SLACK = 64 * np.finfo(np.float64).eps
+
+# Each thread of a parallel scan gets at least this many rows.
+_THREAD_MIN_ROWS = 1 << 16
+
+
+def _spread(bits: int, dims: int) -> np.ndarray:
+    """Table mapping every ``bits``-bit integer to its bits spread ``dims`` apart."""
+    values = np.arange(1 << bits, dtype=np.uint32)
+    table = np.zeros(1 << bits, dtype=np.uint32)
+    for bit in range(bits):
+        table |= ((values >> bit) & 1) << (bit * dims)
+    return table
+
+
+def _morton_order(points: np.ndarray) -> np.ndarray:
+    """Permutation sorting ``points`` along a Z-order curve of (at most three) leading directions."""
+    d = points.shape[1]
+    if d > _MORTON_DIMS:
+        # Principal axes of a subsample, so the curve follows the directions of largest spread.
+        sample = points[:: max(1, points.shape[0] // 4096)]
+        sample = sample - sample.mean(axis=0)
+        axes = np.linalg.eigh(sample.T @ sample)[1][:, -_MORTON_DIMS:]
+        points = points @ axes
+    # The grid only needs to be roughly aligned with the data, so it is fitted
+    # to a subsample and outlying points are clamped to its boundary cells.
+    sample = points[:: max(1, points.shape[0] // 65536)]
+    low, high = sample.min(axis=0), sample.max(axis=0)
+    span = np.where(high > low, high - low, 1.0)
+    levels = (1 << _MORTON_BITS) - 1
+    dims = points.shape[1]
+    table = _spread(_MORTON_BITS, dims)
+    code = np.zeros(points.shape[0], dtype=np.uint32)
+    for j in range(dims):
+        cell = np.clip((points[:, j] - low[j]) * (levels / span[j]), 0, levels).astype(np.intp)
+        code |= table[cell] << j
+    return np.argsort(code)
+
+
+class PointScanner:
+    """Fast repeated farthest-point and violator queries against a fixed point set.
+
+    Attributes:
+        order: Row of the original input stored at each position, or ``None``
+            when the rows were kept in input order.
+        scanned: Number of rows evaluated by the most recent query.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.scan import PointScanner
+        >>> points = np.random.default_rng(0).standard_normal((100_000, 3))
+        >>> scanner = PointScanner(points)
+        >>> index, distance = scanner.farthest(np.zeros(3))
+        >>> bool(index == np.argmax(np.linalg.norm(points, axis=1))), scanner.scanned < 50_000
+        (True, True)
+    """
+
+    def __init__(self, points: np.ndarray, reorder: bool = True, block_rows: int | None = None) -> None:
+        """Preprocess ``points``.
+
+        Args:
+            points: A numpy array of shape ``(n, d)`` with ``n >= 1``.  A
+                float64 copy is kept, shifted to (roughly) its mean.
+            reorder: Sort the rows along a Morton curve first, which makes the
+                blocks compact and the pruning effective for any input order.
+                Data that is already spatially coherent row by row (scan lines,
+                rasters) can skip the sort.
+            block_rows: Rows per block; by default about 64 KiB of points.
+
+        Raises:
+            ValueError: If ``points`` is not a non-empty 2-D array.
+        """
+        points = np.asarray(points)
+        if points.ndim != 2 or points.shape[0] == 0:
+            raise ValueError("points must be a non-empty (n, d) array")  # noqa: TRY003
+        n, d = points.shape
+        self.order = _morton_order(points) if reorder and n > 1 else None
+        # Any shift near the middle of the data serves; a subsample's mean is enough.
+        self._shift = points[:: max(1, n // 65536)].mean(axis=0, dtype=np.float64)
+        if self.order is None:
+            self._data = np.array(points, dtype=np.float64)
+        else:
+            # take() gathers rows much faster than fancy indexing, and its result is ours to modify.
+            self._data = points.take(self.order, axis=0).astype(np.float64, copy=False)
+        self._data -= self._shift
+        self._norms = np.einsum("ij,ij->i", self._data, self._data)
+        self.scanned = 0
+
+        step = block_rows or max(1, _BLOCK_BYTES // (8 * max(d, 1)))
+        self._starts = np.arange(0, n, step)
+        sizes = np.diff(np.append(self._starts, n))
+        self._centers = np.add.reduceat(self._data, self._starts, axis=0) / sizes[:, None]
+        diff = self._data - np.repeat(self._centers, sizes, axis=0)
+        self._radii = np.sqrt(np.maximum.reduceat(np.einsum("ij,ij->i", diff, diff), self._starts))
+        self._radii *= 1.0 + _ROUNDING
+        self._stops = self._starts + sizes
+
+    def __len__(self) -> int:
+        """Number of points."""
+        return int(self._data.shape[0])
+
+    def _rows(self, positions: np.ndarray) -> np.ndarray:
+        """Original row indices of storage positions."""
+        return positions if self.order is None else self.order[positions]
+
+    def _block(
+        self, block: int, center: np.ndarray, c_sq: float, mask: np.ndarray | None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        """Expanded squared distances of one block, its original rows, validity, and the rounding slack."""
+        start, stop = self._starts[block], self._stops[block]
+        norms = self._norms[start:stop]
+        d2 = norms - 2.0 * (self._data[start:stop] @ center)
+        d2 += c_sq
+        rows = self._rows(np.arange(start, stop))
+        valid = np.ones(stop - start, dtype=bool) if mask is None else mask[rows]
+        self.scanned += int(stop - start)
+        return d2, rows, valid, _SLACK * (float(norms.max()) + c_sq)
+
+    def _exact(self, positions: np.ndarray, center: np.ndarray) -> np.ndarray:
+        """Exact squared distances of the stored points at ``positions``."""
+        diff = self._data[positions] - center
+        d2: np.ndarray = np.einsum("ij,ij->i", diff, diff)
+        return d2
+
+    def _block_distances(self, center: np.ndarray) -> np.ndarray:
+        """Distance from ``center`` to every block centre."""
+        offset = self._centers - center
+        distance: np.ndarray = np.sqrt(np.einsum("ij,ij->i", offset, offset))
+        return distance
+
+    def farthest(self, center: np.ndarray, mask: np.ndarray | None = None) -> tuple[int, float]:
+        """Find the point farthest from ``center``.
+
+        Args:
+            center: A numpy array of shape ``(d,)``.
+            mask: Optional boolean array of shape ``(n,)`` in input order;
+                only rows where it is ``True`` are considered.
+
+        Returns:
+            A tuple ``(index, distance)`` of the farthest row (in input order)
+            and its exact distance to ``center``.
+
+        Raises:
+            ValueError: If ``mask`` selects no row.
+        """
+        center = np.asarray(center, dtype=np.float64) - self._shift
+        c_sq = float(center @ center)
+        upper = self._block_distances(center) + self._radii
+        self.scanned = 0
+        best_index, best, best_d2 = -1, -1.0, -1.0
+        for block in map(int, np.argsort(-upper, kind="stable")):
+            if upper[block] <= best:
+                break
+            d2, rows, valid, slack = self._block(block, center, c_sq, mask)
+            if not valid.any():
+                continue
+            d2[~valid] = -np.inf
+            candidates = np.flatnonzero(d2 >= d2.max() - slack)
+            exact = self._exact(self._starts[block] + candidates, center)
+            i = int(np.argmax(exact))
+            if exact[i] > best_d2:
+                best_index, best_d2 = int(rows[candidates[i]]), float(exact[i])
+                best = float(np.sqrt(best_d2))
+        if best_index < 0:
+            raise ValueError("farthest() needs at least one point")  # noqa: TRY003
+        return best_index, best
+
+    def violators(
+        self, center: np.ndarray, radius: float, mask: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find every point strictly outside the ball ``(radius, center)``.
+
+        Args:
+            center: A numpy array of shape ``(d,)``.
+            radius: The ball radius.
+            mask: Optional boolean array of shape ``(n,)`` in input order;
+                only rows where it is ``True`` are considered.
+
+        Returns:
+            A tuple ``(index, distance)`` of the violating rows, sorted, and
+            their exact distances to ``center``.
+        """
+        center = np.asarray(center, dtype=np.float64) - self._shift
+        c_sq = float(center @ center)
+        r_sq = float(radius) ** 2
+        self.scanned = 0
+        found, distances = [], []
+        for block in map(int, np.flatnonzero(self._block_distances(center) + self._radii > radius)):
+            d2, rows, valid, slack = self._block(block, center, c_sq, mask)
+            candidates = np.flatnonzero(valid & (d2 > r_sq - slack))
+            if candidates.size == 0:
+                continue
+            exact = self._exact(self._starts[block] + candidates, center)
+            outside = exact > r_sq
+            found.append(rows[candidates[outside]])
+            distances.append(np.sqrt(exact[outside]))
+        if not found:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        index, distance = np.concatenate(found), np.concatenate(distances)
+        order = np.argsort(index)
+        return index[order], distance[order]
+
+
+@functools.cache
+def _pool(threads: int) -> ThreadPoolExecutor:
+    """Shared thread pool with ``threads`` workers, created on first use."""
+    return ThreadPoolExecutor(threads, thread_name_prefix="cvxball-scan")
+
+
+def _scan_range(
+    points: np.ndarray, center: np.ndarray, r_sq: float, mask: np.ndarray | None, start: int, stop: int
+) -> tuple[int, float, np.ndarray, np.ndarray]:
+    """Farthest row and rows beyond ``r_sq`` (squared) among ``points[start:stop]``."""
+    best_index, best_d2 = -1, -np.inf
+    found, found_d2 = [], []
+    for offset, d2 in _sq_distances(points[start:stop], center):
+        first = start + offset
+        if mask is not None:
+            d2[~mask[first : first + d2.shape[0]]] = -np.inf
+        i = int(np.argmax(d2))
+        if d2[i] > best_d2:
+            best_index, best_d2 = first + i, float(d2[i])
+        hits = np.flatnonzero(d2 > r_sq)
+        found.append(first + hits)
+        found_d2.append(d2[hits])
+    return best_index, best_d2, np.concatenate(found), np.concatenate(found_d2)
+
+
+def _parallel_scan(
+    points: np.ndarray, center: np.ndarray, radius: float, mask: np.ndarray | None, threads: int | None
+) -> tuple[int, float, np.ndarray, np.ndarray]:
+    """Split the rows over ``threads`` workers and reduce their :func:`_scan_range` results."""
+    n = points.shape[0]
+    threads = (os.cpu_count() or 1) if threads is None else threads
+    if threads < 1:
+        raise ValueError("threads must be at least 1")  # noqa: TRY003
+    threads = max(1, min(threads, n // _THREAD_MIN_ROWS))
+    center = np.asarray(center, dtype=np.float64)
+    r_sq = float(radius) ** 2
+    bounds = np.linspace(0, n, threads + 1).astype(np.intp)
+    if threads == 1:
+        parts = [_scan_range(points, center, r_sq, mask, 0, n)]
+    else:
+        work = functools.partial(_scan_range, points, center, r_sq, mask)
+        parts = list(_pool(threads).map(work, bounds[:-1], bounds[1:]))
+    best_index, best_d2, _, _ = max(parts, key=lambda part: part[1])
+    index = np.concatenate([part[2] for part in parts])
+    d2 = np.concatenate([part[3] for part in parts])
+    return best_index, best_d2, index, d2
+
+
+def parallel_farthest(
+    points: np.ndarray, center: np.ndarray, mask: np.ndarray | None = None, threads: int | None = None
+) -> tuple[int, float]:
+    """Find the point farthest from ``center`` with one pass split over threads.
+
+    Args:
+        points: A numpy array of shape ``(n, d)``.
+        center: A numpy array of shape ``(d,)``.
+        mask: Optional boolean array of shape ``(n,)``; only rows where it is
+            ``True`` are considered.
+        threads: Number of threads; defaults to the number of CPUs.  Inputs
+            too small to share out are scanned on the calling thread.
+
+    Returns:
+        A tuple ``(index, distance)`` of the farthest row and its distance,
+        accurate to about ``1e-8`` relative like :meth:`~cvxball.ball.Ball.farthest`.
+
+    Raises:
+        ValueError: If no row is selected or ``threads < 1``.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.scan import parallel_farthest
+        >>> points = np.random.default_rng(0).standard_normal((300_000, 3))
+        >>> index, distance = parallel_farthest(points, np.zeros(3), threads=4)
+        >>> bool(index == np.argmax(np.linalg.norm(points, axis=1)))
+        True
+    """
+    index, d2, _, _ = _parallel_scan(points, center, np.inf, mask, threads)
+    if index < 0 or d2 == -np.inf:
+        raise ValueError("farthest() needs at least one point")  # noqa: TRY003
+    return index, float(np.sqrt(d2))
+
+
+def parallel_violators(
+    points: np.ndarray,
+    center: np.ndarray,
+    radius: float,
+    mask: np.ndarray | None = None,
+    threads: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find every point outside the ball ``(radius, center)`` with one pass split over threads.
+
+    Args:
+        points: A numpy array of shape ``(n, d)``.
+        center: A numpy array of shape ``(d,)``.
+        radius: The ball radius.
+        mask: Optional boolean array of shape ``(n,)``; only rows where it is
+            ``True`` are considered.
+        threads: Number of threads, as for :func:`parallel_farthest`.
+
+    Returns:
+        A tuple ``(index, distance)`` of the violating rows, sorted, and their
+        distances to ``center``.
+
+    Raises:
+        ValueError: If ``threads < 1``.
+    """
+    _, _, index, d2 = _parallel_scan(points, center, radius, mask, threads)
+    return index, np.sqrt(d2)
@@ -1,22 +1,76 @@
 """Convex utilities for computing the minimum enclosing circle/ball.
 
-Provides two solvers for the smallest enclosing ball problem:
+Provides two solvers for the smallest enclosing ball problem, both returning
+a :class:`~cvxball.ball.Ball`:
 
 - :func:`min_circle_cvx`: uses CVXPY to model and then dispatch to a backend
   solver (default: CLARABEL).
 - :func:`min_circle_clarabel`: bypasses CVXPY and calls the Clarabel solver
   directly, which removes the CVXPY canonicalisation overhead.
+
+:func:`min_ball_of_balls_cvx` and :func:`min_ball_of_balls_clarabel` solve the
+same problem for a set of input *balls* instead of points, which lets cluster
+summaries be merged without going back to the raw points.
+
+The solver backends are imported on first use of the entry point that needs
+them, so ``import cvxball.solver`` only loads NumPy and a caller that sticks to
+:func:`min_circle_clarabel` never loads CVXPY.
 """
 
-from typing import Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
-import clarabel
-import cvxpy as cp
 import numpy as np
-import scipy.sparse as sp
+
+from cvxball import metrics
+from cvxball.ball import Ball
+
+if TYPE_CHECKING:
+    import clarabel
+    import cvxpy as cp
+    import scipy.sparse as sp
+
+
+def _cvx_problem(
+    points: np.ndarray, radii: np.ndarray | None = None
+) -> tuple["cp.Problem", "cp.Variable", "cp.Variable"]:
+    """Model the enclosing-ball problem in CVXPY without solving it.
+
+    Args:
+        points: A numpy array of shape ``(n, d)``.
+        radii: Optional array of shape ``(n,)``.  If given, ``points`` are the
+            centres of balls with these radii and the constraints become
+            ``‖p_i - x‖ + r_i <= r``.
+
+    Returns:
+        A tuple ``(problem, r, x)`` of the unsolved CVXPY problem and its
+        radius and midpoint variables.
+    """
+    import cvxpy as cp
+
+    # cvxpy variable for the radius
+    r = cp.Variable(shape=1, name="Radius")
+    # cvxpy variable for the midpoint
+    x = cp.Variable(points.shape[1], name="Midpoint")
+    objective = cp.Minimize(r)
+    # Elementwise broadcast of the scalar radius across all points.
+    # `cp.multiply` (not `*`) avoids CVXPY's deprecated `*`-as-matmul
+    # path, which is ambiguous when n == 1 ((1,) * (1,) -> dot product).
+    bound = cp.multiply(r, np.ones(points.shape[0]))  # type: ignore[attr-defined]  # cvxpy re-exports atoms via star-import; stubs don't expose them
+    if radii is not None:
+        bound = bound - radii
+    constraints: list[cp.Constraint] = [
+        cp.SOC(
+            bound,
+            points - x,  # Broadcasting handles this automatically
+            axis=1,
+        )
+    ]
+    return cp.Problem(objective=objective, constraints=constraints), r, x
 
 
-def min_circle_cvx(points: np.ndarray, **kwargs: Any) -> tuple[float, np.ndarray]:
+@metrics.instrument
+def min_circle_cvx(points: np.ndarray, **kwargs: Any) -> Ball:
     """Compute the smallest enclosing circle for a set of points using convex optimization.
 
     This function solves the convex optimization problem to find the minimum radius
@@ -30,7 +84,7 @@ def min_circle_cvx(points: np.ndarray, **kwargs: Any) -> tuple[float, np.ndarray
                  Common options include 'solver' to specify which CVXPY solver to use.
 
     Returns:
-        A tuple containing:
+        A :class:`~cvxball.ball.Ball` (a named tuple) containing:
             - The radius of the minimum enclosing circle (float)
             - The center coordinates of the circle (numpy.ndarray)
 
@@ -40,35 +94,20 @@ def min_circle_cvx(points: np.ndarray, **kwargs: Any) -> tuple[float, np.ndarray
         >>> points = np.array([[0, 0], [1, 0], [0, 1]])
         >>> radius, center = min_circle_cvx(points, solver="CLARABEL")
     """
-    # cvxpy variable for the radius
-    r = cp.Variable(shape=1, name="Radius")
-    # cvxpy variable for the midpoint
-    x = cp.Variable(points.shape[1], name="Midpoint")
-    objective = cp.Minimize(r)
-    constraints: list[cp.Constraint] = [
-        cp.SOC(
-            # Elementwise broadcast of the scalar radius across all points.
-            # `cp.multiply` (not `*`) avoids CVXPY's deprecated `*`-as-matmul
-            # path, which is ambiguous when n == 1 ((1,) * (1,) -> dot product).
-            cp.multiply(r, np.ones(points.shape[0])),  # type: ignore[attr-defined]  # cvxpy re-exports atoms via star-import; stubs don't expose them
-            points - x,  # Broadcasting handles this automatically
-            axis=1,
-        )
-    ]
-
-    problem = cp.Problem(objective=objective, constraints=constraints)
+    problem, r, x = _cvx_problem(points)
     problem.solve(**kwargs)  # type: ignore[no-untyped-call]  # cvxpy's Problem.solve is unannotated
 
     # Ensure the problem was solved successfully
     if r.value is None or x.value is None:
         raise ValueError("Optimization failed to find a solution")  # noqa: TRY003
 
-    return float(r.value[0]), x.value
+    return Ball(float(r.value[0]), x.value)
 
 
 def _build_soc_program(
     points: np.ndarray,
-) -> tuple[sp.csc_matrix, np.ndarray, sp.csc_matrix, np.ndarray, list[Any]]:
+    radii: np.ndarray | None = None,
+) -> tuple["sp.csc_matrix", np.ndarray, "sp.csc_matrix", np.ndarray, list[Any]]:
     """Assemble the Clarabel second-order-cone program for the enclosing ball.
 
     The problem is written in Clarabel's standard form::
@@ -81,11 +120,21 @@ def _build_soc_program(
     ``q = e₀``), and the feasible set is a product of *n* second-order cones.
 
     For each point ``p_i`` we require ``[r, p_i - x] in Q^{d+1}``, which gives
-    one SOC block of dimension ``d + 1`` per point.
+    one SOC block of dimension ``d + 1`` per point.  When ``radii`` are given
+    the points are ball centres and the blocks become ``[r - r_i, p_i - x]``,
+    i.e. ``‖p_i - x‖ + r_i <= r``; only the first entry of each block of ``b``
+    changes.
+
+    The sparse arrays are written directly in CSC layout, so assembly needs
+    no COO temporaries and peak memory grows by roughly ``20 (d + 1)`` bytes
+    per point on top of the input.
 
     Args:
         points: A numpy array of shape ``(n, d)`` where *n* is the number of
-                points and *d* is the ambient dimension.
+                points and *d* is the ambient dimension.  Any real dtype and
+                memory layout is accepted; coordinates are cast to float64 as
+                they are copied into ``b``.
+        radii: Optional array of shape ``(n,)`` of ball radii.
 
     Returns:
         A tuple ``(p_mat, q, a_mat, b, cones)`` of the objective quadratic
@@ -94,8 +143,13 @@ def _build_soc_program(
         cones — the exact positional arguments Clarabel's ``DefaultSolver``
         expects.
     """
+    import clarabel
+    import scipy.sparse as sp
+
     n, d = points.shape
     n_vars = 1 + d  # decision vector: [r, x_1, ..., x_d]
+    block = d + 1  # rows per SOC block
+    total_rows = n * block
 
     # --- Objective: minimise r -----------------------------------------------
     p_mat = sp.csc_matrix((n_vars, n_vars))
@@ -105,41 +159,94 @@ def _build_soc_program(
     # --- Constraints: one SOC block of size (d+1) per point ------------------
     # We need b - a_mat @ z = s  where s in K.
     # For point i the desired slack is  s = [r, p_i - x],  so:
-    #   row i*(d+1)     : b = 0,       a_mat col 0   = -1  (gives s_0 = r)
+    #   row i*(d+1)     : b = -r_i,    a_mat col 0   = -1  (gives s_0 = r - r_i; r_i = 0 for points)
     #   row i*(d+1)+j   : b = p_i[j], a_mat col j   = +1  (gives s_j = p_ij - x_j)
-    total_rows = n * (d + 1)
+    #
+    # Every column of A holds exactly n entries, so the CSC arrays follow a
+    # closed form and are written in place rather than converted from COO:
+    #   indptr           = [0, n, 2n, ..., (d+1)n]
+    #   indices[j*n + i] = i*(d+1) + j
+    # int32 indices are used whenever they fit; scipy would otherwise downcast
+    # (and therefore copy) them on construction.
+    idx_dtype = np.int32 if total_rows <= np.iinfo(np.int32).max else np.int64
+    indptr = np.arange(n_vars + 1, dtype=idx_dtype) * idx_dtype(n)
+    indices = np.empty(total_rows, dtype=idx_dtype).reshape(block, n)
+    indices[0] = np.arange(0, total_rows, block, dtype=idx_dtype)
+    for j in range(1, block):
+        np.add(indices[0], j, out=indices[j])
+
+    data = np.ones(total_rows)
+    data[:n] = -1.0
+
+    a_mat = sp.csc_matrix((data, indices.ravel(), indptr), shape=(total_rows, n_vars))
+
+    # Scatter the coordinates straight into the (n, d+1) view of b; this casts
+    # float32 and reads strided input without an intermediate copy of points.
+    b = np.zeros((n, block))
+    b[:, 1:] = points
+    if radii is not None:
+        np.negative(radii, out=b[:, 0])
+    b = b.ravel()
 
-    # Entries for the r column (column 0): -1 at each block's first row
-    r_rows = np.arange(n) * (d + 1)
+    # --- Cones: n SOC cones each of dimension (d+1) --------------------------
+    # Clarabel only reads the cone descriptors, so one shared instance suffices.
+    cones = [clarabel.SecondOrderConeT(block)] * n  # ty: ignore[unresolved-attribute]
 
-    # Entries for the x columns (columns 1..d): +1 at each block's inner rows
-    x_row_offsets = np.arange(n)[:, None] * (d + 1) + np.arange(1, d + 1)[None, :]  # (n, d)
-    x_rows = x_row_offsets.ravel()
-    x_cols = np.tile(np.arange(1, d + 1), n)
+    return p_mat, q, a_mat, b, cones
 
-    all_rows = np.concatenate([r_rows, x_rows])
-    all_cols = np.concatenate([np.zeros(n, dtype=np.intp), x_cols])
-    all_vals = np.concatenate([-np.ones(n), np.ones(n * d)])
 
-    a_mat = sp.csc_matrix((all_vals, (all_rows, all_cols)), shape=(total_rows, n_vars))
+def _solve_soc_program(
+    points: np.ndarray,
+    verbose: bool = False,
+    radii: np.ndarray | None = None,
+    time_limit: float | None = None,
+    stop: Callable[[], bool] | None = None,
+) -> "clarabel.DefaultSolution":  # ty: ignore[unresolved-attribute]
+    """Assemble and solve the Clarabel program, returning the raw solution.
 
-    b = np.zeros(total_rows)
-    b[x_rows] = points.ravel()
+    Unlike :func:`min_circle_clarabel` this does not check the status, so
+    callers that need Clarabel's diagnostics (iteration count, solve time)
+    can inspect them directly.
 
-    # --- Cones: n SOC cones each of dimension (d+1) --------------------------
-    cones = [clarabel.SecondOrderConeT(d + 1) for _ in range(n)]  # ty: ignore[unresolved-attribute]
+    Args:
+        points: A numpy array of shape ``(n, d)``.
+        verbose: If ``True``, print Clarabel's iteration log.
+        radii: Optional ball radii, see :func:`_build_soc_program`.
+        time_limit: Optional limit in seconds on Clarabel's solve time; the
+            status is ``MaxTime`` when it is hit.
+        stop: Optional predicate polled once per interior-point iteration;
+            the solve ends with status ``CallbackTerminated`` once it returns
+            ``True``.
 
-    return p_mat, q, a_mat, b, cones
+    Returns:
+        The ``clarabel.DefaultSolution`` of the enclosing-ball program.
+    """
+    import clarabel
 
+    p_mat, q, a_mat, b, cones = _build_soc_program(points, radii)
 
-def min_circle_clarabel(points: np.ndarray, verbose: bool = False) -> tuple[float, np.ndarray]:
+    settings = clarabel.DefaultSettings.default()  # ty: ignore[unresolved-attribute]
+    settings.verbose = verbose
+    if time_limit is not None:
+        settings.time_limit = time_limit
+
+    solver = clarabel.DefaultSolver(p_mat, q, a_mat, b, cones, settings)  # ty: ignore[unresolved-attribute]
+    if stop is not None:
+        solver.set_termination_callback(lambda _info: stop())
+    solution = solver.solve()
+    metrics.record_clarabel(solution)
+    return solution
+
+
+@metrics.instrument
+def min_circle_clarabel(points: np.ndarray, verbose: bool = False) -> Ball:
     """Compute the smallest enclosing circle for a set of points using Clarabel directly.
 
     This function solves the same convex optimisation problem as
     :func:`min_circle_cvx` but bypasses CVXPY and calls the Clarabel solver
     directly.  The second-order-cone program is assembled by
-    :func:`_build_soc_program`; this function then solves it and extracts the
-    optimal radius and centre.
+    :func:`_build_soc_program` and solved by :func:`_solve_soc_program`; this
+    function checks the status and extracts the optimal radius and centre.
 
     Args:
         points: A numpy array of shape ``(n, d)`` where *n* is the number of
@@ -148,8 +255,9 @@ def min_circle_clarabel(points: np.ndarray, verbose: bool = False) -> tuple[floa
                  ``False``.
 
     Returns:
-        A tuple ``(radius, center)`` where *radius* is the optimal enclosing
-        radius (float) and *center* is a numpy array of shape ``(d,)``.
+        A :class:`~cvxball.ball.Ball` ``(radius, center)`` where *radius* is
+        the optimal enclosing radius (float) and *center* is a numpy array of
+        shape ``(d,)``.
 
     Raises:
         ValueError: If Clarabel does not return a ``Solved`` status.
@@ -160,16 +268,94 @@ def min_circle_clarabel(points: np.ndarray, verbose: bool = False) -> tuple[floa
         >>> points = np.array([[0, 0], [1, 0], [0, 1]])
         >>> radius, center = min_circle_clarabel(points)
     """
-    p_mat, q, a_mat, b, cones = _build_soc_program(points)
+    import clarabel
 
-    # --- Solve ---------------------------------------------------------------
-    settings = clarabel.DefaultSettings.default()  # ty: ignore[unresolved-attribute]
-    settings.verbose = verbose
+    solution = _solve_soc_program(points, verbose=verbose)
 
-    solver = clarabel.DefaultSolver(p_mat, q, a_mat, b, cones, settings)  # ty: ignore[unresolved-attribute]
-    solution = solver.solve()
+    if solution.status != clarabel.SolverStatus.Solved:  # ty: ignore[unresolved-attribute]
+        raise ValueError(f"Clarabel did not converge: status = {solution.status}")  # noqa: TRY003
+
+    return Ball(float(solution.x[0]), np.asarray(solution.x[1:]))
+
+
+def _check_balls(centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+    """Validate ball radii against their centres and return them as a float64 array."""
+    radii = np.asarray(radii, dtype=np.float64)
+    if radii.shape != (centers.shape[0],):
+        raise ValueError(f"radii must have shape ({centers.shape[0]},), got {radii.shape}")  # noqa: TRY003
+    if np.any(radii < 0):
+        raise ValueError("radii must be non-negative")  # noqa: TRY003
+    return radii
+
+
+@metrics.instrument
+def min_ball_of_balls_cvx(centers: np.ndarray, radii: np.ndarray, **kwargs: Any) -> Ball:
+    """Compute the smallest ball enclosing a set of balls using CVXPY.
+
+    The constraints ``‖c_i - x‖ + r_i <= r`` are second-order cones, so this
+    is the same program as :func:`min_circle_cvx` with the radius bound of
+    each cone shifted by ``r_i``.  Merging ``k`` cluster summaries therefore
+    costs a ``k``-constraint solve, independent of the cluster sizes.
+
+    Args:
+        centers: A numpy array of shape ``(k, d)`` with the ball centres.
+        radii: A numpy array of shape ``(k,)`` with the (non-negative) radii.
+        **kwargs: Additional keyword arguments to pass to the solver.
+
+    Returns:
+        The enclosing :class:`~cvxball.ball.Ball`.
+
+    Raises:
+        ValueError: If ``radii`` has the wrong shape or negative entries, or
+            if the optimisation fails.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.solver import min_ball_of_balls_cvx
+        >>> centers = np.array([[0.0, 0.0], [4.0, 0.0]])
+        >>> radius, center = min_ball_of_balls_cvx(centers, np.array([1.0, 1.0]), solver="CLARABEL")
+    """
+    radii = _check_balls(centers, radii)
+    problem, r, x = _cvx_problem(centers, radii)
+    problem.solve(**kwargs)  # type: ignore[no-untyped-call]  # cvxpy's Problem.solve is unannotated
+
+    if r.value is None or x.value is None:
+        raise ValueError("Optimization failed to find a solution")  # noqa: TRY003
+
+    return Ball(float(r.value[0]), x.value)
+
+
+@metrics.instrument
+def min_ball_of_balls_clarabel(centers: np.ndarray, radii: np.ndarray, verbose: bool = False) -> Ball:
+    """Compute the smallest ball enclosing a set of balls using Clarabel directly.
+
+    See :func:`min_ball_of_balls_cvx`; this variant assembles the program with
+    :func:`_build_soc_program` and skips CVXPY, like :func:`min_circle_clarabel`.
+
+    Args:
+        centers: A numpy array of shape ``(k, d)`` with the ball centres.
+        radii: A numpy array of shape ``(k,)`` with the (non-negative) radii.
+        verbose: If ``True``, print Clarabel's iteration log.
+
+    Returns:
+        The enclosing :class:`~cvxball.ball.Ball`.
+
+    Raises:
+        ValueError: If ``radii`` has the wrong shape or negative entries, or
+            if Clarabel does not return a ``Solved`` status.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.solver import min_ball_of_balls_clarabel
+        >>> centers = np.array([[0.0, 0.0], [4.0, 0.0]])
+        >>> radius, center = min_ball_of_balls_clarabel(centers, np.array([1.0, 1.0]))
+    """
+    import clarabel
+
+    radii = _check_balls(centers, radii)
+    solution = _solve_soc_program(centers, verbose=verbose, radii=radii)
 
     if solution.status != clarabel.SolverStatus.Solved:  # ty: ignore[unresolved-attribute]
         raise ValueError(f"Clarabel did not converge: status = {solution.status}")  # noqa: TRY003
 
-    return float(solution.x[0]), np.asarray(solution.x[1:])
+    return Ball(float(solution.x[0]), np.asarray(solution.x[1:]))
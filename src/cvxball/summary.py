@@ -0,0 +1,220 @@
+"""Mergeable, serialisable summaries for enclosing balls of partitioned data.
+
+When the points are spread over many processes or machines, the global ball
+can be computed from small per-partition summaries instead of the raw data.
+A :class:`Summary` holds a *directional ε-kernel*: for every direction ``u``
+of a fixed set ``U``, the point that reaches farthest along ``u``.
+
+``U`` depends only on the dimension and ``eps``.  It is a grid on the faces of
+the cube ``[-1, 1]^d``, fine enough that every unit vector lies within an
+angle ``δ`` of some member, with ``cos δ = 1 / (1 + eps)``.  For any centre
+``c``, let ``p`` be the point farthest from ``c`` and ``u`` a direction
+within ``δ`` of ``p - c``.  The kernel point ``q`` extreme along ``u``
+satisfies ``|q - c| >= <u, q - c> >= <u, p - c> >= |p - c| cos δ``.  The
+ball around the kernel's enclosing ball therefore encloses every point once
+enlarged by ``1 + eps``, and the kernel's radius bounds the optimum from
+below: :meth:`Summary.solve` returns both, at most a factor
+``(1 + eps) (1 + tol)`` apart.
+
+The extreme point of a union along ``u`` is the farther of the two parts'
+extreme points, so :func:`merge` keeps the extremes of the union of the
+kernels and the guarantee holds for merged summaries as it does for one
+partition.  Ties go to the first point in sorted order, which makes the
+result exactly associative and commutative.  ``U`` grows like
+``(sqrt(d) / eps) ** (d - 1)``, so the summaries suit low dimensions;
+:func:`summarize` rejects an ``eps`` that would need more than 65,536
+directions.
+
+Summaries serialise to a fixed little-endian binary layout
+(:meth:`Summary.to_bytes`) of a 32-byte header followed by the float64 kernel
+points.
+"""
+
+import functools
+import itertools
+import math
+import struct
+from typing import NamedTuple
+
+import numpy as np
+
+from cvxball.ball import Ball
+from cvxball.coreset import min_circle_coreset
+
+# Header: magic, format version, dimension, kernel rows, eps, point count.
+_HEADER = struct.Struct("<4sHHIdQ4x")
+_MAGIC = b"CVXB"
+_VERSION = 2
+
+# Upper bounds are computed from a handful of float64 operations; round them up by this much.
+_ROUNDING = 16 * np.finfo(np.float64).eps
+
+# Largest direction set a summary may use; it grows exponentially with the dimension.
+_MAX_DIRECTIONS = 1 << 16
+
+# Projections are computed for this many (point, direction) pairs at a time.
+_BLOCK_ENTRIES = 1 << 22
+
+
+@functools.cache
+def _directions(d: int, eps: float) -> np.ndarray:
+    """Unit vectors within an angle ``arccos(1 / (1 + eps))`` of every unit vector, in a fixed order.
+
+    A unit vector scaled onto the cube surface lies in a face, within
+    ``h sqrt(d - 1) / 2`` of a grid point of spacing ``h``; its length is at
+    least 1, so the sine of the angle to that grid point is at most the same.
+
+    Raises:
+        ValueError: If more than ``_MAX_DIRECTIONS`` directions are needed.
+    """
+    sine = math.sqrt(1.0 - 1.0 / (1.0 + eps) ** 2)
+    per_axis = math.ceil(math.sqrt(d - 1) / sine) + 1 if d > 1 else 1
+    if 2 * d * per_axis ** (d - 1) > _MAX_DIRECTIONS:
+        raise ValueError(f"eps={eps} needs too many directions in {d} dimensions; increase eps")  # noqa: TRY003
+    grid = np.linspace(-1.0, 1.0, per_axis) if per_axis > 1 else np.zeros(1)
+    face = np.array(list(itertools.product(grid, repeat=d - 1)), dtype=np.float64).reshape(per_axis ** (d - 1), d - 1)
+    faces = [np.insert(face, axis, side, axis=1) for axis in range(d) for side in (-1.0, 1.0)]
+    directions = np.unique(np.vstack(faces), axis=0)
+    directions /= np.linalg.norm(directions, axis=1)[:, None]
+    directions.setflags(write=False)
+    return directions
+
+
+def _projections(points: np.ndarray, directions: np.ndarray) -> np.ndarray:
+    """``points @ directions.T``, summed coordinate by coordinate so every entry rounds the same way in any batch."""
+    projections: np.ndarray = points[:, None, 0] * directions[None, :, 0]
+    for axis in range(1, points.shape[1]):
+        projections += points[:, None, axis] * directions[None, :, axis]
+    return projections
+
+
+def _kernel(points: np.ndarray, eps: float) -> np.ndarray:
+    """The points of ``points`` extreme along a direction, ties going to the earliest; sorted and unique."""
+    directions = _directions(points.shape[1], eps)
+    best, where = np.full(directions.shape[0], -np.inf), np.zeros(directions.shape[0], dtype=np.intp)
+    step = max(1, _BLOCK_ENTRIES // directions.shape[0])
+    for start in range(0, points.shape[0], step):
+        projections = _projections(points[start : start + step], directions)
+        top = np.argmax(projections, axis=0)
+        value = projections[top, np.arange(directions.shape[0])]
+        better = value > best
+        best[better], where[better] = value[better], start + top[better]
+    return np.unique(points[where], axis=0)
+
+
+class Summary(NamedTuple):
+    """Directional ε-kernel of a set of points, see the module docstring.
+
+    Attributes:
+        kernel: The extreme points, sorted and unique, shape ``(m, d)``.
+        eps: Relative error bound of the kernel; summaries merge only with
+            summaries of the same ``eps``.
+        n_points: Number of points summarised.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.summary import merge, summarize
+        >>> rng = np.random.default_rng(0)
+        >>> parts = [rng.standard_normal((10_000, 3)) for _ in range(4)]
+        >>> left = merge(summarize(parts[0]), summarize(parts[1]))
+        >>> total = merge(left, merge(summarize(parts[2]), summarize(parts[3])))
+        >>> ball, lower = Summary.from_bytes(total.to_bytes()).solve()
+        >>> bool(all(ball.contains(part).all() for part in parts)), total.n_points
+        (True, 40000)
+        >>> bool(ball.radius / lower - 1 < total.eps + 1e-5)
+        True
+    """
+
+    kernel: np.ndarray
+    eps: float
+    n_points: int
+
+    def merge(self, other: "Summary") -> "Summary":
+        """Summary of the union of both point sets, see :func:`merge`."""
+        return merge(self, other)
+
+    def solve(self, tol: float = 1e-6) -> tuple[Ball, float]:
+        """Compute a ball enclosing every summarised point, and a lower bound on the optimal radius.
+
+        Args:
+            tol: Relative tolerance of the solve on the kernel.
+
+        Returns:
+            A tuple ``(ball, lower)``.  The ball encloses every summarised
+            point, and the smallest enclosing radius lies in
+            ``[lower, ball.radius]``, where
+            ``ball.radius <= (1 + eps) (1 + tol) lower``, up to the accuracy
+            of the conic solves.
+        """
+        kernel_ball, _ = min_circle_coreset(self.kernel, tol=tol)
+        radius = kernel_ball.radius * (1.0 + self.eps) * (1.0 + _ROUNDING)
+        return Ball(radius, kernel_ball.center), kernel_ball.radius / (1.0 + tol)
+
+    def to_bytes(self) -> bytes:
+        """Serialise to the binary layout described in the module docstring."""
+        m, d = self.kernel.shape
+        header = _HEADER.pack(_MAGIC, _VERSION, d, m, self.eps, self.n_points)
+        return header + np.ascontiguousarray(self.kernel, dtype="<f8").tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Summary":
+        """Read a summary written by :meth:`to_bytes`.
+
+        Raises:
+            ValueError: If ``data`` is not a serialised summary of a
+                supported version.
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("data is too short for a summary")  # noqa: TRY003
+        magic, version, d, m, eps, n_points = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"data is not a version-{_VERSION} cvxball summary")  # noqa: TRY003
+        if len(data) != _HEADER.size + 8 * m * d:
+            raise ValueError("data length does not match the summary header")  # noqa: TRY003
+        kernel = np.frombuffer(data, dtype="<f8", offset=_HEADER.size).astype(np.float64)
+        return cls(kernel.reshape(m, d), eps, n_points)
+
+
+def summarize(points: np.ndarray, eps: float = 1e-2) -> Summary:
+    """Summarise one partition of the points.
+
+    Args:
+        points: A numpy array of shape ``(n, d)`` with ``n >= 1``.
+        eps: Relative error bound, see the module docstring.  Smaller values
+            keep more points; the direction set, and with it the run time,
+            grows like ``(sqrt(d) / eps) ** (d - 1)``.
+
+    Returns:
+        The :class:`Summary`.
+
+    Raises:
+        ValueError: If ``points`` is not a non-empty ``(n, d)`` array, or
+            ``eps`` is not positive or too small for the dimension.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2 or points.shape[0] == 0:
+        raise ValueError("points must be a non-empty (n, d) array")  # noqa: TRY003
+    if not eps > 0.0:
+        raise ValueError("eps must be positive")  # noqa: TRY003
+    return Summary(_kernel(points, eps), float(eps), points.shape[0])
+
+
+def merge(*summaries: Summary) -> Summary:
+    """Combine summaries of disjoint point sets into the summary of their union.
+
+    The extremes of the union are taken over the union of the kernels, so the
+    result is the same for any grouping and order of the arguments and keeps
+    the error bound of its parts.
+
+    Raises:
+        ValueError: If no summary is given, or the dimensions or ``eps`` differ.
+    """
+    if not summaries:
+        raise ValueError("merge needs at least one summary")  # noqa: TRY003
+    if len({summary.kernel.shape[1] for summary in summaries}) != 1:
+        raise ValueError("summaries must have the same dimension")  # noqa: TRY003
+    if len({summary.eps for summary in summaries}) != 1:
+        raise ValueError("summaries must have the same eps")  # noqa: TRY003
+    eps = summaries[0].eps
+    union = np.unique(np.vstack([summary.kernel for summary in summaries]), axis=0)
+    return Summary(_kernel(union, eps), eps, sum(summary.n_points for summary in summaries))
@@ -0,0 +1,312 @@
+"""Bounding-sphere hierarchies (sphere trees) over point sets.
+
+:class:`SphereTree` recursively splits a point set at the median of its
+principal axis until nodes hold at most ``leaf_size`` points, then gives every
+node the smallest enclosing ball of its points, within a factor
+``1 + 1e-9``.  The nodes of one level hold disjoint slices of the points, so
+all of them are solved at once by :func:`cvxball.batch.min_circle_grouped`,
+the parents from the points near their children's spheres (see
+:meth:`SphereTree._bound`).
+
+A minimal parent ball need not contain its children's balls, only their
+points.  The region of a leaf is therefore the intersection of the balls on
+the path from the root to it: it contains every point of the leaf, and it is
+what the queries test against, so pruning a query at any node is exact.
+
+All nodes live in flat NumPy arrays indexed by node id (root ``0``, children
+of node ``i`` at ``children[i]`` and ``children[i] + 1``), and the batch
+queries walk the tree one level at a time for all queries at once.  Building
+costs ``O(n log n)``: each level partitions the points with
+:func:`numpy.argpartition`, and the balls of each level are verified in a
+few passes over its points.  This makes building about three times slower
+than bounding the nodes with centroid balls.
+"""
+
+import numpy as np
+
+from cvxball.ball import Ball
+from cvxball.batch import _segment_argmax, _segment_sq_distances, min_circle_grouped
+
+# The principal axis of a node is estimated from at most this many points.
+_AXIS_SAMPLE = 256
+
+# Relative radius tolerance of the node balls.
+_NODE_TOL = 1e-9
+
+# Points within this relative distance of a node's sphere are passed up to
+# seed its parent's solve; more of them save verification rounds.
+_SUPPORT = 1e-3
+
+# Radii are inflated by this multiple of |center| + radius, the scale of the
+# rounding errors in the distances, so that no point can test outside its ball.
+_ROUNDING = 16 * np.finfo(np.float64).eps
+
+# Queries are processed in batches of this many to bound the traversal frontier.
+_QUERY_BATCH = 1 << 14
+
+
+def _scatter(points: np.ndarray) -> np.ndarray:
+    """Scatter matrix of (a subsample of) ``points`` about their mean."""
+    if points.shape[0] > _AXIS_SAMPLE:
+        points = points[:: points.shape[0] // _AXIS_SAMPLE]
+    # Shift by one member first so that large coordinate offsets do not cancel.
+    shifted = points - points[0]
+    total = shifted.sum(axis=0)
+    scatter: np.ndarray = shifted.T @ shifted - np.outer(total, total) / shifted.shape[0]
+    return scatter
+
+
+def _slices(starts: np.ndarray, stops: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Positions of the disjoint sorted ranges ``[starts[i], stops[i])`` back to back, and where each range begins."""
+    sizes = stops - starts
+    offsets = np.zeros(sizes.size, dtype=np.intp)
+    np.cumsum(sizes[:-1], out=offsets[1:])
+    return np.repeat(starts - offsets, sizes) + np.arange(int(sizes.sum())), offsets
+
+
+class SphereTree:
+    """A binary bounding-sphere hierarchy stored in flat arrays.
+
+    Attributes:
+        points: The ``(n, d)`` float64 input points.
+        order: Permutation of ``range(n)``; node ``i`` holds the points
+            ``order[start[i]:stop[i]]``.
+        start: First position in ``order`` of each node, shape ``(m,)``.
+        stop: One past the last position in ``order`` of each node.
+        children: Id of the first child of each node, ``-1`` for leaves.
+        depth: Depth of each node, ``0`` for the root.
+        centers: Ball centres, shape ``(m, d)``.
+        radii: Ball radii, shape ``(m,)``; node ``i``'s ball is the smallest
+            enclosing ball of its points, padded for rounding.
+
+    Example:
+        >>> import numpy as np
+        >>> from cvxball.tree import SphereTree
+        >>> points = np.random.default_rng(0).standard_normal((1000, 3))
+        >>> tree = SphereTree(points, leaf_size=16)
+        >>> bool(tree.contains(points).all())
+        True
+    """
+
+    def __init__(self, points: np.ndarray, leaf_size: int = 16) -> None:
+        """Build the hierarchy.
+
+        Args:
+            points: A numpy array of shape ``(n, d)`` with ``n >= 1``.
+            leaf_size: Maximum number of points per leaf (at least 1).
+
+        Raises:
+            ValueError: If ``points`` is empty or ``leaf_size < 1``.
+        """
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be at least 1")  # noqa: TRY003
+        self.points = np.asarray(points, dtype=np.float64)
+        if self.points.ndim != 2 or self.points.shape[0] == 0:
+            raise ValueError("points must be a non-empty (n, d) array")  # noqa: TRY003
+        self.leaf_size = leaf_size
+        self._bound(self._split())
+
+    def __len__(self) -> int:
+        """Number of nodes."""
+        return self.radii.shape[0]
+
+    @property
+    def ball(self) -> Ball:
+        """The root ball, enclosing every point."""
+        return Ball(float(self.radii[0]), self.centers[0].copy())
+
+    @property
+    def leaves(self) -> np.ndarray:
+        """Ids of the leaf nodes."""
+        return np.flatnonzero(self.children < 0)
+
+    # --- Construction ---------------------------------------------------------
+
+    def _split(self) -> np.ndarray:
+        """Partition the points level by level along principal axes; return them in tree order."""
+        n = self.points.shape[0]
+        order = np.arange(n)
+        # Points kept in ``order`` so each node's members are a contiguous slice.
+        permuted = self.points.copy()
+        start, stop, children, depth = [0], [n], [-1], [0]
+        frontier = [0]
+        while frontier:
+            big = [node for node in frontier if stop[node] - start[node] > self.leaf_size]
+            if not big:
+                break
+            # One batched eigendecomposition per level instead of one call per node.
+            scatter = np.stack([_scatter(permuted[start[node] : stop[node]]) for node in big])
+            axes = np.linalg.eigh(scatter)[1][:, :, -1]
+            frontier = []
+            for node, axis in zip(big, axes, strict=True):
+                s, e = start[node], stop[node]
+                half = (e - s) // 2
+                part = np.argpartition(permuted[s:e] @ axis, half)
+                order[s:e] = order[s:e][part]
+                permuted[s:e] = permuted[s:e][part]
+                children[node] = len(start)
+                frontier += [len(start), len(start) + 1]
+                start += [s, s + half]
+                stop += [s + half, e]
+                children += [-1, -1]
+                depth += [depth[node] + 1] * 2
+
+        self.order = order
+        self.start = np.asarray(start, dtype=np.intp)
+        self.stop = np.asarray(stop, dtype=np.intp)
+        self.children = np.asarray(children, dtype=np.intp)
+        self.depth = np.asarray(depth, dtype=np.intp)
+        return permuted
+
+    def _bound(self, permuted: np.ndarray) -> None:
+        """Solve the enclosing balls of the leaves, then of the parents bottom-up one level at a time.
+
+        A parent is solved from the points near its children's spheres, then
+        checked against all its points; the farthest point outside is added
+        and the parent re-solved until none is left, as in
+        :func:`~cvxball.coreset.min_circle_coreset`.  Each round solves all
+        the unfinished parents of a level at once.
+        """
+        m, d = len(self.start), self.points.shape[1]
+        self.centers = np.empty((m, d))
+        self.radii = np.empty(m)
+        parent = np.full(m, -1)
+        internal = np.flatnonzero(self.children >= 0)
+        parent[self.children[internal]] = parent[self.children[internal] + 1] = internal
+
+        # The leaves partition the points, so they are solved directly in one call.
+        leaves = self.leaves
+        leaves = leaves[np.argsort(self.start[leaves])]
+        sizes = self.stop[leaves] - self.start[leaves]
+        _, self.centers[leaves] = min_circle_grouped(permuted, np.repeat(np.arange(leaves.size), sizes), _NODE_TOL)
+        core, owner = self._finish(permuted, leaves)
+
+        for level in range(int(np.max(self.depth)) - 1, -1, -1):
+            nodes = internal[self.depth[internal] == level]
+            nodes = nodes[np.argsort(self.start[nodes])]
+            slot = np.full(m, -1)
+            slot[nodes] = np.arange(nodes.size)
+            passed = slot[parent[owner]] >= 0
+            candidates, label = core[passed], slot[parent[owner[passed]]]
+            core, owner = core[~passed], owner[~passed]
+            live = np.arange(nodes.size)
+            while live.size:
+                position = np.full(nodes.size, -1)
+                position[live] = np.arange(live.size)
+                chosen = position[label] >= 0
+                radii, centers = min_circle_grouped(permuted[candidates[chosen]], position[label[chosen]], _NODE_TOL)
+                self.centers[nodes[live]] = centers
+                rows, offsets = _slices(self.start[nodes[live]], self.stop[nodes[live]])
+                d2 = _segment_sq_distances(permuted[rows], centers, np.diff(np.append(offsets, rows.size)))
+                far = _segment_argmax(d2, offsets)
+                outside = d2[far] > radii * radii
+                candidates = np.append(candidates, rows[far[outside]])
+                label = np.append(label, live[outside])
+                live = live[outside]
+            nodes_core, nodes_owner = self._finish(permuted, nodes)
+            core, owner = np.append(core, nodes_core), np.append(owner, nodes_owner)
+
+    def _finish(self, permuted: np.ndarray, nodes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Set the radii of ``nodes`` (sorted by start) around their centres; return their points near the sphere.
+
+        Returns:
+            Arrays ``(rows, owner)`` of the rows of ``permuted`` within
+            ``_SUPPORT`` of their node's sphere and the node of each.
+        """
+        rows, offsets = _slices(self.start[nodes], self.stop[nodes])
+        sizes = self.stop[nodes] - self.start[nodes]
+        centers = self.centers[nodes]
+        d2 = _segment_sq_distances(permuted[rows], centers, sizes)
+        radii = np.sqrt(np.maximum.reduceat(d2, offsets))
+        self.radii[nodes] = radii + _ROUNDING * (np.linalg.norm(centers, axis=1) + radii)
+        near = d2 >= np.repeat((radii * (1.0 - _SUPPORT)) ** 2, sizes)
+        return rows[near], np.repeat(nodes, sizes)[near]
+
+    # --- Queries --------------------------------------------------------------
+
+    def _walk(self, centers: np.ndarray, radii: np.ndarray, first_hit_only: bool) -> tuple[np.ndarray, np.ndarray]:
+        """Find all (query, leaf) pairs whose query ball meets every ball on the leaf's path.
+
+        Args:
+            centers: Query centres, shape ``(q, d)``.
+            radii: Query radii, shape ``(q,)``.
+            first_hit_only: Stop descending for a query once it has one hit.
+
+        Returns:
+            Arrays ``(query, leaf)`` of the pairs found.
+        """
+        query = np.arange(centers.shape[0])
+        node = np.zeros_like(query)
+        found = np.zeros(centers.shape[0], dtype=bool)
+        hit_query, hit_leaf = [], []
+        while query.size:
+            if first_hit_only:
+                keep = ~found[query]
+                query, node = query[keep], node[keep]
+            diff = centers[query] - self.centers[node]
+            reach = self.radii[node] + radii[query]
+            overlap = np.einsum("ij,ij->i", diff, diff) <= reach * reach
+            query, node = query[overlap], node[overlap]
+            leaf = self.children[node] < 0
+            hit_query.append(query[leaf])
+            hit_leaf.append(node[leaf])
+            found[query[leaf]] = True
+            query, first = query[~leaf], self.children[node[~leaf]]
+            query = np.repeat(query, 2)
+            node = np.stack([first, first + 1], axis=1).ravel()
+        return np.concatenate(hit_query), np.concatenate(hit_leaf)
+
+    def overlap_pairs(self, centers: np.ndarray, radii: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Broad phase: all (query ball, leaf) pairs whose query meets the leaf's region.
+
+        Args:
+            centers: Query centres, shape ``(q, d)``.
+            radii: Query radii, shape ``(q,)``.
+
+        Returns:
+            Arrays ``(query, leaf)`` of equal length; the points of a leaf are
+            ``order[start[leaf]:stop[leaf]]``.
+        """
+        centers = np.asarray(centers, dtype=np.float64)
+        radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), centers.shape[:1])
+        queries, leaves = [], []
+        for s in range(0, centers.shape[0], _QUERY_BATCH):
+            q, leaf = self._walk(centers[s : s + _QUERY_BATCH], radii[s : s + _QUERY_BATCH], first_hit_only=False)
+            queries.append(q + s)
+            leaves.append(leaf)
+        if not queries:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+        return np.concatenate(queries), np.concatenate(leaves)
+
+    def overlaps(self, centers: np.ndarray, radii: np.ndarray | float) -> np.ndarray:
+        """Test which query balls meet at least one leaf region.
+
+        A query meets a leaf region if it intersects every ball on the path
+        from the root to the leaf (see the module docstring).
+
+        Args:
+            centers: Query centres, shape ``(q, d)``.
+            radii: Query radii, shape ``(q,)`` or a scalar.
+
+        Returns:
+            A boolean array of shape ``(q,)``.
+        """
+        centers = np.asarray(centers, dtype=np.float64)
+        radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), centers.shape[:1])
+        result = np.zeros(centers.shape[0], dtype=bool)
+        for s in range(0, centers.shape[0], _QUERY_BATCH):
+            q, _ = self._walk(centers[s : s + _QUERY_BATCH], radii[s : s + _QUERY_BATCH], first_hit_only=True)
+            result[q + s] = True
+        return result
+
+    def contains(self, points: np.ndarray, tol: float = 0.0) -> np.ndarray:
+        """Test which points lie inside at least one leaf region (its balls enlarged by ``tol``).
+
+        Args:
+            points: A numpy array of shape ``(q, d)``.
+            tol: Absolute slack added to every leaf radius.
+
+        Returns:
+            A boolean array of shape ``(q,)``.
+        """
+        return self.overlaps(points, tol)
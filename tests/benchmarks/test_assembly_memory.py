@@ -0,0 +1,61 @@
+"""Peak-memory benchmarks for assembling the Clarabel enclosing-ball program.
+
+Run with ``make benchmark``.  Besides the timing collected by pytest-benchmark,
+each case records the peak number of bytes allocated per point while building
+the program (measured with :mod:`tracemalloc`, which NumPy reports to) in the
+benchmark's ``extra_info`` so it ends up in the JSON results.
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from cvxball.solver import _build_soc_program
+
+# Expected bytes per point for the program arrays: int32 indices (4), float64
+# data (8) and float64 b (8) for each of the d + 1 rows, plus one list slot per
+# cone.  The slack covers the fixed-size objective terms and allocator noise.
+_SLACK = 1.10
+
+
+def _peak_bytes(points: np.ndarray) -> int:
+    """Return the peak traced allocation while assembling the program for ``points``."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        program = _build_soc_program(points)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del program
+    return peak
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize(("n", "d"), [(100_000, 2), (100_000, 10), (1_000_000, 3)])
+def test_assembly_peak_memory(benchmark, n, d, dtype):
+    """Assembly stays within the closed-form CSC footprint for float64 and float32 input."""
+    rng = np.random.default_rng(0)
+    points = rng.standard_normal((n, d)).astype(dtype)
+
+    bytes_per_point = _peak_bytes(points) / n
+    benchmark.extra_info["bytes_per_point"] = bytes_per_point
+    benchmark.pedantic(_build_soc_program, args=(points,), rounds=3, iterations=1)
+
+    assert bytes_per_point <= _SLACK * (20 * (d + 1) + 8)
+
+
+def test_assembly_peak_memory_strided(benchmark):
+    """A non-contiguous view is read in place rather than copied first."""
+    rng = np.random.default_rng(0)
+    n, d = 200_000, 3
+    points = rng.standard_normal((n, 2 * d))[:, ::2]
+
+    bytes_per_point = _peak_bytes(points) / n
+    benchmark.extra_info["bytes_per_point"] = bytes_per_point
+    benchmark.pedantic(_build_soc_program, args=(points,), rounds=3, iterations=1)
+
+    assert bytes_per_point <= _SLACK * (20 * (d + 1) + 8)
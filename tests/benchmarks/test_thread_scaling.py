@@ -0,0 +1,58 @@
+"""Thread-count scaling of concurrent Clarabel solves.
+
+Every case solves the same batch of independent problems with
+:func:`cvxball.pool.solve_many`, once in the calling thread and once on a
+thread pool of a given size, and records both times and the speedup in the
+benchmark's ``extra_info`` together with the CPU count and whether
+:func:`~cvxball.pool.clarabel_releases_gil`.  A speedup is only required
+where it is possible: with the GIL released and a core for every thread.
+"""
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from cvxball.pool import clarabel_releases_gil, solve_many
+
+_BATCH = 8
+_POINTS = 2_000
+_ROUNDS = 3
+
+# Share of the ideal speedup (the thread count) required when every thread has a core.
+_EFFICIENCY = 0.5
+
+
+def _best_time(problems: list[np.ndarray], threads: int) -> float:
+    """Fastest of ``_ROUNDS`` solves of the batch with ``threads`` threads."""
+    best = float("inf")
+    for _ in range(_ROUNDS):
+        start = time.perf_counter()
+        solve_many(problems, threads, "thread")
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("threads", [2, 4])
+def test_thread_scaling(benchmark, threads):
+    """A batch of mid-sized problems solved with one thread and with 2 and 4 threads."""
+    rng = np.random.default_rng(0)
+    problems = [rng.standard_normal((_POINTS, 3)) for _ in range(_BATCH)]
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    releases_gil = clarabel_releases_gil()
+
+    serial = _best_time(problems, 1)
+    balls = benchmark.pedantic(solve_many, args=(problems, threads, "thread"), rounds=_ROUNDS, iterations=1)
+    # With --benchmark-disable the run is not timed, so it is timed here instead.
+    parallel = benchmark.stats.stats.min if benchmark.stats else _best_time(problems, threads)
+    speedup = serial / parallel
+
+    benchmark.extra_info.update(
+        cpus=cpus, releases_gil=releases_gil, serial_seconds=serial, threads=threads, speedup=speedup
+    )
+    assert len(balls) == _BATCH
+    if releases_gil and cpus >= threads:
+        assert speedup > _EFFICIENCY * threads
@@ -0,0 +1,147 @@
+"""Tests for the asyncio entry points."""
+
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from cvxball.aio import AsyncSolver
+from cvxball.solver import min_ball_of_balls_clarabel, min_circle_clarabel
+
+
+def _large(n: int = 40_000) -> np.ndarray:
+    """A point set whose solve takes long enough to interrupt."""
+    return np.random.default_rng(0).standard_normal((n, 3))
+
+
+def test_matches_synchronous_solvers():
+    """Results equal the blocking solvers', for points and for balls."""
+    rng = np.random.default_rng(1)
+    points, radii = rng.standard_normal((200, 3)), rng.uniform(0, 1, 200)
+
+    async def main():
+        with AsyncSolver() as solver:
+            return await asyncio.gather(solver.min_circle(points), solver.min_ball_of_balls(points, radii))
+
+    ball, merged = asyncio.run(main())
+    assert ball.radius == pytest.approx(min_circle_clarabel(points).radius, rel=1e-9)
+    assert merged.radius == pytest.approx(min_ball_of_balls_clarabel(points, radii).radius, rel=1e-9)
+
+
+def test_concurrency_limit():
+    """No more than ``max_concurrency`` solves run at once."""
+    points = np.random.default_rng(2).standard_normal((2_000, 3))
+    running, peak = 0, 0
+
+    class Counting(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            def wrapped():
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    running -= 1
+
+            return super().submit(wrapped)
+
+    async def main():
+        with Counting(8) as executor:
+            solver = AsyncSolver(executor, max_concurrency=2)
+            return await asyncio.gather(*(solver.min_circle(points) for _ in range(6)))
+
+    balls = asyncio.run(main())
+    assert len(balls) == 6
+    assert peak <= 2
+
+
+def test_deadline_maps_onto_time_limit():
+    """A deadline shorter than the solve raises TimeoutError without blocking the loop."""
+
+    async def main():
+        with AsyncSolver() as solver:
+            start = time.monotonic()
+            with pytest.raises(TimeoutError):
+                await solver.min_circle(_large(), timeout=0.2)
+            return time.monotonic() - start
+
+    assert asyncio.run(main()) < 2.0
+
+
+def test_deadline_covers_queueing():
+    """A call that cannot get a slot before its deadline times out."""
+
+    async def main():
+        with AsyncSolver(max_concurrency=1) as solver:
+            busy = asyncio.create_task(solver.min_circle(_large(), timeout=1.0))
+            await asyncio.sleep(0.05)
+            with pytest.raises(TimeoutError, match="slot"):
+                await solver.min_circle(np.zeros((3, 2)), timeout=0.1)
+            with pytest.raises(TimeoutError):
+                await busy
+
+    asyncio.run(main())
+
+
+def test_cancellation_frees_the_worker():
+    """Cancelling the awaiting task stops the solve, so the worker takes new work promptly."""
+
+    async def main():
+        with ThreadPoolExecutor(1) as executor:
+            solver = AsyncSolver(executor, max_concurrency=1)
+            task = asyncio.create_task(solver.min_circle(_large()))
+            await asyncio.sleep(0.3)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            start = time.monotonic()
+            await asyncio.get_running_loop().run_in_executor(executor, lambda: None)
+            return time.monotonic() - start
+
+    assert asyncio.run(main()) < 1.0
+
+
+def test_invalid_concurrency():
+    """The concurrency limit must be positive."""
+    with pytest.raises(ValueError, match="max_concurrency"):
+        AsyncSolver(max_concurrency=0)
+
+
+def test_cancelled_solve_holds_its_slot_until_it_stops():
+    """A cancelled solve keeps counting against the limit until its worker has actually stopped."""
+    running, peak = 0, 0
+
+    class Counting(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            def wrapped():
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    running -= 1
+
+            return super().submit(wrapped)
+
+    async def main():
+        with Counting(4) as executor:
+            solver = AsyncSolver(executor, max_concurrency=1)
+            task = asyncio.create_task(solver.min_circle(_large()))
+            await asyncio.sleep(0.3)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await solver.min_circle(_large(2_000))
+
+    asyncio.run(main())
+    assert peak == 1
+
+
+def test_process_pools_are_rejected():
+    """The stop event cannot be pickled, so only thread pools are accepted."""
+    with ProcessPoolExecutor(1) as executor, pytest.raises(TypeError, match="ThreadPoolExecutor"):
+        AsyncSolver(executor)
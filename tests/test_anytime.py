@@ -0,0 +1,63 @@
+"""Tests for the anytime solver with certified bounds."""
+
+import numpy as np
+import pytest
+
+from cvxball.anytime import Bracket, min_circle_anytime
+from cvxball.ball import Ball
+from cvxball.solver import min_circle_clarabel
+
+
+@pytest.mark.parametrize(("n", "d"), [(2_000, 2), (2_000, 3), (500, 10)])
+def test_bounds_bracket_the_optimum(n, d):
+    """The lower bound never exceeds the optimum, the ball encloses every point, and tol is met."""
+    points = np.random.default_rng(d).standard_normal((n, d))
+    optimum = min_circle_clarabel(points).radius
+    result = min_circle_anytime(points, time_limit=10.0, tol=1e-6)
+    assert result.ball.contains(points).all()
+    assert result.lower <= optimum * (1 + 1e-8)
+    assert result.upper <= (1 + 1e-6) * result.lower
+    assert result.gap <= 1e-6
+
+
+def test_zero_budget_still_certifies():
+    """With no time at all one iteration runs, and its bounds are valid if loose."""
+    points = np.random.default_rng(0).uniform(-1, 1, (20_000, 4))
+    optimum = min_circle_clarabel(points[:2_000]).radius
+    result = min_circle_anytime(points, time_limit=0.0)
+    assert result.iterations == 1
+    assert result.ball.contains(points).all()
+    assert 0.0 < result.lower <= result.upper
+    assert result.lower <= min_circle_anytime(points, time_limit=10.0).upper
+    assert result.upper >= optimum
+
+
+def test_more_time_never_hurts():
+    """A larger budget gives a gap at least as small."""
+    points = np.random.default_rng(1).standard_normal((50_000, 3))
+    quick = min_circle_anytime(points, time_limit=0.0)
+    slow = min_circle_anytime(points, time_limit=10.0)
+    assert slow.gap <= quick.gap
+    assert slow.iterations >= quick.iterations
+
+
+def test_degenerate_inputs():
+    """A single point and coincident points give zero radius and zero gap."""
+    for points in (np.array([[1.0, 2.0]]), np.ones((5, 3))):
+        result = min_circle_anytime(points, time_limit=1.0)
+        assert result.upper == 0.0
+        assert result.gap == 0.0
+
+
+def test_gap_of_unbounded_bracket():
+    """The gap is infinite while the lower bound is still zero."""
+    assert Bracket(Ball(1.0, np.zeros(2)), 0.0, 1).gap == np.inf
+
+
+@pytest.mark.parametrize(
+    ("points", "time_limit"), [(np.zeros((0, 2)), 1.0), (np.zeros(3), 1.0), (np.zeros((3, 2)), -1.0)]
+)
+def test_invalid(points, time_limit):
+    """Empty or malformed input and negative budgets are rejected."""
+    with pytest.raises(ValueError, match=r"points|time_limit"):
+        min_circle_anytime(points, time_limit)
@@ -0,0 +1,104 @@
+"""Tests for the Ball result type and its vectorised queries."""
+
+import numpy as np
+import pytest
+
+import cvxball.ball as ball_module
+from cvxball.ball import Ball, Balls
+from cvxball.solver import min_circle_clarabel
+
+
+@pytest.fixture
+def ball() -> Ball:
+    """A ball of radius 2 centred away from the origin."""
+    return Ball(2.0, np.array([1.0, -1.0, 0.5]))
+
+
+def _reference_distances(points: np.ndarray, center: np.ndarray) -> np.ndarray:
+    """Plain NumPy distances used as ground truth."""
+    return np.linalg.norm(points - center, axis=1)
+
+
+def test_solvers_return_ball():
+    """Solvers return a Ball that still unpacks as ``(radius, center)``."""
+    result = min_circle_clarabel(np.array([[0.0, 0.0], [2.0, 0.0]]))
+    assert isinstance(result, Ball)
+    radius, center = result
+    assert radius == pytest.approx(1.0, abs=1e-6)
+    assert center == pytest.approx([1.0, 0.0], abs=1e-6)
+
+
+def test_queries_match_reference(ball, monkeypatch):
+    """``contains``, ``signed_distance`` and ``farthest`` agree with plain NumPy across chunks."""
+    monkeypatch.setattr(ball_module, "_CHUNK_BYTES", 8 * 3 * 17)  # force many small chunks
+    points = np.random.default_rng(0).uniform(-3.0, 4.0, size=(1000, 3))
+    reference = _reference_distances(points, ball.center)
+
+    assert ball.signed_distance(points) == pytest.approx(reference - ball.radius, abs=1e-12)
+    np.testing.assert_array_equal(ball.contains(points), reference <= ball.radius)
+    np.testing.assert_array_equal(ball.contains(points, tol=0.5), reference <= ball.radius + 0.5)
+    index, distance = ball.farthest(points)
+    assert index == int(np.argmax(reference))
+    assert distance == pytest.approx(reference.max())
+
+
+def test_queries_accept_float32_and_strided(ball):
+    """float32 and non-contiguous inputs are handled without conversion by the caller."""
+    wide = np.random.default_rng(1).uniform(-3.0, 4.0, size=(500, 6))
+    points = wide[:, ::2]
+    reference = _reference_distances(points, ball.center)
+    assert ball.signed_distance(points) == pytest.approx(reference - ball.radius, abs=1e-12)
+    assert ball.signed_distance(points.astype(np.float32)) == pytest.approx(reference - ball.radius, abs=1e-5)
+
+
+def test_large_offsets_are_exact():
+    """Far from the origin the expansion cancels; those rows are recomputed exactly."""
+    center = np.full(3, 1e8)
+    points = center + np.random.default_rng(2).standard_normal((200, 3))
+    ball = Ball(1.0, center)
+    reference = _reference_distances(points, center)
+    assert ball.signed_distance(points) == pytest.approx(reference - 1.0, abs=1e-8)
+    np.testing.assert_array_equal(ball.contains(points), reference <= 1.0)
+
+
+def test_farthest_empty(ball):
+    """``farthest`` needs at least one point."""
+    with pytest.raises(ValueError, match="at least one point"):
+        ball.farthest(np.empty((0, 3)))
+
+
+@pytest.mark.parametrize(
+    ("first", "second", "expected"),
+    [
+        (Ball(1.0, np.array([0.0, 0.0])), Ball(1.0, np.array([4.0, 0.0])), Ball(3.0, np.array([2.0, 0.0]))),
+        (Ball(5.0, np.array([0.0, 0.0])), Ball(1.0, np.array([1.0, 1.0])), Ball(5.0, np.array([0.0, 0.0]))),
+        (Ball(1.0, np.array([1.0, 1.0])), Ball(5.0, np.array([0.0, 0.0])), Ball(5.0, np.array([0.0, 0.0]))),
+        (Ball(1.0, np.array([2.0, 2.0])), Ball(3.0, np.array([2.0, 2.0])), Ball(3.0, np.array([2.0, 2.0]))),
+    ],
+    ids=["disjoint", "first-contains", "second-contains", "concentric"],
+)
+def test_merge(first, second, expected):
+    """Merging is the closed-form smallest ball around both balls."""
+    merged = first.merge(second)
+    assert merged.radius == pytest.approx(expected.radius)
+    assert merged.center == pytest.approx(expected.center)
+
+
+def test_merge_encloses_both_solved_balls():
+    """Merging the balls of two point sets encloses their union."""
+    rng = np.random.default_rng(3)
+    a, b = rng.standard_normal((30, 2)), rng.standard_normal((30, 2)) + 3.0
+    merged = min_circle_clarabel(a).merge(min_circle_clarabel(b))
+    assert merged.contains(np.vstack([a, b]), tol=1e-6).all()
+    assert merged.radius >= min_circle_clarabel(np.vstack([a, b])).radius - 1e-6
+
+
+def test_balls_unpack_and_index():
+    """``Balls`` unpacks into arrays and hands out independent ``Ball`` copies."""
+    balls = Balls(np.array([1.0, 2.0]), np.array([[0.0, 0.0], [1.0, 1.0]]))
+    radii, centers = balls
+    assert radii.shape == (2,)
+    single = balls.ball(1)
+    assert single == (2.0, pytest.approx([1.0, 1.0]))
+    single.center[0] = 5.0
+    assert centers[1, 0] == 1.0
@@ -0,0 +1,186 @@
+"""Tests for the vectorised many-group enclosing-ball solver."""
+
+import numpy as np
+import pytest
+
+from cvxball import batch
+from cvxball.batch import (
+    _lockstep_balls,
+    _segment_argmax,
+    _segment_balls,
+    min_circle_batch,
+    min_circle_grouped,
+    min_circle_neighborhoods,
+)
+from cvxball.solver import min_circle_clarabel
+
+
+def _blocks(rng: np.random.Generator, sizes: np.ndarray, d: int) -> tuple[np.ndarray, np.ndarray]:
+    """Random blocks of the given sizes at random offsets, and their start offsets."""
+    offsets = np.repeat(rng.uniform(-50, 50, (sizes.size, d)), sizes, axis=0)
+    return rng.standard_normal((int(sizes.sum()), d)) + offsets, np.concatenate([[0], np.cumsum(sizes[:-1])])
+
+
+def test_segment_argmax():
+    """The first maximum of every block is found, ties resolved to the earliest row."""
+    values = np.array([1.0, 3.0, 3.0, 0.0, 5.0, 2.0, 2.0])
+    assert _segment_argmax(values, np.array([0, 3, 5])).tolist() == [1, 4, 5]
+
+
+@pytest.mark.parametrize("d", [2, 3, 7])
+def test_matches_per_group_solves(d):
+    """Every ball encloses its block and is within tolerance of the optimum."""
+    rng = np.random.default_rng(d)
+    sizes = rng.integers(1, 150, size=120)
+    points, starts = _blocks(rng, sizes, d)
+    centers, radii, lower = _segment_balls(points, starts, tol=1e-6)
+    for i, (start, size) in enumerate(zip(starts, sizes, strict=True)):
+        block = points[start : start + size]
+        assert np.linalg.norm(block - centers[i], axis=1).max() <= radii[i]
+        if size > 1:
+            expected = min_circle_clarabel(block).radius
+            assert lower[i] <= expected * (1 + 1e-7)
+            assert radii[i] <= expected * (1 + 2e-6)
+
+
+def test_stragglers_use_core_set_solver():
+    """With no lockstep iterations every block goes through the exact fallback."""
+    rng = np.random.default_rng(0)
+    sizes = np.array([40, 1, 25])
+    points, starts = _blocks(rng, sizes, 3)
+    _, radii, _ = _segment_balls(points, starts, max_iter=0)
+    for i, (start, size) in enumerate(zip(starts, sizes, strict=True)):
+        expected = min_circle_clarabel(points[start : start + size])
+        assert radii[i] == pytest.approx(expected.radius, rel=1e-5, abs=1e-6)
+
+
+def test_coincident_points():
+    """Blocks of identical points give zero radii at that point."""
+    points = np.repeat(np.array([[1.0, 2.0], [3.0, 4.0]]), 5, axis=0)
+    centers, radii, _ = _segment_balls(points, np.array([0, 5]))
+    assert np.allclose(centers, [[1.0, 2.0], [3.0, 4.0]])
+    assert np.all(radii == 0.0)
+
+
+@pytest.mark.parametrize(("m", "d"), [(4, 2), (10, 3), (33, 8)])
+def test_lockstep_matches_per_group_solves(m, d):
+    """The padded solver encloses every group within tolerance of the optimum."""
+    points = np.random.default_rng(m).standard_normal((200, m, d))
+    centers, radii, lower = _lockstep_balls(points, tol=1e-6)
+    assert np.all(np.linalg.norm(points - centers[:, None], axis=2).max(axis=1) <= radii)
+    for i in range(0, 200, 20):
+        expected = min_circle_clarabel(points[i]).radius
+        assert lower[i] <= expected * (1 + 1e-7)
+        assert radii[i] <= expected * (1 + 2e-6)
+
+
+def test_batch_per_problem_tolerances(monkeypatch):
+    """Each problem is solved to its own tolerance, across several chunks."""
+    monkeypatch.setattr(batch, "_BATCH_ROWS", 256)
+    rng = np.random.default_rng(3)
+    points = rng.standard_normal((60, 20, 3))
+    tol = np.where(np.arange(60) % 2 == 0, 1e-2, 1e-8)
+    radii, centers = min_circle_batch(points, tol=tol)
+    assert radii.shape == (60,)
+    assert centers.shape == (60, 3)
+    assert np.all(np.linalg.norm(points - centers[:, None], axis=2).max(axis=1) <= radii)
+    for i in range(60):
+        expected = min_circle_clarabel(points[i]).radius
+        assert radii[i] <= expected * (1 + tol[i] + 1e-7)
+
+
+def test_batch_single_point_problems():
+    """Problems with one point have radius zero at that point."""
+    points = np.arange(6.0).reshape(3, 1, 2)
+    radii, centers = min_circle_batch(points)
+    assert np.allclose(radii, 0.0)
+    assert np.allclose(centers, points[:, 0])
+
+
+@pytest.mark.parametrize(
+    ("points", "tol"),
+    [
+        (np.zeros((3, 2)), 1e-6),
+        (np.zeros((3, 0, 2)), 1e-6),
+        (np.zeros((3, 4, 2)), np.ones(2)),
+        (np.zeros((3, 4, 2)), -1.0),
+    ],
+)
+def test_batch_invalid(points, tol):
+    """Malformed batches and tolerances are rejected."""
+    with pytest.raises(ValueError, match=r"points|tol"):
+        min_circle_batch(points, tol=tol)
+
+
+def test_grouped_dispatch(monkeypatch):
+    """Groups of every size class, in shuffled order, match solving each group alone."""
+    monkeypatch.setattr(batch, "_CORESET_MIN", 300)
+    rng = np.random.default_rng(5)
+    sizes = np.array([1, 2, 3, 7, 64, 65, 200, 400, 1, 2])
+    points, _ = _blocks(rng, sizes, 3)
+    labels = np.repeat(np.arange(sizes.size), sizes)
+    shuffle = rng.permutation(labels.size)
+    radii, centers = min_circle_grouped(points[shuffle], labels[shuffle])
+    for label, size in enumerate(sizes):
+        group = points[labels == label]
+        assert np.linalg.norm(group - centers[label], axis=1).max() <= radii[label]
+        expected = min_circle_clarabel(group).radius if size > 1 else 0.0
+        assert radii[label] == pytest.approx(expected, rel=2e-6, abs=1e-6)
+
+
+def test_grouped_sorted_and_shuffled_agree():
+    """Sorted input gives the same balls as shuffled input."""
+    rng = np.random.default_rng(6)
+    points = rng.standard_normal((3000, 2))
+    labels = np.sort(rng.integers(0, 40, 3000))
+    shuffle = rng.permutation(3000)
+    sorted_result = min_circle_grouped(points, labels)
+    shuffled_result = min_circle_grouped(points[shuffle], labels[shuffle])
+    assert np.allclose(sorted_result.radii, shuffled_result.radii, rtol=1e-5)
+
+
+def test_grouped_missing_labels_and_float32():
+    """Unused labels are nan and float32 input is accepted."""
+    points = np.array([[0.0, 0.0], [2.0, 0.0], [7.0, 7.0]], dtype=np.float32)
+    radii, centers = min_circle_grouped(points, np.array([0, 0, 3]))
+    assert radii.shape == (4,)
+    assert radii[0] == pytest.approx(1.0)
+    assert np.isnan(radii[1:3]).all()
+    assert np.isnan(centers[1:3]).all()
+    assert np.array_equal(centers[3], [7.0, 7.0])
+
+
+@pytest.mark.parametrize("labels", [np.array([0, 1]), np.array([0.0, 1.0, 2.0]), np.array([0, -1, 2])])
+def test_grouped_invalid_labels(labels):
+    """Labels of the wrong length, dtype or sign are rejected."""
+    with pytest.raises(ValueError, match="labels"):
+        min_circle_grouped(np.zeros((3, 2)), labels)
+
+
+def test_neighborhoods_match_per_row_solves(monkeypatch):
+    """Every neighbourhood ball matches solving its gathered points, across several chunks."""
+    monkeypatch.setattr(batch, "_BATCH_ROWS", 64)
+    rng = np.random.default_rng(7)
+    points = rng.standard_normal((500, 3))
+    neighbors = rng.integers(0, 500, (90, 12))
+    radii, centers = min_circle_neighborhoods(points, neighbors)
+    assert radii.shape == (90,)
+    assert centers.shape == (90, 3)
+    for i in range(0, 90, 9):
+        expected = min_circle_clarabel(points[neighbors[i]])
+        assert radii[i] == pytest.approx(expected.radius, rel=2e-6)
+        assert np.linalg.norm(points[neighbors[i]] - centers[i], axis=1).max() <= radii[i]
+
+
+def test_neighborhoods_skip_missing_entries():
+    """Entries equal to ``n`` (cKDTree's missing marker) are ignored."""
+    points = np.array([[0.0, 0.0], [2.0, 0.0], [100.0, 0.0]])
+    radii, _ = min_circle_neighborhoods(points, np.array([[0, 1, 3], [2, 3, 3]]))
+    assert radii == pytest.approx([1.0, 0.0], abs=1e-9)
+
+
+@pytest.mark.parametrize("neighbors", [np.array([0, 1]), np.array([[0, 5]]), np.array([[3, 3]]), np.array([[0.0]])])
+def test_neighborhoods_invalid(neighbors):
+    """Malformed index matrices are rejected."""
+    with pytest.raises(ValueError, match="neighbo"):
+        min_circle_neighborhoods(np.zeros((3, 2)), neighbors)
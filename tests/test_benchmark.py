@@ -0,0 +1,67 @@
+"""Tests for the release benchmark comparison and the seeded instance generators."""
+
+import json
+
+import numpy as np
+import pytest
+
+from experiments.benchmark import compare, main
+from experiments.instances import FAMILIES, generate, write_npy
+
+
+def _record(solver: str = "min_circle_clarabel", family: str = "gaussian", **measurements: float) -> dict:
+    record = {"solver": solver, "family": family, "n": 100, "d": 2, "seed": 0}
+    record.update({"median_s": 1.0, "peak_bytes": 1_000, "iterations": 10, "radius": 2.0})
+    record.update(measurements)
+    return record
+
+
+def _report(*records: dict) -> dict:
+    return {"meta": {}, "results": list(records)}
+
+
+def test_unchanged_run_has_no_regressions():
+    """Measurements within the tolerances, and new cases, are not regressions."""
+    baseline = _report(_record())
+    current = _report(_record(median_s=1.2, peak_bytes=1_050, iterations=9), _record(family="sphere"))
+    assert compare(baseline, current) == []
+
+
+@pytest.mark.parametrize(
+    ("measurements", "reason"),
+    [
+        ({"median_s": 1.3}, "time"),
+        ({"peak_bytes": 1_200}, "peak memory"),
+        ({"iterations": 11}, "iterations"),
+        ({"radius": 2.001}, "radius"),
+    ],
+)
+def test_regressions_are_reported(measurements, reason):
+    """Slower, larger, longer-iterating or moved-radius cases are regressions."""
+    regressions = compare(_report(_record()), _report(_record(**measurements)))
+    assert len(regressions) == 1
+    assert regressions[0].startswith(f"min_circle_clarabel gaussian n=100 d=2: {reason}")
+
+
+def test_missing_cases_are_regressions(tmp_path, capsys):
+    """A baseline case absent from the current run fails the comparison."""
+    baseline = _report(_record(), _record(solver="min_circle_cvx"))
+    current = _report(_record())
+    assert compare(baseline, current) == ["min_circle_cvx gaussian n=100 d=2: missing from the current run"]
+
+    paths = tmp_path / "baseline.json", tmp_path / "current.json"
+    for path, report in zip(paths, (baseline, current), strict=True):
+        path.write_text(json.dumps(report))
+    assert main(["compare", *map(str, paths)]) == 1
+    assert "REGRESSION min_circle_cvx" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+def test_generate_is_seeded(family, tmp_path):
+    """The same seed gives the same instance, in memory or streamed; another seed does not."""
+    points = generate(family, 500, 3, seed=1)
+    assert points.shape == (500, 3)
+    np.testing.assert_array_equal(points, generate(family, 500, 3, seed=1))
+    assert not np.array_equal(points, generate(family, 500, 3, seed=2))
+    streamed = np.load(write_npy(tmp_path / "points.npy", family, 500, 3, seed=1, chunk_rows=128))
+    np.testing.assert_array_equal(streamed, points)
@@ -0,0 +1,168 @@
+"""Tests for the content-hash keyed result cache."""
+
+import functools
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from cvxball.cache import BallCache, content_hash
+from cvxball.solver import min_circle_clarabel
+
+
+@pytest.fixture
+def points() -> np.ndarray:
+    """A small random point cloud."""
+    return np.random.default_rng(0).standard_normal((30, 3))
+
+
+def _counting_solver() -> MagicMock:
+    """A stand-in solver that records its calls and returns a fixed ball."""
+    solver = MagicMock(return_value=(1.0, np.zeros(3)))
+    solver.__module__ = "tests"
+    solver.__qualname__ = "counting_solver"
+    return solver
+
+
+def test_content_hash_depends_on_content_shape_and_dtype(points):
+    """Equal content hashes equal; shape, dtype or extra options change the digest."""
+    assert content_hash(points) == content_hash(points.copy())
+    assert content_hash(points) != content_hash(points.reshape(15, 6))
+    assert content_hash(points) != content_hash(points.astype(np.float32))
+    assert content_hash(points, "a") != content_hash(points, "b")
+
+
+def test_content_hash_strided_matches_contiguous():
+    """A non-contiguous view hashes like its contiguous copy."""
+    wide = np.random.default_rng(1).standard_normal((1000, 6))
+    view = wide[:, ::2]
+    assert content_hash(view) == content_hash(np.ascontiguousarray(view))
+
+
+def test_memory_hit_reuses_result(points):
+    """A second request for the same content is answered without solving."""
+    cache = BallCache()
+    radius, center = cache.solve(points)
+    radius_hit, center_hit = cache.solve(points.copy())
+
+    assert radius_hit == radius
+    assert center_hit == pytest.approx(center)
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_rate == pytest.approx(0.5)
+
+
+def test_returned_center_is_a_copy(points):
+    """Mutating a returned centre does not corrupt the cached entry."""
+    cache = BallCache()
+    _, center = cache.solve(points)
+    center[:] = 1e9
+    _, again = cache.solve(points)
+    assert np.all(again != 1e9)
+
+
+def test_options_are_part_of_the_key(points):
+    """Different solver options miss the cache."""
+    solver = _counting_solver()
+    cache = BallCache()
+    cache.solve(points, solver, verbose=False)
+    cache.solve(points, solver, verbose=True)
+    cache.solve(points, solver, verbose=False)
+    assert solver.call_count == 2
+
+
+def test_lru_eviction(points):
+    """The memory tier keeps at most ``maxsize`` entries, dropping the least recently used."""
+    solver = _counting_solver()
+    cache = BallCache(maxsize=2)
+    a, b, c = points, points + 1, points + 2
+    cache.solve(a, solver)
+    cache.solve(b, solver)
+    cache.solve(a, solver)  # a is now most recent
+    cache.solve(c, solver)  # evicts b
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    cache.solve(a, solver)
+    assert solver.call_count == 3
+    cache.solve(b, solver)
+    assert solver.call_count == 4
+
+
+def test_disk_tier_survives_restart(points, tmp_path):
+    """A fresh cache over the same directory answers from disk."""
+    radius, center = BallCache(directory=tmp_path).solve(points)
+
+    solver = _counting_solver()
+    restarted = BallCache(directory=tmp_path)
+    radius_disk, center_disk = restarted.solve(points, min_circle_clarabel)
+    assert radius_disk == radius
+    assert center_disk == pytest.approx(center)
+    assert restarted.stats.disk_hits == 1
+    restarted.solve(points, solver)
+    assert solver.call_count == 1  # a different solver is a different key
+
+
+def test_disk_tier_size_eviction(tmp_path):
+    """The disk tier deletes the least recently used files beyond ``max_bytes``."""
+    solver = _counting_solver()
+    rng = np.random.default_rng(2)
+    probe = BallCache(directory=tmp_path / "probe")
+    probe.solve(rng.standard_normal((5, 3)), solver)
+    entry_bytes = next((tmp_path / "probe").glob("*.npz")).stat().st_size
+
+    cache = BallCache(directory=tmp_path / "cache", max_bytes=3 * entry_bytes)
+    for _ in range(5):
+        cache.solve(rng.standard_normal((5, 3)), solver)
+        time.sleep(0.01)  # distinct mtimes
+    assert len(list((tmp_path / "cache").glob("*.npz"))) == 3
+    assert cache.stats.disk_evictions == 2
+
+
+def test_clear(points, tmp_path):
+    """``clear`` empties both tiers and resets the statistics."""
+    cache = BallCache(directory=tmp_path)
+    cache.solve(points)
+    cache.clear()
+    assert len(cache) == 0
+    assert not list(tmp_path.glob("*.npz"))
+    assert cache.stats.lookups == 0
+
+
+def test_lambdas_and_nested_solvers_need_a_name(points):
+    """Lambdas share a qualified name, so they must be named to be cached apart."""
+    cache = BallCache()
+    with pytest.raises(ValueError, match="name="):
+        cache.solve(points, lambda p: (1.0, np.zeros(3)))
+    first = cache.solve(points, lambda p: (1.0, np.zeros(3)), name="one")
+    second = cache.solve(points, lambda p: (2.0, np.zeros(3)), name="two")
+    assert (first.radius, second.radius) == (1.0, 2.0)
+
+
+def test_partial_solvers_key_on_their_bound_arguments(points):
+    """A functools.partial is keyed by the wrapped function and its bound arguments."""
+    cache = BallCache()
+    quiet = functools.partial(min_circle_clarabel, verbose=False)
+    loud = functools.partial(min_circle_clarabel, verbose=True)
+    assert cache.key(points, quiet) == cache.key(points, functools.partial(min_circle_clarabel, verbose=False))
+    assert cache.key(points, quiet) != cache.key(points, loud)
+    assert cache.key(points, quiet) != cache.key(points)
+    assert cache.solve(points, quiet).radius == pytest.approx(min_circle_clarabel(points).radius)
+
+
+def test_disk_tier_lists_the_directory_only_when_needed(tmp_path, monkeypatch):
+    """Writes below the cap update a running total instead of listing the directory every time."""
+    solver = _counting_solver()
+    rng = np.random.default_rng(3)
+    cache = BallCache(directory=tmp_path)
+    scans = []
+    evict = cache._evict_disk
+    monkeypatch.setattr(cache, "_evict_disk", lambda: scans.append(1) or evict())
+    for _ in range(20):
+        cache.solve(rng.standard_normal((5, 3)), solver)
+    assert len(scans) == 1  # the first write measures the directory once
+
+    cache.max_bytes = cache._disk_bytes
+    cache.solve(rng.standard_normal((5, 3)), solver)
+    assert len(scans) == 2
+    assert cache.stats.disk_evictions == 1
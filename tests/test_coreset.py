@@ -0,0 +1,62 @@
+"""Tests for the core-set enclosing-ball solver."""
+
+import numpy as np
+import pytest
+
+from cvxball.ball import Ball
+from cvxball.coreset import _coreset_ball, min_circle_coreset
+from cvxball.scan import PointScanner
+from cvxball.solver import min_circle_clarabel
+
+
+@pytest.mark.parametrize("d", [2, 3, 8])
+def test_matches_full_solve(d):
+    """The core-set ball agrees with solving on every point and encloses them all."""
+    points = np.random.default_rng(d).standard_normal((3000, d))
+    ball, core = min_circle_coreset(points)
+    expected = min_circle_clarabel(points)
+    assert ball.radius == pytest.approx(expected.radius, rel=1e-5)
+    assert np.allclose(ball.center, expected.center, atol=1e-3)
+    assert ball.contains(points).all()
+    assert core.size < points.shape[0] // 10
+
+
+def test_degenerate_inputs():
+    """A single point and coincident points give a zero-radius ball."""
+    ball, _ = min_circle_coreset(np.array([[1.0, 2.0]]))
+    assert ball.radius == pytest.approx(0.0, abs=1e-6)
+    ball, _ = min_circle_coreset(np.ones((50, 3)))
+    assert ball.radius == pytest.approx(0.0, abs=1e-6)
+    assert np.allclose(ball.center, 1.0)
+
+
+def test_active_mask_and_warm_start():
+    """Inactive rows are ignored and a warm-start core set gives the same ball."""
+    rng = np.random.default_rng(1)
+    points = rng.standard_normal((2000, 3))
+    points[0] = 100.0
+    active = np.ones(points.shape[0], dtype=bool)
+    active[0] = False
+    ball, core = _coreset_ball(points, active)
+    assert 0 not in core
+    assert ball.radius == pytest.approx(min_circle_clarabel(points[1:]).radius, rel=1e-5)
+    warm, _ = _coreset_ball(points, active, core=np.append(core, 0))
+    assert warm.radius == pytest.approx(ball.radius, rel=1e-6)
+
+
+def test_scanner_gives_the_same_ball():
+    """Scanning through a PointScanner changes the cost, not the result."""
+    points = np.random.default_rng(2).standard_normal((50_000, 3))
+    active = np.ones(points.shape[0], dtype=bool)
+    active[:10] = False
+    ball, core = _coreset_ball(points, active)
+    scanned, scanned_core = _coreset_ball(points, active, scanner=PointScanner(points))
+    assert scanned.radius == pytest.approx(ball.radius, rel=1e-12)
+    assert np.array_equal(scanned_core, core)
+    assert Ball(scanned.radius, scanned.center).contains(points[active]).all()
+
+
+def test_nothing_active():
+    """An all-false mask is rejected."""
+    with pytest.raises(ValueError, match="at least one point"):
+        _coreset_ball(np.zeros((3, 2)), np.zeros(3, dtype=bool))
@@ -0,0 +1,95 @@
+"""Tests for the automatic method dispatcher."""
+
+import logging
+
+import numpy as np
+import pytest
+
+from cvxball import dispatch
+from cvxball.dispatch import DEFAULT_MODEL, CostModel, calibrate, choose_method, min_circle
+from cvxball.solver import min_circle_clarabel
+
+
+@pytest.mark.parametrize("method", ["auto", "cvx", "clarabel", "coreset", "grid", "frank_wolfe"])
+def test_methods_agree(method):
+    """Every method, chosen or forced, returns the optimal enclosing ball."""
+    points = np.random.default_rng(0).standard_normal((2_000, 3))
+    ball = min_circle(points, method=method)
+    assert ball.contains(points, tol=1e-6).all()
+    assert ball.radius == pytest.approx(min_circle_clarabel(points).radius, rel=1e-5)
+
+
+def test_decision_is_logged(caplog):
+    """The automatic choice and a forced method are both logged with the problem size."""
+    points = np.random.default_rng(1).standard_normal((50_000, 2))
+    with caplog.at_level(logging.INFO, logger="cvxball.dispatch"):
+        min_circle(points)
+        min_circle(points[:10], method="clarabel")
+    first, second = (record.getMessage() for record in caplog.records)
+    assert first.startswith("chose coreset for n=50000 d=2")
+    assert "clarabel" in first
+    assert second == "using clarabel for n=10 d=2 as requested"
+
+
+def test_memory_and_dimension_limits():
+    """Methods that do not fit in memory or do not support the dimension are skipped."""
+    model = CostModel({"clarabel": (0.0, 1e-9, 0.0), "grid": (0.0, 1e-10, 0.0), "coreset": (0.0, 1e-8, 0.0)})
+    assert choose_method(1_000, 3, model=model, memory=2**40) == "grid"
+    assert choose_method(1_000, 4, model=model, memory=2**40) == "clarabel"
+    assert choose_method(1_000, 4, model=model, memory=2**20) == "coreset"
+    with pytest.raises(ValueError, match="no method fits"):
+        choose_method(1_000, 4, model=model, memory=1)
+
+
+def test_float32_copies_count_against_memory():
+    """A method that copies float32 input to float64 needs more memory for it."""
+    model = CostModel({"frank_wolfe": (0.0, 1e-10, 0.0), "coreset": (0.0, 1e-8, 0.0)})
+    memory = 40 * 1_000 * 4 + 8 * 1_000 * 3 - 1
+    assert choose_method(1_000, 3, np.float64, model=model, memory=memory) == "frank_wolfe"
+    assert choose_method(1_000, 3, np.float32, model=model, memory=memory) == "coreset"
+
+
+def test_tolerance_enters_the_prediction():
+    """Tighter tolerances cost more for methods that depend on them."""
+    assert DEFAULT_MODEL.predict("coreset", 10_000, 3, 1e-9) > DEFAULT_MODEL.predict("coreset", 10_000, 3, 1e-3)
+    assert DEFAULT_MODEL.predict("clarabel", 10_000, 3, 1e-9) == DEFAULT_MODEL.predict("clarabel", 10_000, 3, 1e-3)
+
+
+def test_calibrate_and_round_trip(tmp_path):
+    """A quick calibration fits every method, and the model survives a save and load."""
+    model = calibrate(sizes=(50, 200), dims=(2,), tols=(1e-3, 1e-6), repeats=1)
+    assert set(model.coefficients) == {"cvx", "clarabel", "coreset", "grid", "frank_wolfe"}
+    assert all(c >= 0.0 for coefficients in model.coefficients.values() for c in coefficients)
+    path = tmp_path / "model.json"
+    model.save(path)
+    assert CostModel.load(path) == model
+
+
+def test_calibrate_keeps_defaults_for_untimed_methods():
+    """A method with no suitable configuration keeps its default coefficients."""
+    model = calibrate(sizes=(50,), dims=(4,), tols=(1e-3,), repeats=1)
+    assert model.coefficients["grid"] == DEFAULT_MODEL.coefficients["grid"]
+    assert set(model.coefficients) == set(DEFAULT_MODEL.coefficients)
+
+
+def test_available_memory_honours_the_cgroup_limit(tmp_path, monkeypatch):
+    """The cgroup's remaining memory caps the host's, and an unlimited group changes nothing."""
+    limit, usage = tmp_path / "memory.max", tmp_path / "memory.current"
+    monkeypatch.setattr(dispatch, "_CGROUP_FILES", ((str(limit), str(usage)),))
+    monkeypatch.setattr(dispatch, "_host_memory", lambda: 2**40)
+    limit.write_text("max\n")
+    assert dispatch._available_memory() == 2**40
+    limit.write_text(f"{2**30}\n")
+    usage.write_text(f"{2**28}\n")
+    assert dispatch._available_memory() == 2**30 - 2**28
+    monkeypatch.setattr(dispatch, "_host_memory", lambda: 2**20)
+    assert dispatch._available_memory() == 2**20
+    monkeypatch.setattr(dispatch, "_CGROUP_FILES", ((str(tmp_path / "missing"), str(usage)),))
+    assert dispatch._available_memory() == 2**20
+
+
+@pytest.mark.parametrize(("points", "method"), [(np.zeros((0, 2)), "auto"), (np.zeros((3, 2)), "simplex")])
+def test_invalid(points, method):
+    """Empty input and unknown methods are rejected."""
+    with pytest.raises(ValueError, match=r"points|method"):
+        min_circle(points, method=method)
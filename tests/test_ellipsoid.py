@@ -0,0 +1,71 @@
+"""Tests for the minimum-volume enclosing ellipsoid solver."""
+
+import cvxpy as cp
+import numpy as np
+import pytest
+
+from cvxball.ellipsoid import Ellipsoid, min_ellipsoid
+
+
+def _mvee_cvx(points: np.ndarray) -> Ellipsoid:
+    """Reference MVEE from the log-determinant program ``max log det B s.t. |B p_i + b| <= 1``."""
+    d = points.shape[1]
+    b_mat, b = cp.Variable((d, d), PSD=True), cp.Variable(d)
+    constraints = [cp.norm(points @ b_mat + b[None, :], axis=1) <= 1]
+    cp.Problem(cp.Maximize(cp.log_det(b_mat)), constraints).solve(solver="CLARABEL")
+    return Ellipsoid(b_mat.value.T @ b_mat.value, -np.linalg.solve(b_mat.value, b.value))
+
+
+@pytest.mark.parametrize("d", [2, 3, 5])
+def test_matches_log_det_program(d):
+    """Volume and centre agree with the conic formulation, and every point is enclosed."""
+    points = np.random.default_rng(d).standard_normal((300, d)) * np.arange(1, d + 1)
+    reference = _mvee_cvx(points)
+    ellipsoid, support = min_ellipsoid(points, tol=1e-6)
+    assert ellipsoid.contains(points).all()
+    assert ellipsoid.volume == pytest.approx(reference.volume, rel=1e-4)
+    assert np.allclose(ellipsoid.center, reference.center, atol=1e-3)
+    assert d + 1 <= support.size < 300
+    assert ellipsoid.mahalanobis(points[support]).min() > 0.99
+
+
+def test_affine_invariance():
+    """An affine map of the input maps the ellipsoid: the volume scales by |det|."""
+    rng = np.random.default_rng(0)
+    points = rng.standard_normal((5_000, 3))
+    linear = rng.standard_normal((3, 3))
+    base, _ = min_ellipsoid(points, tol=1e-7)
+    moved, _ = min_ellipsoid(points @ linear.T + 1e4, tol=1e-7)
+    assert moved.volume == pytest.approx(base.volume * abs(np.linalg.det(linear)), rel=1e-5)
+    assert np.allclose(moved.center, linear @ base.center + 1e4, atol=1e-3)
+
+
+def test_elongated_cloud_beats_ball():
+    """For an elongated cloud the ellipsoid is far smaller than the enclosing ball."""
+    points = np.random.default_rng(1).standard_normal((20_000, 2)) * [20.0, 1.0]
+    ellipsoid, _ = min_ellipsoid(points)
+    radius = np.linalg.norm(points - ellipsoid.center, axis=1).max()
+    assert ellipsoid.volume < 0.2 * np.pi * radius**2
+
+
+def test_ellipsoid_queries():
+    """Containment and volume of an explicit axis-aligned ellipsoid."""
+    ellipsoid = Ellipsoid(np.diag([1.0, 1.0 / 9.0, 4.0]), np.zeros(3))
+    assert ellipsoid.contains(np.array([[0.0, 2.9, 0.0], [0.0, 0.0, 0.6]])).tolist() == [True, False]
+    assert ellipsoid.volume == pytest.approx(4.0 / 3.0 * np.pi * 1.0 * 3.0 * 0.5)
+
+
+@pytest.mark.parametrize(
+    "points", [np.zeros((0, 2)), np.zeros(3), np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0], [3.0, 3.0]])]
+)
+def test_invalid(points):
+    """Empty, malformed and flat inputs are rejected."""
+    with pytest.raises(ValueError, match=r"points"):
+        min_ellipsoid(points)
+
+
+def test_not_converged():
+    """Running out of iterations raises."""
+    points = np.random.default_rng(2).standard_normal((1_000, 3))
+    with pytest.raises(ValueError, match="did not converge"):
+        min_ellipsoid(points, tol=1e-9, max_iter=3)
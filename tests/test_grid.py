@@ -0,0 +1,117 @@
+"""Tests for the coarse-to-fine grid solver."""
+
+import numpy as np
+import pytest
+
+from cvxball import grid
+from cvxball.coreset import min_circle_coreset
+from cvxball.grid import min_circle_grid
+from cvxball.solver import min_circle_clarabel
+
+
+def _disk(rng: np.random.Generator) -> np.ndarray:
+    x = rng.standard_normal((50_000, 2))
+    return x / np.linalg.norm(x, axis=1)[:, None] * np.sqrt(rng.random((50_000, 1)))
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda rng: rng.standard_normal((50_000, 2)),
+        lambda rng: rng.uniform(-1, 1, (50_000, 3)),
+        _disk,
+        lambda rng: rng.random((2_000, 1)),
+    ],
+)
+@pytest.mark.parametrize("cells", [grid._GRID_CELLS, 64])
+def test_matches_direct_solve(make, cells):
+    """The grid ball encloses every point and agrees with the direct conic solve."""
+    points = make(np.random.default_rng(0))
+    ball, core = min_circle_grid(points, cells=cells)
+    reference = min_circle_clarabel(points[min_circle_coreset(points)[1]])
+    assert ball.contains(points).all()
+    assert ball.radius == pytest.approx(reference.radius, rel=1e-6)
+    assert core.size <= 100
+
+
+def test_streams_memmap(tmp_path, monkeypatch):
+    """A memory-mapped float32 file is read in blocks and gives the in-memory answer."""
+    monkeypatch.setattr(grid, "_STREAM_ROWS", 4_096)
+    points = np.random.default_rng(1).standard_normal((30_000, 3)).astype(np.float32)
+    path = tmp_path / "points.npy"
+    np.save(path, points)
+    ball, _ = min_circle_grid(np.load(path, mmap_mode="r"))
+    assert ball.radius == pytest.approx(min_circle_grid(points)[0].radius, rel=1e-12)
+    assert ball.contains(points.astype(np.float64)).all()
+
+
+def test_verification_repairs_a_missed_shell(monkeypatch):
+    """When the shell misses support points, the verification pass adds them back."""
+    rng = np.random.default_rng(2)
+    points = rng.standard_normal((20_000, 2))
+    monkeypatch.setattr(grid, "_STREAM_ROWS", 1_000)
+
+    # A coarse ball from a single boundary cell puts c0 far off-centre.
+    def first_cell(occupied: np.ndarray) -> np.ndarray:
+        return occupied & (np.cumsum(occupied) == 1).reshape(occupied.shape)
+
+    monkeypatch.setattr(grid, "_boundary", first_cell)
+    solves = []
+    monkeypatch.setattr(
+        grid, "min_circle_coreset", lambda p, tol: solves.append(p.shape[0]) or min_circle_coreset(p, tol)
+    )
+    ball, _ = min_circle_grid(points, shell_width=1.0)
+    assert len(solves) > 2
+    assert ball.contains(points).all()
+    assert ball.radius == pytest.approx(min_circle_clarabel(points).radius, rel=1e-6)
+
+
+def test_coincident_points():
+    """Identical points give a zero-radius ball at that point."""
+    ball, core = min_circle_grid(np.full((10, 3), 2.0))
+    assert ball.radius == 0.0
+    assert np.array_equal(ball.center, np.full(3, 2.0))
+    assert core.size >= 1
+
+
+@pytest.mark.parametrize(
+    ("points", "options"),
+    [
+        (np.zeros((0, 2)), {}),
+        (np.zeros((5, 4)), {}),
+        (np.array([[np.nan, 0.0]]), {}),
+        (np.zeros((5, 2)), {"cells": 0}),
+        (np.zeros((5, 2)), {"shell_width": 0.5}),
+    ],
+)
+def test_invalid(points, options):
+    """Empty, high-dimensional or non-finite input and out-of-range options are rejected."""
+    with pytest.raises(ValueError, match=r"points|cells|shell_width"):
+        min_circle_grid(points, **options)
+
+
+def test_gathered_points_do_not_crowd_out_real_misses(monkeypatch):
+    """Gathered points poking out of an inaccurate solve do not hide the points the shell missed."""
+    rng = np.random.default_rng(0)
+    points = rng.standard_normal((20_000, 2))
+    monkeypatch.setattr(grid, "_STREAM_ROWS", 1_000)
+    monkeypatch.setattr(grid, "_MAX_ADDED", 4)
+
+    def first_cell(occupied: np.ndarray) -> np.ndarray:
+        return occupied & (np.cumsum(occupied) == 1).reshape(occupied.shape)
+
+    # Shift every refinement centre, so the gathered points on one side poke out of the ball.
+    solves = []
+
+    def inaccurate(p, tol):
+        ball, core = min_circle_coreset(p, tol)
+        ball = grid.Ball(ball.radius, ball.center + np.array([0.5, 0.0]))
+        solves.append((p, ball))
+        return ball, core
+
+    monkeypatch.setattr(grid, "_boundary", first_cell)
+    monkeypatch.setattr(grid, "min_circle_coreset", inaccurate)
+    min_circle_grid(points, shell_width=1.0)
+    members, ball = solves[-1]
+    outside = points[~ball.contains(points)]
+    assert (outside[:, None, :] == members[None, :, :]).all(axis=2).any(axis=1).all()
@@ -0,0 +1,61 @@
+"""Import-time regression tests: backends must only load on first use."""
+
+import subprocess
+import sys
+
+import pytest
+
+_HEAVY = ("cvxpy", "clarabel", "scipy", "importlib.metadata")
+
+
+def _imported_modules(code: str) -> dict[str, int]:
+    """Run ``code`` under ``python -X importtime`` and map each imported module to its cumulative µs."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def _loaded(modules: dict[str, int], root: str) -> bool:
+    """Whether ``root`` or any of its submodules shows up in the import log."""
+    return any(name == root or name.startswith(root + ".") for name in modules)
+
+
+@pytest.mark.parametrize("target", ["cvxball", "cvxball.solver"])
+def test_import_loads_no_backend(target):
+    """Importing the package or the solver module loads none of the heavy backends."""
+    modules = _imported_modules(f"import {target}")
+    assert target in modules
+    for heavy in _HEAVY:
+        assert not _loaded(modules, heavy), f"`import {target}` pulled in {heavy}"
+
+
+def test_clarabel_path_never_loads_cvxpy():
+    """Solving through the direct Clarabel path leaves CVXPY unimported."""
+    code = (
+        "import numpy as np\n"
+        "from cvxball.solver import min_circle_clarabel\n"
+        "min_circle_clarabel(np.array([[0.0, 0.0], [1.0, 0.0]]))\n"
+    )
+    modules = _imported_modules(code)
+    assert _loaded(modules, "clarabel")
+    assert not _loaded(modules, "cvxpy")
+
+
+def test_version_resolves_lazily():
+    """``cvxball.__version__`` is still available, just resolved on access."""
+    import cvxball
+
+    assert isinstance(cvxball.__version__, str)
+    with pytest.raises(AttributeError):
+        _ = cvxball.does_not_exist
@@ -0,0 +1,61 @@
+"""Tests for k-center clustering with enclosing-ball refinement."""
+
+import numpy as np
+import pytest
+
+from cvxball.kcenter import _assign, _gonzalez, k_center
+
+
+@pytest.fixture(scope="module")
+def blobs() -> np.ndarray:
+    """Twenty well-separated Gaussian blobs in 3-D."""
+    rng = np.random.default_rng(0)
+    locations = rng.uniform(-100, 100, (20, 3))
+    return np.vstack([rng.normal(loc, 1.0, (300, 3)) for loc in locations])
+
+
+def test_every_point_in_its_ball(blobs):
+    """Each point lies within its cluster's radius of its cluster's centre."""
+    result = k_center(blobs, k=20)
+    distance = np.linalg.norm(blobs - result.centers[result.labels], axis=1)
+    assert np.all(distance <= result.radii[result.labels])
+    assert result.radius == result.radii.max()
+
+
+def test_refinement_improves_on_seeding(blobs):
+    """Refinement never does worse than the Gonzalez seeding it starts from."""
+    seeds, labels = _gonzalez(blobs, 20, 0)
+    seeded = np.linalg.norm(blobs - blobs[seeds][labels], axis=1).max()
+    assert k_center(blobs, k=20).radius <= seeded
+
+
+def test_separated_blobs_are_recovered(blobs):
+    """With one centre per blob, every blob becomes exactly one cluster."""
+    result = k_center(blobs, k=20)
+    blob = np.repeat(np.arange(20), 300)
+    assert all(np.unique(result.labels[blob == b]).size == 1 for b in range(20))
+    assert np.unique(result.labels).size == 20
+
+
+def test_assign_matches_brute_force():
+    """The pruned assignment finds the same nearest centre as comparing against all centres."""
+    rng = np.random.default_rng(1)
+    points, centers = rng.standard_normal((5000, 2)), rng.standard_normal((60, 2))
+    labels = rng.integers(0, 60, size=5000)
+    brute = np.argmin(np.linalg.norm(points[:, None] - centers[None], axis=2), axis=1)
+    assert np.array_equal(_assign(points, labels, centers), brute)
+
+
+def test_single_cluster():
+    """``k = 1`` gives the minimum enclosing ball."""
+    points = np.random.default_rng(2).standard_normal((1000, 2))
+    result = k_center(points, k=1)
+    assert np.all(result.labels == 0)
+    assert result.radius == pytest.approx(np.linalg.norm(points - result.centers[0], axis=1).max())
+
+
+@pytest.mark.parametrize("k", [0, 11])
+def test_invalid_k(k):
+    """``k`` outside ``[1, n]`` is rejected."""
+    with pytest.raises(ValueError, match="k must satisfy"):
+        k_center(np.zeros((10, 2)), k=k)
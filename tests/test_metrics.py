@@ -0,0 +1,114 @@
+"""Tests for the opt-in metrics registry."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from cvxball import metrics
+from cvxball.cache import BallCache
+from cvxball.coreset import min_circle_coreset
+from cvxball.solver import min_circle_clarabel
+
+
+@pytest.fixture
+def collecting():
+    """Collect metrics from a clean registry for the duration of a test."""
+    metrics.enable()
+    metrics.reset()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+def test_disabled_records_nothing():
+    """Nothing is collected before enable()."""
+    metrics.reset()
+    min_circle_clarabel(np.random.default_rng(0).standard_normal((50, 2)))
+    assert metrics.snapshot() == metrics.Snapshot({}, {})
+
+
+def test_solves_latency_and_iterations(collecting):
+    """Solver calls, nested Clarabel solves, latency buckets and iteration counts are recorded."""
+    points = np.random.default_rng(0).standard_normal((5_000, 3))
+    min_circle_coreset(points)
+    min_circle_clarabel(points[:100])
+    snapshot = metrics.snapshot()
+    assert snapshot.counter("cvxball_solves_total", method="min_circle_coreset") == 1
+    clarabel = snapshot.counter("cvxball_solves_total", method="min_circle_clarabel")
+    assert clarabel >= 2
+    assert snapshot.counter("cvxball_clarabel_status_total", status="Solved") == clarabel
+    latency = snapshot.histogram("cvxball_solve_seconds", method="min_circle_coreset", n="10000", d="3")
+    assert latency is not None
+    assert latency.observations == 1
+    assert latency.mean > 0
+    iterations = snapshot.histogram("cvxball_clarabel_iterations")
+    assert iterations is not None
+    assert iterations.observations == clarabel
+    assert 1 < iterations.mean < 100
+
+
+def test_failures_by_exception_type(collecting):
+    """A raising solver is counted as a failure with its exception type."""
+    with pytest.raises(ValueError, match="at least one point"):
+        min_circle_coreset(np.empty((0, 2)))
+    snapshot = metrics.snapshot()
+    assert snapshot.counter("cvxball_failures_total", method="min_circle_coreset", error="ValueError") == 1
+
+
+def test_cache_hit_rate(collecting):
+    """Cache lookups are counted by outcome."""
+    cache = BallCache()
+    points = np.array([[0.0, 0.0], [1.0, 1.0]])
+    for _ in range(4):
+        cache.solve(points)
+    snapshot = metrics.snapshot()
+    assert snapshot.counter("cvxball_cache_lookups_total", result="miss") == 1
+    assert snapshot.cache_hit_rate == 0.75
+
+
+def test_reset_returns_and_clears(collecting):
+    """reset() returns the values it clears."""
+    metrics.REGISTRY.inc("cvxball_solves_total", (("method", "x"),), 3.0)
+    assert metrics.reset().counter("cvxball_solves_total") == 3
+    assert metrics.snapshot().counter("cvxball_solves_total") == 0
+
+
+def test_concurrent_updates_are_not_lost(collecting):
+    """Updates from many threads all arrive, spread over separate shards."""
+
+    def work():
+        for _ in range(2_000):
+            metrics.REGISTRY.inc("cvxball_solves_total", (("method", "x"),))
+            metrics.REGISTRY.observe("cvxball_clarabel_iterations", (), 10.0)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    used = [shard for shard in metrics.REGISTRY._shards if shard.counters]
+    assert len(used) == 8  # one shard per thread
+    snapshot = metrics.snapshot()
+    assert snapshot.counter("cvxball_solves_total") == 16_000
+    histogram = snapshot.histogram("cvxball_clarabel_iterations")
+    assert histogram is not None
+    assert histogram.observations == 16_000
+
+
+def test_prometheus_text(collecting):
+    """The exporter writes HELP/TYPE lines, cumulative buckets, _sum and _count."""
+    metrics.REGISTRY.inc("cvxball_clarabel_status_total", (("status", 'Max"Iter'),), 2.0)
+    for value in (7.0, 12.0, 500.0):
+        metrics.REGISTRY.observe("cvxball_clarabel_iterations", (), value)
+    text = metrics.to_prometheus()
+    assert "# TYPE cvxball_clarabel_status_total counter" in text
+    assert 'cvxball_clarabel_status_total{status="Max\\"Iter"} 2.0' in text
+    assert "# TYPE cvxball_clarabel_iterations histogram" in text
+    assert 'cvxball_clarabel_iterations_bucket{le="5.0"} 0' in text
+    assert 'cvxball_clarabel_iterations_bucket{le="10.0"} 1' in text
+    assert 'cvxball_clarabel_iterations_bucket{le="200.0"} 2' in text
+    assert 'cvxball_clarabel_iterations_bucket{le="+Inf"} 3' in text
+    assert "cvxball_clarabel_iterations_sum 519.0" in text
+    assert "cvxball_clarabel_iterations_count 3" in text
+    assert text.endswith("\n")
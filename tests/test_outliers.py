@@ -0,0 +1,74 @@
+"""Tests for the enclosing ball with ``k`` outliers."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from cvxball.outliers import min_circle_outliers
+from cvxball.solver import min_circle_clarabel
+
+
+@pytest.fixture(scope="module")
+def noisy() -> tuple[np.ndarray, np.ndarray]:
+    """A unit-disc cloud with five planted far-away outliers, and their rows."""
+    rng = np.random.default_rng(0)
+    angle, radius = rng.uniform(0, 2 * np.pi, 20_000), np.sqrt(rng.uniform(0, 1, 20_000))
+    points = np.column_stack([radius * np.cos(angle), radius * np.sin(angle)])
+    planted = rng.choice(points.shape[0], size=5, replace=False)
+    points[planted] = rng.standard_normal((5, 2)) * 40
+    return points, planted
+
+
+def test_removes_planted_outliers(noisy):
+    """Peeling ``k`` points finds exactly the planted outliers."""
+    points, planted = noisy
+    ball, excluded = min_circle_outliers(points, k=5)
+    assert sorted(excluded.tolist()) == sorted(planted.tolist())
+    assert ball.radius < 1.01
+
+
+def test_ball_encloses_the_rest(noisy):
+    """The returned ball encloses exactly the non-excluded points it was asked to."""
+    points, _ = noisy
+    ball, excluded = min_circle_outliers(points, k=3)
+    keep = np.ones(points.shape[0], dtype=bool)
+    keep[excluded] = False
+    assert np.unique(excluded).size == 3
+    assert ball.contains(points[keep]).all()
+    assert ball.radius == pytest.approx(min_circle_clarabel(points[keep]).radius, rel=1e-5)
+
+
+def test_zero_outliers():
+    """``k = 0`` is the ordinary enclosing ball."""
+    points = np.random.default_rng(2).standard_normal((500, 3))
+    ball, excluded = min_circle_outliers(points, k=0)
+    assert excluded.size == 0
+    assert ball.radius == pytest.approx(min_circle_clarabel(points).radius, rel=1e-5)
+
+
+def test_radius_never_grows():
+    """Each extra excluded point can only shrink the ball."""
+    points = np.random.default_rng(3).standard_normal((2000, 3))
+    radii = [min_circle_outliers(points, k=k)[0].radius for k in range(4)]
+    assert all(b <= a * (1 + 1e-6) for a, b in itertools.pairwise(radii))
+
+
+@pytest.mark.parametrize("k", [-1, 10])
+def test_invalid_k(k):
+    """``k`` outside ``[0, n)`` is rejected."""
+    with pytest.raises(ValueError, match="k must satisfy"):
+        min_circle_outliers(np.zeros((10, 2)), k=k)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_loose_tolerance_on_a_circle(seed):
+    """Points all on the sphere with a loose tolerance still peel real, distinct rows."""
+    angles = np.random.default_rng(seed).uniform(0, 2 * np.pi, 5_000)
+    points = np.column_stack([np.cos(angles), np.sin(angles)])
+    ball, excluded = min_circle_outliers(points, k=3, tol=1e-3)
+    assert (excluded >= 0).all()
+    assert np.unique(excluded).size == 3
+    keep = np.ones(points.shape[0], dtype=bool)
+    keep[excluded] = False
+    assert ball.contains(points[keep]).all()
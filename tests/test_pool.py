@@ -0,0 +1,82 @@
+"""Tests for concurrent Clarabel solves."""
+
+import time
+
+import numpy as np
+import pytest
+
+from cvxball import pool
+from cvxball.pool import clarabel_releases_gil, solve_many
+from cvxball.solver import min_circle_clarabel
+
+
+def _problems(count: int = 6) -> list[np.ndarray]:
+    rng = np.random.default_rng(0)
+    return [rng.standard_normal((int(rng.integers(200, 2_000)), int(rng.integers(2, 5)))) for _ in range(count)]
+
+
+@pytest.mark.parametrize(("threads", "backend"), [(1, "auto"), (3, "thread"), (2, "process")])
+def test_matches_sequential_solves(threads, backend):
+    """Every backend returns the sequential results, in order."""
+    problems = _problems()
+    balls = solve_many(problems, threads=threads, backend=backend)
+    for points, ball in zip(problems, balls, strict=True):
+        expected = min_circle_clarabel(points)
+        assert ball.radius == pytest.approx(expected.radius, rel=1e-12)
+        np.testing.assert_allclose(ball.center, expected.center, rtol=1e-12, atol=1e-12)
+
+
+def test_clarabel_releases_gil():
+    """The installed binding lets other threads run during a solve."""
+    assert clarabel_releases_gil()
+
+
+class _FakeSolver:
+    """Stands in for clarabel.DefaultSolver with a given solve."""
+
+    def __init__(self, solve):
+        self.solve = solve
+
+
+@pytest.mark.parametrize(
+    "solve",
+    [
+        # A long builtin call never returns to the interpreter loop, so it holds the GIL.
+        lambda: sum(range(30_000_000)),
+        lambda: 1 / 0,
+    ],
+)
+def test_probe_reports_held_or_failed_solves(monkeypatch, solve):
+    """A solve that holds the GIL or raises counts as holding it, without an unhandled error."""
+    import clarabel
+
+    monkeypatch.setattr(clarabel, "DefaultSolver", lambda *_args: _FakeSolver(solve))
+    assert not clarabel_releases_gil.__wrapped__()
+
+
+def test_probe_gives_up_on_a_hung_solve(monkeypatch):
+    """A probe that outlives the timeout counts as holding the GIL."""
+    import clarabel
+
+    monkeypatch.setattr(pool, "_PROBE_TIMEOUT", 0.05)
+    monkeypatch.setattr(clarabel, "DefaultSolver", lambda *_args: _FakeSolver(lambda: time.sleep(0.5)))
+    start = time.perf_counter()
+    assert not clarabel_releases_gil.__wrapped__()
+    assert time.perf_counter() - start < 0.4
+
+
+def test_auto_falls_back_to_processes(monkeypatch):
+    """When the probe finds the GIL held, "auto" uses a process pool."""
+    monkeypatch.setattr(pool, "clarabel_releases_gil", lambda: False)
+    monkeypatch.setattr(pool, "_pool", lambda _threads: pytest.fail("thread pool used"))
+    problems = _problems(3)
+    balls = solve_many(problems, threads=2)
+    assert [ball.radius for ball in balls] == pytest.approx([min_circle_clarabel(p).radius for p in problems])
+
+
+def test_invalid():
+    """Bad thread counts and backends are rejected."""
+    with pytest.raises(ValueError, match="threads"):
+        solve_many(_problems(2), threads=0)
+    with pytest.raises(ValueError, match="backend"):
+        solve_many(_problems(2), backend="fiber")
@@ -0,0 +1,74 @@
+"""Tests for deduplication and grid quantisation."""
+
+import numpy as np
+import pytest
+
+from cvxball import preprocess
+from cvxball.preprocess import min_circle_reduced, reduce_points
+from cvxball.solver import min_circle_clarabel
+
+
+def test_deduplication_matches_unique_rows():
+    """Exact deduplication agrees with a row-wise unique, in first-occurrence order, and round-trips."""
+    rng = np.random.default_rng(0)
+    base = np.round(rng.standard_normal((500, 3)), 2)
+    points = base[rng.integers(0, 500, 5_000)]
+    reduction = reduce_points(points)
+    _, first = np.unique(points, axis=0, return_index=True)
+    assert np.array_equal(reduction.rows, np.sort(first))
+    assert np.array_equal(reduction.points, points[reduction.rows])
+    assert np.array_equal(reduction.points[reduction.inverse], points)
+    assert reduction.error == 0.0
+    assert np.array_equal(reduction.members([0]), np.flatnonzero((points == points[0]).all(axis=1)))
+
+
+def test_signed_zero_and_hash_collisions(monkeypatch):
+    """-0.0 merges with 0.0, and a degenerate hash still separates distinct rows."""
+    points = np.array([[0.0, 1.0], [-0.0, 1.0], [1.0, 0.0], [1.0, 0.0]])
+    assert reduce_points(points).rows.tolist() == [0, 2]
+    monkeypatch.setattr(preprocess, "_row_hash", lambda keys: np.zeros(keys.shape[0], dtype=np.uint64))
+    reduction = reduce_points(points)
+    assert reduction.rows.tolist() == [0, 2]
+    assert reduction.inverse.tolist() == [0, 0, 1, 1]
+
+
+@pytest.mark.parametrize("d", [2, 3])
+def test_snapping_error_bound(d):
+    """Snapped points lie on the grid within the reported error, which obeys the worst case."""
+    points = np.random.default_rng(d).uniform(-5, 5, (20_000, d))
+    reduction = reduce_points(points, resolution=0.25)
+    assert reduction.points.shape[0] < 20_000
+    assert np.allclose(reduction.points / 0.25, np.rint(reduction.points / 0.25))
+    error = np.linalg.norm(points - reduction.points[reduction.inverse], axis=1).max()
+    assert reduction.error == pytest.approx(error)
+    assert reduction.error <= 0.25 * np.sqrt(d) / 2
+
+
+@pytest.mark.parametrize("resolution", [None, 0.05])
+def test_reduced_solve_is_within_the_error_bound(resolution):
+    """The reduced ball encloses every original point and is within the error of the optimum."""
+    rng = np.random.default_rng(1)
+    points = np.round(rng.standard_normal((3_000, 3)), 1)[rng.integers(0, 3_000, 30_000)]
+    points += rng.uniform(-0.01, 0.01, points.shape) * (resolution is not None)
+    optimum = min_circle_clarabel(points).radius
+    reduction = reduce_points(points, resolution)
+    ball, core = min_circle_reduced(points, resolution)
+    assert ball.contains(points).all()
+    assert ball.radius <= (1 + 1e-6) * (optimum + reduction.error) + reduction.error + 1e-8
+    assert np.isin(core, reduction.rows).all()
+
+
+@pytest.mark.parametrize(
+    ("points", "resolution"),
+    [
+        (np.zeros((0, 2)), None),
+        (np.zeros(3), None),
+        (np.array([[np.nan, 0.0]]), None),
+        (np.zeros((3, 2)), 0.0),
+        (np.full((3, 2), 1e10), 1e-10),
+    ],
+)
+def test_invalid(points, resolution):
+    """Empty, malformed or non-finite input and unusable resolutions are rejected."""
+    with pytest.raises(ValueError, match=r"points|resolution"):
+        reduce_points(points, resolution)
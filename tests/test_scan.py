@@ -0,0 +1,109 @@
+"""Tests for the blocked farthest-point and violator scanner."""
+
+import numpy as np
+import pytest
+
+from cvxball import scan
+from cvxball.scan import PointScanner, parallel_farthest, parallel_violators
+
+
+def _brute(points: np.ndarray, center: np.ndarray) -> np.ndarray:
+    return np.linalg.norm(points - center, axis=1)
+
+
+@pytest.mark.parametrize("reorder", [True, False])
+@pytest.mark.parametrize("d", [2, 3, 7])
+def test_matches_brute_force(d, reorder):
+    """Farthest point and violators agree exactly with a full pass, for many centres."""
+    rng = np.random.default_rng(d)
+    points = rng.standard_normal((20_000, d))
+    scanner = PointScanner(points, reorder=reorder)
+    for center in rng.standard_normal((5, d)) * 0.5:
+        distance = _brute(points, center)
+        index, farthest = scanner.farthest(center)
+        assert index == np.argmax(distance)
+        assert farthest == pytest.approx(distance.max(), rel=1e-14)
+        radius = np.quantile(distance, 0.99)
+        violators, violator_distance = scanner.violators(center, radius)
+        assert np.array_equal(violators, np.flatnonzero(distance > radius))
+        assert np.allclose(violator_distance, distance[violators], rtol=1e-14)
+
+
+def test_mask_and_pruning():
+    """Masked rows are ignored, and a central query skips most of the data."""
+    rng = np.random.default_rng(0)
+    points = rng.standard_normal((200_000, 3))
+    scanner = PointScanner(points)
+    distance = _brute(points, np.zeros(3))
+    mask = np.ones(points.shape[0], dtype=bool)
+    mask[np.argsort(-distance)[:5]] = False
+    index, _ = scanner.farthest(np.zeros(3), mask=mask)
+    assert index == np.argsort(-distance)[5]
+    assert scanner.scanned < points.shape[0] // 5
+
+    violators, _ = scanner.violators(np.zeros(3), np.quantile(distance, 0.999), mask=mask)
+    assert violators.size == 200 - 5
+    assert scanner.scanned < points.shape[0] // 4
+
+
+def test_far_from_origin_and_float32():
+    """Data offset far from the origin and float32 input are scanned exactly."""
+    rng = np.random.default_rng(1)
+    points = (rng.standard_normal((10_000, 2)) + 1e6).astype(np.float32)
+    scanner = PointScanner(points)
+    center = np.full(2, 1e6)
+    distance = _brute(points.astype(np.float64), center)
+    assert scanner.farthest(center)[0] == np.argmax(distance)
+    radius = np.quantile(distance, 0.9)
+    assert np.array_equal(scanner.violators(center, radius)[0], np.flatnonzero(distance > radius))
+
+
+def test_small_inputs():
+    """A single point, one-row blocks and a ball containing everything."""
+    scanner = PointScanner(np.array([[1.0, 2.0]]))
+    assert scanner.farthest(np.zeros(2)) == (0, pytest.approx(np.sqrt(5.0)))
+    points = np.random.default_rng(2).standard_normal((50, 3))
+    scanner = PointScanner(points, block_rows=1)
+    assert len(scanner) == 50
+    assert scanner.farthest(np.zeros(3))[0] == np.argmax(_brute(points, np.zeros(3)))
+    assert PointScanner(1e-3 * points).farthest(np.zeros(3))[0] == np.argmax(_brute(points, np.zeros(3)))
+    violators, distance = scanner.violators(np.zeros(3), 100.0)
+    assert violators.size == distance.size == 0
+
+
+def test_invalid():
+    """Empty input and an empty mask are rejected."""
+    with pytest.raises(ValueError, match="points"):
+        PointScanner(np.zeros((0, 2)))
+    scanner = PointScanner(np.zeros((3, 2)))
+    with pytest.raises(ValueError, match="at least one point"):
+        scanner.farthest(np.zeros(2), mask=np.zeros(3, dtype=bool))
+
+
+@pytest.mark.parametrize("threads", [1, 3, None])
+def test_parallel_scans_match_brute_force(monkeypatch, threads):
+    """Threaded scans give the same farthest point and violators as a full pass, with and without a mask."""
+    monkeypatch.setattr(scan, "_THREAD_MIN_ROWS", 1_000)
+    rng = np.random.default_rng(3)
+    points = rng.standard_normal((10_000, 3))
+    center = rng.standard_normal(3) * 0.5
+    distance = _brute(points, center)
+    index, farthest = parallel_farthest(points, center, threads=threads)
+    assert index == np.argmax(distance)
+    assert farthest == pytest.approx(distance.max(), rel=1e-12)
+
+    mask = distance < np.quantile(distance, 0.999)
+    assert parallel_farthest(points, center, mask=mask, threads=threads)[0] == np.argmax(np.where(mask, distance, 0))
+    radius = np.quantile(distance, 0.99)
+    violators, violator_distance = parallel_violators(points, center, radius, mask=mask, threads=threads)
+    assert np.array_equal(violators, np.flatnonzero(mask & (distance > radius)))
+    assert np.allclose(violator_distance, distance[violators], rtol=1e-12)
+
+
+def test_parallel_invalid():
+    """An empty mask and a non-positive thread count are rejected."""
+    points = np.zeros((3, 2))
+    with pytest.raises(ValueError, match="at least one point"):
+        parallel_farthest(points, np.zeros(2), mask=np.zeros(3, dtype=bool))
+    with pytest.raises(ValueError, match="threads"):
+        parallel_violators(points, np.zeros(2), 1.0, threads=0)
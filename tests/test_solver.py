@@ -5,11 +5,19 @@ from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
+import scipy.sparse as sp
 from hypothesis import given, settings
 from hypothesis import strategies as st
 from hypothesis.extra.numpy import arrays
 
-from cvxball.solver import min_circle_clarabel, min_circle_cvx
+from cvxball.ball import Ball
+from cvxball.solver import (
+    _build_soc_program,
+    min_ball_of_balls_clarabel,
+    min_ball_of_balls_cvx,
+    min_circle_clarabel,
+    min_circle_cvx,
+)
 
 
 def _cvx(points: np.ndarray) -> tuple[float, np.ndarray]:
@@ -161,3 +169,101 @@ def test_one_dimensional_points(solver: Callable[[np.ndarray], tuple[float, np.n
     radius, center = solver(np.array([[-3.0], [1.0], [5.0]]))
     assert radius == pytest.approx(4.0, abs=1e-4)  # (5 - (-3)) / 2
     assert center == pytest.approx([1.0], abs=1e-4)
+
+
+# --- Program assembly ----------------------------------------------------------
+
+
+def test_build_soc_program_matches_coo_reference():
+    """The directly written CSC matrix equals the straightforward COO assembly."""
+    rng = np.random.default_rng(0)
+    n, d = 7, 3
+    points = rng.standard_normal((n, d))
+    _, _, a_mat, b, cones = _build_soc_program(points)
+
+    rows = np.concatenate([np.arange(n) * (d + 1), (np.arange(n)[:, None] * (d + 1) + np.arange(1, d + 1)).ravel()])
+    cols = np.concatenate([np.zeros(n, dtype=int), np.tile(np.arange(1, d + 1), n)])
+    vals = np.concatenate([-np.ones(n), np.ones(n * d)])
+    expected = sp.csc_matrix((vals, (rows, cols)), shape=(n * (d + 1), d + 1))
+
+    assert a_mat.has_sorted_indices
+    assert (a_mat != expected).nnz == 0
+    assert b == pytest.approx(np.insert(points, 0, 0.0, axis=1).ravel())
+    assert len(cones) == n
+
+
+def test_clarabel_float32_and_strided_input():
+    """float32 and non-contiguous inputs give the same ball as a float64 copy."""
+    rng = np.random.default_rng(1)
+    wide = rng.standard_normal((40, 6))
+    strided = wide[:, ::2]  # non-contiguous view, shape (40, 3)
+    assert not strided.flags.c_contiguous
+
+    radius_ref, center_ref = min_circle_clarabel(np.ascontiguousarray(strided))
+    radius_strided, center_strided = min_circle_clarabel(strided)
+    radius_f32, center_f32 = min_circle_clarabel(strided.astype(np.float32))
+
+    assert radius_strided == pytest.approx(radius_ref, rel=1e-8)
+    assert center_strided == pytest.approx(center_ref, abs=1e-8)
+    assert radius_f32 == pytest.approx(radius_ref, rel=1e-5)
+    assert center_f32 == pytest.approx(center_ref, abs=1e-4)
+
+
+# --- Balls of balls ------------------------------------------------------------
+
+
+def _balls_cvx(centers: np.ndarray, radii: np.ndarray) -> Ball:
+    """Adapter so `min_ball_of_balls_cvx` matches the `min_ball_of_balls_clarabel` signature."""
+    return min_ball_of_balls_cvx(centers, radii, solver="CLARABEL")
+
+
+_both_ball_solvers = pytest.mark.parametrize(
+    "solver", [_balls_cvx, min_ball_of_balls_clarabel], ids=["cvx", "clarabel"]
+)
+
+
+@_both_ball_solvers
+def test_ball_of_two_balls_matches_closed_form(solver: Callable[[np.ndarray, np.ndarray], Ball]) -> None:
+    """For two balls the solve agrees with the closed-form merge."""
+    a, b = Ball(1.0, np.array([0.0, 0.0])), Ball(2.0, np.array([5.0, 1.0]))
+    expected = a.merge(b)
+    radius, center = solver(np.array([a.center, b.center]), np.array([a.radius, b.radius]))
+    assert radius == pytest.approx(expected.radius, abs=1e-5)
+    assert center == pytest.approx(expected.center, abs=1e-4)
+
+
+@_both_ball_solvers
+def test_zero_radii_reduce_to_points(solver: Callable[[np.ndarray, np.ndarray], Ball]) -> None:
+    """Balls of radius zero give the enclosing ball of their centres."""
+    points = np.random.default_rng(5).standard_normal((20, 3))
+    radius, center = solver(points, np.zeros(20))
+    radius_ref, center_ref = min_circle_clarabel(points)
+    assert radius == pytest.approx(radius_ref, rel=1e-5)
+    assert center == pytest.approx(center_ref, abs=1e-4)
+
+
+@_both_ball_solvers
+def test_ball_of_cluster_balls_encloses_clusters(solver: Callable[[np.ndarray, np.ndarray], Ball]) -> None:
+    """The ball of the cluster balls encloses every raw point and is no smaller than the exact ball."""
+    rng = np.random.default_rng(6)
+    clusters = [rng.standard_normal((40, 2)) * 0.3 + rng.uniform(-5, 5, size=2) for _ in range(6)]
+    summaries = [min_circle_clarabel(cluster) for cluster in clusters]
+    centers = np.array([ball.center for ball in summaries])
+    radii = np.array([ball.radius for ball in summaries])
+
+    merged = Ball(*solver(centers, radii))
+    everything = np.vstack(clusters)
+    assert merged.contains(everything, tol=1e-5).all()
+    assert merged.radius >= min_circle_clarabel(everything).radius - 1e-5
+
+
+@pytest.mark.parametrize(
+    ("radii", "message"), [(np.ones(3), "radii must have shape"), (np.array([1.0, -1.0]), "non-negative")]
+)
+def test_ball_of_balls_validates_radii(radii: np.ndarray, message: str) -> None:
+    """Radii must match the centres and be non-negative."""
+    centers = np.zeros((2, 2))
+    with pytest.raises(ValueError, match=message):
+        min_ball_of_balls_clarabel(centers, radii)
+    with pytest.raises(ValueError, match=message):
+        min_ball_of_balls_cvx(centers, radii)
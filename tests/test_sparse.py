@@ -0,0 +1,66 @@
+"""Tests for enclosing balls of sparse rows."""
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from cvxball import sparse
+from cvxball.coreset import min_circle_coreset
+from cvxball.sparse import min_circle_sparse
+
+
+def _tfidf(n: int, d: int, seed: int) -> sp.csr_array:
+    """Random non-negative rows of unit norm with about 50 non-zeros each."""
+    points = sp.random_array((n, d), density=50 / d, format="csr", rng=seed)
+    return sp.csr_array(points.multiply(1.0 / np.sqrt(points.multiply(points).sum(axis=1))[:, None]))
+
+
+@pytest.mark.parametrize("offset", [0.0, 100.0])
+def test_matches_dense_solver(offset):
+    """On dense data stored sparsely the radius and centre agree with the dense solver."""
+    dense = np.random.default_rng(0).standard_normal((500, 20)) + offset
+    ball = min_circle_sparse(sp.csr_array(dense))
+    reference, _ = min_circle_coreset(dense)
+    assert ball.radius == pytest.approx(reference.radius, rel=1e-6)
+    assert np.allclose(ball.center(dense).toarray()[0], reference.center, atol=1e-4)
+    assert (ball.weights > 0).all()
+    assert ball.weights.sum() == pytest.approx(1.0)
+    assert ball.support.size <= 21
+
+
+def test_high_dimensional_rows_stay_sparse():
+    """TF-IDF-like rows in a million dimensions: every row is enclosed and the centre stays sparse."""
+    points = _tfidf(3_000, 1_000_000, 1)
+    ball = min_circle_sparse(points, tol=1e-4)
+    distance = ball.distances(points, points)
+    assert distance.max() <= ball.radius
+    center = ball.center(points)
+    assert center.nnz <= 50 * ball.support.size
+    # Unit rows that barely overlap sit near the circumsphere of a simplex.
+    assert 0.99 < ball.radius < 1.0
+
+
+def test_gradient_path_matches_direct_path(monkeypatch):
+    """Large core sets solved by projected gradient agree with the direct solve."""
+    points = _tfidf(1_000, 100_000, 2)
+    direct = min_circle_sparse(points, tol=1e-6)
+    monkeypatch.setattr(sparse, "_DIRECT_ROWS", 4)
+    gradient = min_circle_sparse(points, tol=1e-6)
+    assert gradient.radius == pytest.approx(direct.radius, rel=2e-6)
+    assert gradient.distances(points, points).max() <= gradient.radius
+
+
+def test_dense_queries_and_zero_rows():
+    """Dense queries are measured like sparse ones, and all-zero rows give a zero ball."""
+    points = sp.csr_array(np.array([[2.0, 0.0], [0.0, 2.0], [0.0, 0.0]]))
+    ball = min_circle_sparse(points)
+    assert ball.distances(points, np.array([[1.0, 1.0], [3.0, 1.0]])) == pytest.approx([0.0, 2.0], abs=1e-6)
+    zero = min_circle_sparse(sp.csr_array((4, 10)))
+    assert zero.radius == 0.0
+
+
+@pytest.mark.parametrize("points", [sp.csr_array((0, 5)), np.zeros(3)])
+def test_invalid(points):
+    """Empty and one-dimensional input is rejected."""
+    with pytest.raises(ValueError, match="points"):
+        min_circle_sparse(points)
@@ -0,0 +1,114 @@
+"""Tests for the mergeable ε-kernel summaries."""
+
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from cvxball.coreset import min_circle_coreset
+from cvxball.summary import Summary, merge, summarize
+
+
+def _partition(seed: int, n: int = 5_000, d: int = 3) -> np.ndarray:
+    """The points held by node ``seed``: a shifted Gaussian blob."""
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((n, d)) + rng.uniform(-3, 3, d)
+
+
+def _node(seed: int) -> bytes:
+    """What a node sends: the serialised summary of its partition."""
+    return summarize(_partition(seed)).to_bytes()
+
+
+def _bracket(summary: Summary, points: np.ndarray, tol: float = 1e-6) -> None:
+    ball, lower = summary.solve(tol)
+    assert ball.contains(points).all()
+    # The core-set radius is within a factor 1 + 1e-6 above the optimum.
+    optimum = min_circle_coreset(points)[0].radius
+    assert lower <= optimum
+    assert optimum <= ball.radius * (1 + 1e-6)
+    assert ball.radius / lower - 1 <= (1 + summary.eps) * (1 + tol) * (1 + 1e-12) - 1
+
+
+def test_nodes_as_processes():
+    """Summaries built in worker processes merge into a ball enclosing every node's points."""
+    seeds = range(6)
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("fork")) as pool:
+        payloads = list(pool.map(_node, seeds))
+    total = functools.reduce(merge, map(Summary.from_bytes, payloads))
+    points = np.vstack([_partition(seed) for seed in seeds])
+    assert total.n_points == points.shape[0]
+    _bracket(total, points)
+    assert sum(len(payload) for payload in payloads) < points.nbytes // 20
+
+
+@pytest.mark.parametrize("eps", [1e-1, 1e-2, 1e-3])
+def test_spatial_partitions_keep_the_bound(eps):
+    """Strips of a square merge to a ball within ``1 + eps`` of the certified lower bound."""
+    points = np.random.default_rng(1).uniform(-1, 1, (20_000, 2))
+    strip = np.digitize(points[:, 0], [-0.5, 0.5])
+    total = merge(*(summarize(points[strip == i], eps) for i in range(3)))
+    _bracket(total, points, tol=1e-7)
+    ball, lower = total.solve(1e-7)
+    # Beyond eps, only the solve tolerance of 1e-7 separates the bounds.
+    assert ball.radius / lower - 1 <= eps + 2e-7
+
+
+def test_summary_size_does_not_grow_with_the_points():
+    """The kernel holds at most one point per direction, however many points are summarised."""
+    rng = np.random.default_rng(3)
+    small = summarize(rng.standard_normal((1_000, 3)))
+    large = summarize(rng.standard_normal((200_000, 3)))
+    assert large.kernel.shape[0] <= 2 * small.kernel.shape[0]
+    assert len(large.to_bytes()) < 30_000
+
+
+def test_merge_is_associative_and_commutative():
+    """Every grouping and order of merges gives the identical summary."""
+    a, b, c = (summarize(_partition(seed, n=2_000)) for seed in range(3))
+    reference = merge(merge(a, b), c).to_bytes()
+    assert merge(a, merge(b, c)).to_bytes() == reference
+    assert merge(c, merge(a, b)).to_bytes() == reference
+    assert merge(b, a, c).to_bytes() == reference
+    assert a.merge(b).merge(c).to_bytes() == reference
+
+
+def test_round_trip():
+    """Serialisation preserves the kernel bit for bit, eps and the count."""
+    summary = summarize(_partition(0, n=1_000), eps=3e-3)
+    restored = Summary.from_bytes(summary.to_bytes())
+    np.testing.assert_array_equal(restored.kernel, summary.kernel)
+    assert restored.eps == 3e-3
+    assert restored.n_points == 1_000
+
+
+def test_single_summary_is_near_optimal():
+    """A summary of all the points certifies the optimum within eps."""
+    points = _partition(2)
+    ball, lower = summarize(points, eps=1e-3).solve()
+    assert ball.radius <= lower * (1 + 1e-3) * (1 + 1e-5)
+
+
+def test_invalid():
+    """Malformed bytes and inputs are rejected."""
+    data = summarize(_partition(0, n=100)).to_bytes()
+    with pytest.raises(ValueError, match="too short"):
+        Summary.from_bytes(data[:10])
+    with pytest.raises(ValueError, match="version"):
+        Summary.from_bytes(b"XXXX" + data[4:])
+    with pytest.raises(ValueError, match="length"):
+        Summary.from_bytes(data[:-8])
+    with pytest.raises(ValueError, match="non-empty"):
+        summarize(np.empty((0, 2)))
+    with pytest.raises(ValueError, match="eps must"):
+        summarize(_partition(0, n=10), eps=0.0)
+    with pytest.raises(ValueError, match="too many directions"):
+        summarize(np.zeros((1, 8)), eps=1e-3)
+    with pytest.raises(ValueError, match="at least one"):
+        merge()
+    with pytest.raises(ValueError, match="dimension"):
+        merge(summarize(np.zeros((1, 2))), summarize(np.zeros((1, 3))))
+    with pytest.raises(ValueError, match="same eps"):
+        merge(summarize(np.zeros((1, 2))), summarize(np.zeros((1, 2)), eps=0.1))
@@ -0,0 +1,110 @@
+"""Tests for the sphere-tree builder and its batch queries."""
+
+import numpy as np
+import pytest
+
+from cvxball.solver import min_circle_clarabel
+from cvxball.tree import SphereTree
+
+
+@pytest.fixture(scope="module")
+def points() -> np.ndarray:
+    """A clustered 3-D point cloud."""
+    rng = np.random.default_rng(0)
+    return np.vstack([rng.standard_normal((700, 3)) * 0.2 + rng.uniform(-4, 4, size=3) for _ in range(5)])
+
+
+@pytest.fixture(scope="module")
+def tree(points) -> SphereTree:
+    """A sphere tree over ``points``."""
+    return SphereTree(points, leaf_size=8)
+
+
+def _leaf_hits(tree: SphereTree, centers: np.ndarray, radii: np.ndarray | float) -> np.ndarray:
+    """Brute force: whether every query meets every ball on each leaf's root path, shape (q, leaves)."""
+    radii = np.broadcast_to(radii, centers.shape[:1])
+    meets = np.linalg.norm(centers[:, None, :] - tree.centers[None, :, :], axis=2) <= tree.radii + radii[:, None]
+    parent = np.full(len(tree), -1)
+    internal = np.flatnonzero(tree.children >= 0)
+    parent[tree.children[internal]] = parent[tree.children[internal] + 1] = internal
+    hits = meets[:, tree.leaves]
+    ancestors = parent[tree.leaves]
+    while (ancestors >= 0).any():
+        hits &= np.where(ancestors >= 0, meets[:, ancestors], True)
+        ancestors = np.where(ancestors >= 0, parent[ancestors], -1)
+    return hits
+
+
+def test_structure(tree, points):
+    """``order`` is a permutation, leaves are small and children split their parent's range."""
+    assert np.array_equal(np.sort(tree.order), np.arange(points.shape[0]))
+    leaves = tree.leaves
+    assert np.all(tree.stop[leaves] - tree.start[leaves] <= 8)
+    assert (tree.stop[leaves] - tree.start[leaves]).sum() == points.shape[0]
+    internal = np.flatnonzero(tree.children >= 0)
+    left = tree.children[internal]
+    assert np.array_equal(tree.start[left], tree.start[internal])
+    assert np.array_equal(tree.stop[left], tree.start[left + 1])
+    assert np.array_equal(tree.stop[left + 1], tree.stop[internal])
+    assert np.all(tree.depth[left] == tree.depth[internal] + 1)
+
+
+def test_every_node_ball_encloses_its_points(tree, points):
+    """Each node's ball contains all points in its range."""
+    for node in range(len(tree)):
+        members = points[tree.order[tree.start[node] : tree.stop[node]]]
+        distances = np.linalg.norm(members - tree.centers[node], axis=1)
+        assert distances.max() <= tree.radii[node] * (1 + 1e-12) + 1e-12
+
+
+def test_node_balls_are_minimal(tree, points):
+    """Every node's ball is the smallest enclosing ball of its points, up to the solver tolerances."""
+    exact = min_circle_clarabel(points)
+    assert tree.ball.radius >= exact.radius - 1e-6
+    assert tree.ball.radius <= exact.radius * (1 + 1e-6)
+    for node in np.flatnonzero(tree.depth == 3):
+        members = points[tree.order[tree.start[node] : tree.stop[node]]]
+        assert tree.radii[node] <= min_circle_clarabel(members).radius * (1 + 1e-6)
+
+
+def test_far_from_the_origin():
+    """Balls pad for rounding at the scale of the coordinates, so offset data stays enclosed."""
+    points = np.random.default_rng(3).standard_normal((2_000, 3)) + 1e8
+    tree = SphereTree(points, leaf_size=8)
+    assert tree.contains(points).all()
+    for node in range(len(tree)):
+        members = points[tree.order[tree.start[node] : tree.stop[node]]]
+        assert np.linalg.norm(members - tree.centers[node], axis=1).max() <= tree.radii[node]
+
+
+def test_contains(tree, points):
+    """Data points are inside the tree; far-away points are not; matches brute force."""
+    assert tree.contains(points).all()
+    queries = np.random.default_rng(1).uniform(-8, 8, size=(2000, 3))
+    expected = _leaf_hits(tree, queries, 0.0).any(axis=1)
+    np.testing.assert_array_equal(tree.contains(queries), expected)
+    assert not tree.contains(np.full((1, 3), 100.0)).any()
+
+
+def test_overlaps_and_pairs(tree):
+    """Ball-overlap queries and broad-phase pairs agree with brute force."""
+    rng = np.random.default_rng(2)
+    centers = rng.uniform(-8, 8, size=(500, 3))
+    radii = rng.uniform(0.0, 1.0, size=500)
+    overlap = _leaf_hits(tree, centers, radii)
+
+    np.testing.assert_array_equal(tree.overlaps(centers, radii), overlap.any(axis=1))
+    query, leaf = tree.overlap_pairs(centers, radii)
+    expected = {(q, tree.leaves[j]) for q, j in zip(*np.nonzero(overlap), strict=True)}
+    assert set(zip(query.tolist(), leaf.tolist(), strict=True)) == expected
+
+
+def test_single_point_and_validation():
+    """A single point gives one leaf of radius zero, up to rounding; bad inputs are rejected."""
+    tree = SphereTree(np.array([[1.0, 2.0]]))
+    assert len(tree) == 1
+    assert tree.ball.radius == pytest.approx(0.0, abs=1e-13)
+    with pytest.raises(ValueError, match="non-empty"):
+        SphereTree(np.empty((0, 2)))
+    with pytest.raises(ValueError, match="leaf_size"):
+        SphereTree(np.zeros((3, 2)), leaf_size=0)